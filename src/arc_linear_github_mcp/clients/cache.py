@@ -0,0 +1,220 @@
+"""In-memory response cache for API clients."""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with its HTTP validators."""
+
+    data: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    links: dict[str, dict[str, str]] = field(default_factory=dict)
+    expires_at: float = 0.0
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without contacting the server."""
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the headers used to revalidate a stale entry."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """LRU cache of responses with a per-entry time to live.
+
+    Stale entries are kept (until evicted) so they can be revalidated with
+    conditional requests instead of being downloaded again.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 60.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Seconds an entry stays fresh after being stored or revalidated
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        """Get an entry, fresh or stale.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached entry if present, None otherwise
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        key: Hashable,
+        data: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        links: dict[str, dict[str, str]] | None = None,
+    ) -> CachedResponse:
+        """Store a response.
+
+        Args:
+            key: Cache key
+            data: Parsed response body
+            etag: Value of the ETag response header
+            last_modified: Value of the Last-Modified response header
+            links: Parsed Link response header
+
+        Returns:
+            The stored entry
+        """
+        entry = CachedResponse(
+            data=data,
+            etag=etag,
+            last_modified=last_modified,
+            links=links or {},
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def refresh(self, entry: CachedResponse) -> None:
+        """Mark an entry as fresh again after a successful revalidation."""
+        entry.expires_at = time.monotonic() + self.ttl
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AsyncTTLCache:
+    """LRU cache of coroutine results with a time to live.
+
+    Concurrent lookups of a missing key share a single call (single-flight)
+    instead of each starting their own. Failed calls and ``None`` results
+    are not cached, so a lookup that found nothing is retried next time.
+    """
+
+    def __init__(self, maxsize: int = 64, ttl: float = 300.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Seconds a result is reused after its call started
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, asyncio.Future[Any]]] = OrderedDict()
+
+    async def get_or_call(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Get the cached result for a key, calling ``call`` to produce it if needed.
+
+        Args:
+            key: Cache key
+            call: Zero-argument coroutine function producing the value
+
+        Returns:
+            The cached or freshly produced value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            self._entries.move_to_end(key)
+            future = entry[1]
+        else:
+            future = asyncio.ensure_future(call())
+            self._store(key, future)
+            future.add_done_callback(functools.partial(self._discard_miss, key))
+        # Shield so a cancelled caller doesn't cancel the call others are awaiting
+        return await asyncio.shield(future)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store an already known value, replacing any existing entry.
+
+        Must be called from a running event loop.
+
+        Args:
+            key: Cache key
+            value: Value to return for the key until it expires
+        """
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._store(key, future)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove an entry if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def _store(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        """Insert an entry as most recently used, evicting the oldest if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, future)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _discard_miss(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        """Drop an entry whose call failed or returned None, so the next lookup retries it."""
+        if future.cancelled() or future.exception() is not None or future.result() is None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is future:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cached_method(
+    cache_attr: str,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Cache an async method's results in an ``AsyncTTLCache`` on its instance.
+
+    Args:
+        cache_attr: Name of the instance attribute holding the cache
+
+    Returns:
+        Decorator keying results by method name and call arguments
+    """
+
+    def decorator(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(method)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+            cache: AsyncTTLCache = getattr(self, cache_attr)
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            return await cache.get_or_call(key, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
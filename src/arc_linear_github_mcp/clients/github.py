@@ -1,11 +1,161 @@
 """GitHub REST API client."""
 
+import asyncio
+import random
+import string
+import time
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from itertools import chain
 from typing import Any
 
 import httpx
+import orjson
+from pydantic import TypeAdapter
 
+from arc_linear_github_mcp.clients.cache import ResponseCache
 from arc_linear_github_mcp.config.settings import Settings
-from arc_linear_github_mcp.models.github import Branch, Commit, PullRequest, Repository
+from arc_linear_github_mcp.models.github import (
+    _BRANCH_LIST_ADAPTER,
+    Branch,
+    BranchRef,
+    Commit,
+    GitUser,
+    PullRequest,
+    Repository,
+)
+
+# Sized so concurrent page fan-out multiplexes over one HTTP/2 connection
+# instead of queueing behind a small HTTP/1.1 pool.
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=100,
+    keepalive_expiry=30,
+)
+_CONNECT_RETRIES = 2
+
+# Retry policy for rate-limited, 5xx and dropped-connection responses
+_MAX_RETRIES = 3
+_MAX_RETRY_DELAY = 60.0
+_BACKOFF_BASE = 0.5
+
+# Methods that are safe to resend after a 5xx or dropped connection. POST and
+# PATCH may already have been applied, so they only retry rate-limit rejections.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Query values that need no percent-encoding
+_URL_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "-._~")
+
+# Page size used when streaming items; the maximum GitHub allows
+_STREAM_PAGE_SIZE = 100
+
+# Validate whole list responses in one pydantic-core pass; the branch list
+# adapter is shared with models.github
+_COMMIT_LIST_ADAPTER = TypeAdapter(list[Commit])
+_PR_LIST_ADAPTER = TypeAdapter(list[PullRequest])
+
+# Headers sent with every REST and GraphQL request, besides Authorization
+_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+
+# GraphQL pull request states for each REST ``state`` filter; "all" has no filter
+_PR_GRAPHQL_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+}
+
+# Pull requests with the detail fields the REST list endpoint omits
+_PR_QUERY = """
+query PullRequests(
+    $owner: String!
+    $name: String!
+    $first: Int!
+    $states: [PullRequestState!]
+) {
+    repository(owner: $owner, name: $name) {
+        pullRequests(
+            first: $first
+            states: $states
+            orderBy: { field: CREATED_AT, direction: DESC }
+        ) {
+            nodes {
+                databaseId
+                number
+                title
+                body
+                state
+                url
+                isDraft
+                merged
+                mergeable
+                createdAt
+                updatedAt
+                mergedAt
+                headRefName
+                headRefOid
+                headRepository { url }
+                baseRefName
+                baseRefOid
+                baseRepository { url }
+                author {
+                    login
+                    avatarUrl
+                    url
+                    ... on User { databaseId }
+                    ... on Bot { databaseId }
+                }
+            }
+        }
+    }
+}
+"""
+
+
+def _fast_url(path: str, params: dict[str, Any]) -> str | None:
+    """Append simple query parameters to a path without httpx's generic encoder.
+
+    Args:
+        path: API path
+        params: Query parameters
+
+    Returns:
+        The path with its query string, or None if a value needs encoding
+    """
+    parts = []
+    for key, value in params.items():
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        elif isinstance(value, int):
+            value = str(value)
+        elif not isinstance(value, str) or not _URL_SAFE_CHARS.issuperset(value):
+            return None
+        parts.append(f"{key}={value}")
+    return f"{path}?{'&'.join(parts)}"
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header given as seconds or as an HTTP-date.
+
+    Args:
+        value: The header value
+
+    Returns:
+        Seconds to wait, or None if the value can't be parsed
+    """
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(retry_at.timestamp() - time.time(), 0.0)
 
 
 class GitHubClientError(Exception):
@@ -16,17 +166,96 @@ class GitHubClientError(Exception):
         self.status_code = status_code
 
 
+class GitHubNotFoundError(GitHubClientError):
+    """Exception raised when a GitHub resource does not exist (404)."""
+
+
+class GitHubValidationError(GitHubClientError):
+    """Exception raised when GitHub rejects a request as invalid (422)."""
+
+
+class GitHubBranchExistsError(GitHubValidationError):
+    """Exception raised when creating a branch whose name is already taken."""
+
+
+def _not_found_error(_response: httpx.Response, path: str) -> GitHubClientError:
+    return GitHubNotFoundError(f"Not found: {path}", status_code=404)
+
+
+def _validation_error(response: httpx.Response, _path: str) -> GitHubClientError:
+    error_data = orjson.loads(response.content)
+    message = error_data.get("message", "Validation failed")
+    errors = error_data.get("errors", [])
+    if errors:
+        message += f": {errors}"
+    return GitHubValidationError(message, status_code=422)
+
+
+def _api_error(response: httpx.Response, _path: str) -> GitHubClientError:
+    return GitHubClientError(
+        f"GitHub API error: {response.status_code} - {response.text}",
+        status_code=response.status_code,
+    )
+
+
+# Builders for error responses, keyed by status code. Each one reads only as
+# much of the body as its message needs; anything unlisted uses _api_error.
+_ERROR_BUILDERS = {
+    404: _not_found_error,
+    422: _validation_error,
+}
+
+
+def _decode(response: httpx.Response, parse: Callable[[bytes], Any] | None) -> Any:
+    """Decode a response body.
+
+    Args:
+        response: Successful response
+        parse: Converts the raw JSON body into the returned value; when omitted
+            the body is decoded with orjson (and a 204 yields an empty dict)
+
+    Returns:
+        The decoded body
+    """
+    if parse is not None:
+        return parse(response.content)
+    return {} if response.status_code == 204 else orjson.loads(response.content)
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp from a GitHub response, if present."""
+    return datetime.fromisoformat(value) if value else None
+
+
 class GitHubClient:
     """Async client for GitHub REST API."""
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
         """Initialize GitHub client.
 
         Args:
             settings: Application settings containing API token
+            transport: HTTP transport to send requests through. Defaults to an
+                HTTP/2 connection pool; any ``httpx.AsyncBaseTransport`` (for
+                example one backed by another HTTP library) can be swapped in
+                without touching the request pipeline.
         """
         self.settings = settings
+        self._transport = transport
         self._client: httpx.AsyncClient | None = None
+        self._cache = ResponseCache(
+            maxsize=settings.github_cache_size,
+            ttl=settings.github_cache_ttl,
+        )
+        self._default_branch_cache: dict[tuple[str, str], str] = {}
+        self._owner_name_cache: dict[str, tuple[str, str]] = {}
+        self._repo_path_cache: dict[str, str] = {}
+        self._semaphore = asyncio.Semaphore(settings.github_max_concurrency)
+        self._rate_limit_reset = 0.0
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
@@ -34,11 +263,16 @@ class GitHubClient:
             self._client = httpx.AsyncClient(
                 base_url=self.settings.github_api_url,
                 headers={
+                    **_API_HEADERS,
                     "Authorization": f"Bearer {self.settings.github_token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
                 },
                 timeout=self.settings.request_timeout,
+                transport=self._transport
+                or httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=_CONNECTION_LIMITS,
+                    retries=_CONNECT_RETRIES,
+                ),
             )
         return self._client
 
@@ -48,7 +282,9 @@ class GitHubClient:
         path: str,
         json: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
-    ) -> dict | list:
+        revalidate: bool = False,
+        parse: Callable[[bytes], Any] | None = None,
+    ) -> Any:
         """Make an HTTP request to GitHub API.
 
         Args:
@@ -56,6 +292,8 @@ class GitHubClient:
             path: API path
             json: Request body
             params: Query parameters
+            revalidate: Revalidate a cached GET even if it is still fresh
+            parse: Converts the raw JSON body into the returned value
 
         Returns:
             Response data
@@ -63,31 +301,316 @@ class GitHubClient:
         Raises:
             GitHubClientError: If the request fails
         """
-        client = await self._get_client()
-        try:
-            response = await client.request(method, path, json=json, params=params)
-
-            if response.status_code == 404:
-                raise GitHubClientError(f"Not found: {path}", status_code=404)
-            if response.status_code == 422:
-                error_data = response.json()
-                message = error_data.get("message", "Validation failed")
-                errors = error_data.get("errors", [])
-                if errors:
-                    message += f": {errors}"
-                raise GitHubClientError(message, status_code=422)
-            if response.status_code >= 400:
-                raise GitHubClientError(
-                    f"GitHub API error: {response.status_code} - {response.text}",
-                    status_code=response.status_code,
+        data, _ = await self._fetch(
+            method, path, json=json, params=params, revalidate=revalidate, parse=parse
+        )
+        return data
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        revalidate: bool = False,
+        parse: Callable[[bytes], Any] | None = None,
+    ) -> tuple[Any, dict[str, dict[str, str]]]:
+        """Make an HTTP request and return the body along with its Link header.
+
+        GET responses are cached for ``github_cache_ttl`` seconds. Once an entry
+        goes stale it is revalidated with ``If-None-Match``/``If-Modified-Since``,
+        so an unchanged resource comes back as a bodiless 304. Any other method
+        clears the cache, since it may have changed what a GET would return.
+
+        Polled endpoints pass ``revalidate=True`` to skip the freshness window:
+        every call then reaches GitHub and sees changes immediately, but an
+        unchanged resource still costs only a 304, which GitHub does not count
+        against the rate limit.
+
+        When ``parse`` is given, it receives the raw body bytes (so models can be
+        validated straight from JSON by pydantic-core) and its result is what
+        gets cached, so cache hits and 304s hand back the already-validated
+        models without re-parsing. Response models are frozen, which makes
+        sharing them safe.
+
+        Args:
+            method: HTTP method
+            path: API path
+            json: Request body
+            params: Query parameters
+            revalidate: Revalidate a cached GET even if it is still fresh
+            parse: Converts the raw JSON body into the returned value
+
+        Returns:
+            Tuple of (response data, parsed Link header)
+
+        Raises:
+            GitHubClientError: If the request fails
+        """
+        if method != "GET":
+            response = await self._send(method, path, json=json, params=params)
+            self._cache.clear()
+            return _decode(response, parse), response.links
+
+        key = (path, frozenset((params or {}).items()), parse)
+        cached = self._cache.get(key)
+        if cached is not None and cached.is_fresh and not revalidate:
+            return cached.data, cached.links
+
+        headers = cached.conditional_headers() if cached is not None else None
+        response = await self._send(method, path, params=params, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            self._cache.refresh(cached)
+            return cached.data, cached.links
+
+        data = _decode(response, parse)
+        self._cache.set(
+            key,
+            data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            links=response.links,
+        )
+        return data, response.links
+
+    async def _request_all_pages(
+        self,
+        path: str,
+        params: dict[str, Any],
+        revalidate: bool = False,
+        parse: Callable[[bytes], list] | None = None,
+    ) -> list:
+        """Fetch every page of a paginated list endpoint.
+
+        The first page's ``Link: rel="last"`` header gives the page count, and
+        the remaining pages are then requested concurrently.
+
+        Args:
+            path: API path
+            params: Query parameters (``page`` is managed here)
+            revalidate: Revalidate cached pages even if they are still fresh
+            parse: Converts each page's raw JSON body into a list of items
+
+        Returns:
+            Items from all pages, in order
+        """
+        first_page, links = await self._fetch(
+            "GET", path, params={**params, "page": 1}, revalidate=revalidate, parse=parse
+        )
+        last_url = links.get("last", {}).get("url")
+        if not last_url:
+            return list(first_page)
+
+        last_page = int(httpx.URL(last_url).params.get("page", 1))
+        other_pages = await asyncio.gather(
+            *(
+                self._request(
+                    "GET",
+                    path,
+                    params={**params, "page": page},
+                    revalidate=revalidate,
+                    parse=parse,
                 )
+                for page in range(2, last_page + 1)
+            )
+        )
+        return list(chain(first_page, *other_pages))
+
+    async def _iter_pages(self, path: str, params: dict[str, Any]) -> AsyncIterator[list]:
+        """Yield the pages of a list endpoint one at a time.
+
+        Stops after the first short page, so callers that break out early
+        never request the pages they don't need.
+
+        Args:
+            path: API path
+            params: Query parameters (``per_page`` and ``page`` are managed here)
 
-            if response.status_code == 204:
-                return {}
+        Yields:
+            Raw items of each page
+        """
+        page = 1
+        while True:
+            data = await self._request(
+                "GET",
+                path,
+                params={**params, "per_page": _STREAM_PAGE_SIZE, "page": page},
+            )
+            if data:
+                yield data
+            if len(data) < _STREAM_PAGE_SIZE:
+                return
+            page += 1
 
-            return response.json()
-        except httpx.HTTPError as e:
-            raise GitHubClientError(f"HTTP error: {e}") from e
+    async def _graphql(self, query: str, variables: dict[str, Any] | None = None) -> dict:
+        """Execute a query against the GitHub GraphQL API.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            The ``data`` member of the response
+
+        Raises:
+            GitHubClientError: If the request fails or returns GraphQL errors
+        """
+        response = await self._send(
+            "POST",
+            self._graphql_url(),
+            json={"query": query, "variables": variables or {}},
+        )
+        payload = orjson.loads(response.content)
+        if payload.get("errors"):
+            messages = "; ".join(error.get("message", "") for error in payload["errors"])
+            raise GitHubClientError(f"GitHub GraphQL error: {messages}")
+        return payload["data"]
+
+    def _graphql_url(self) -> str:
+        """Get the GraphQL endpoint matching the configured REST endpoint."""
+        api_url = self.settings.github_api_url.rstrip("/")
+        # GitHub Enterprise serves REST at /api/v3 and GraphQL at /api/graphql
+        if api_url.endswith("/api/v3"):
+            return f"{api_url[: -len('/v3')]}/graphql"
+        return f"{api_url}/graphql"
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send a request and raise on error responses.
+
+        Args:
+            method: HTTP method
+            path: API path
+            json: Request body
+            params: Query parameters
+            headers: Extra request headers
+
+        Returns:
+            The successful (or 304 Not Modified) response
+
+        Raises:
+            GitHubClientError: If the request fails
+        """
+        client = await self._get_client()
+        content = None
+        if json is not None:
+            content = orjson.dumps(json)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        url = path
+        if params:
+            fast_url = _fast_url(path, params)
+            if fast_url is not None:
+                url, params = fast_url, None
+
+        retry_transient = method in _IDEMPOTENT_METHODS
+        async with self._semaphore:
+            for attempt in range(_MAX_RETRIES + 1):
+                await self._wait_for_rate_limit_reset()
+                try:
+                    response = await client.request(
+                        method, url, content=content, params=params, headers=headers
+                    )
+                except httpx.RemoteProtocolError as e:
+                    if not retry_transient or attempt == _MAX_RETRIES:
+                        raise GitHubClientError(f"HTTP error: {e}") from e
+                    await asyncio.sleep(self._backoff_delay(attempt))
+                    continue
+                except httpx.HTTPError as e:
+                    raise GitHubClientError(f"HTTP error: {e}") from e
+
+                self._track_rate_limit(response)
+                delay = self._retry_delay(response, attempt, retry_transient)
+                if delay is None or attempt == _MAX_RETRIES:
+                    break
+                await asyncio.sleep(delay)
+
+        if response.status_code < 400:
+            return response
+        raise _ERROR_BUILDERS.get(response.status_code, _api_error)(response, path)
+
+    def _retry_delay(
+        self, response: httpx.Response, attempt: int, retry_transient: bool
+    ) -> float | None:
+        """Work out how long to wait before retrying a response.
+
+        Args:
+            response: The response received
+            attempt: Zero-based attempt number
+            retry_transient: Whether 5xx responses may be retried
+
+        Returns:
+            Seconds to wait, or None if the response should not be retried
+        """
+        status = response.status_code
+        if status >= 500:
+            return self._backoff_delay(attempt) if retry_transient else None
+        if status not in (403, 429):
+            return None
+
+        # Secondary rate limits send Retry-After; primary ones exhaust the quota
+        delay: float | None = None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            delay = _parse_retry_after(retry_after)
+            if delay is None:
+                delay = self._backoff_delay(attempt)
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = response.headers.get("X-RateLimit-Reset")
+            if reset is not None:
+                delay = max(float(reset) - time.time(), 0.0)
+
+        if delay is None or delay > _MAX_RETRY_DELAY:
+            return None
+        return delay
+
+    def _track_rate_limit(self, response: httpx.Response) -> None:
+        """Remember when the primary rate limit resets once it is exhausted."""
+        if response.headers.get("X-RateLimit-Remaining") != "0":
+            return
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset is not None:
+            self._rate_limit_reset = float(reset)
+
+    async def _wait_for_rate_limit_reset(self) -> None:
+        """Hold the next request until an exhausted rate limit resets.
+
+        Waits longer than the retry cap are skipped so the request fails fast
+        with GitHub's own 403 instead of blocking the tool call.
+        """
+        delay = self._rate_limit_reset - time.time()
+        if 0 < delay <= _MAX_RETRY_DELAY:
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with jitter for transient failures."""
+        return _BACKOFF_BASE * 2**attempt + random.uniform(0, _BACKOFF_BASE)
+
+    def _split(self, repo: str) -> tuple[str, str]:
+        """Resolve a repository name to its owner and name.
+
+        Args:
+            repo: Repository name, optionally prefixed with 'owner/'
+
+        Returns:
+            Tuple of (owner, name), with the configured org as default owner
+        """
+        owner_name = self._owner_name_cache.get(repo)
+        if owner_name is None:
+            if "/" in repo:
+                owner, name = repo.split("/", 1)
+                owner_name = (owner, name)
+            else:
+                owner_name = (self.settings.github_org, repo)
+            self._owner_name_cache[repo] = owner_name
+        return owner_name
 
     def _repo_path(self, repo: str) -> str:
         """Get the full repository path.
@@ -96,11 +619,14 @@ class GitHubClient:
             repo: Repository name (will be prefixed with org if needed)
 
         Returns:
-            Full path like 'orgs/arclabs-studio/repos/FavRes' or 'repos/owner/repo'
+            Full path like '/repos/arclabs-studio/FavRes'
         """
-        if "/" in repo:
-            return f"/repos/{repo}"
-        return f"/repos/{self.settings.github_org}/{repo}"
+        path = self._repo_path_cache.get(repo)
+        if path is None:
+            owner, name = self._split(repo)
+            path = f"/repos/{owner}/{name}"
+            self._repo_path_cache[repo] = path
+        return path
 
     async def get_repository(self, repo: str) -> Repository:
         """Get repository information.
@@ -112,32 +638,80 @@ class GitHubClient:
             Repository information
         """
         path = self._repo_path(repo)
-        data = await self._request("GET", path)
-        return Repository(**data)
+        return await self._request("GET", path, parse=Repository.model_validate_json)
+
+    async def get_repositories(self, repos: list[str]) -> list[Repository]:
+        """Get information for several repositories concurrently.
 
-    async def list_branches(self, repo: str, per_page: int = 100) -> list[Branch]:
+        Args:
+            repos: Repository names
+
+        Returns:
+            Repository information, in the same order as ``repos``
+        """
+        return list(await asyncio.gather(*(self.get_repository(repo) for repo in repos)))
+
+    async def list_branches(
+        self,
+        repo: str,
+        per_page: int = 100,
+        all_pages: bool = False,
+    ) -> list[Branch]:
         """List branches in a repository.
 
+        The result is always revalidated with GitHub, so repeated polling sees
+        new branches immediately while an unchanged list costs only a 304.
+
         Args:
             repo: Repository name
             per_page: Number of branches per page
+            all_pages: Fetch every page instead of only the first
 
         Returns:
             List of branches
         """
         path = f"{self._repo_path(repo)}/branches"
-        data = await self._request("GET", path, params={"per_page": per_page})
-
-        branches = []
-        for item in data:
-            branches.append(
-                Branch(
-                    name=item["name"],
-                    sha=item["commit"]["sha"] if "commit" in item else None,
-                    protected=item.get("protected", False),
-                )
-            )
-        return branches
+        params = {"per_page": per_page}
+        parse = _BRANCH_LIST_ADAPTER.validate_json
+        if all_pages:
+            return await self._request_all_pages(path, params, revalidate=True, parse=parse)
+        # Copy so callers can't mutate the cached list
+        return list(await self._request("GET", path, params=params, revalidate=True, parse=parse))
+
+    async def list_branches_bulk(
+        self,
+        repos: list[str],
+        per_page: int = 100,
+        all_pages: bool = False,
+    ) -> dict[str, list[Branch]]:
+        """List branches in several repositories concurrently.
+
+        Args:
+            repos: Repository names
+            per_page: Number of branches per page
+            all_pages: Fetch every page instead of only the first
+
+        Returns:
+            Branches keyed by repository name
+        """
+        results = await asyncio.gather(
+            *(self.list_branches(repo, per_page=per_page, all_pages=all_pages) for repo in repos)
+        )
+        return dict(zip(repos, results, strict=True))
+
+    async def iter_branches(self, repo: str) -> AsyncIterator[Branch]:
+        """Stream branches in a repository page by page.
+
+        Args:
+            repo: Repository name
+
+        Yields:
+            Branches, one page held in memory at a time
+        """
+        path = f"{self._repo_path(repo)}/branches"
+        async for page in self._iter_pages(path, {}):
+            for branch in _BRANCH_LIST_ADAPTER.validate_python(page):
+                yield branch
 
     async def get_branch(self, repo: str, branch: str) -> Branch | None:
         """Get a specific branch.
@@ -151,16 +725,9 @@ class GitHubClient:
         """
         try:
             path = f"{self._repo_path(repo)}/branches/{branch}"
-            data = await self._request("GET", path)
-            return Branch(
-                name=data["name"],
-                sha=data["commit"]["sha"] if "commit" in data else None,
-                protected=data.get("protected", False),
-            )
-        except GitHubClientError as e:
-            if e.status_code == 404:
-                return None
-            raise
+            return await self._request("GET", path, parse=Branch.model_validate_json)
+        except GitHubNotFoundError:
+            return None
 
     async def create_branch(
         self,
@@ -179,29 +746,44 @@ class GitHubClient:
             Created branch
 
         Raises:
+            GitHubBranchExistsError: If a branch with that name already exists
             GitHubClientError: If creation fails
         """
-        # Get the base branch SHA
+        repo_path = self._repo_path(repo)
         if base_branch is None:
-            repository = await self.get_repository(repo)
-            base_branch = repository.default_branch
+            base_branch = await self.get_default_branch(repo)
 
-        base = await self.get_branch(repo, base_branch)
-        if not base:
-            raise GitHubClientError(f"Base branch '{base_branch}' not found")
+        # Resolve the base SHA straight from the ref instead of the branch payload.
+        # Always revalidate it, so a recent push to the base isn't missed.
+        try:
+            data = await self._request(
+                "GET", f"{repo_path}/git/ref/heads/{base_branch}", revalidate=True
+            )
+        except GitHubNotFoundError as e:
+            raise GitHubClientError(f"Base branch '{base_branch}' not found") from e
+        base_sha = data["object"]["sha"]
 
-        # Create the reference
-        path = f"{self._repo_path(repo)}/git/refs"
-        data = await self._request(
-            "POST",
-            path,
-            json={
-                "ref": f"refs/heads/{branch_name}",
-                "sha": base.sha,
-            },
-        )
+        # Create the reference. GitHub refuses an existing name with a 422, so
+        # there's no need to check for the branch first.
+        path = f"{repo_path}/git/refs"
+        try:
+            data = await self._request(
+                "POST",
+                path,
+                json={
+                    "ref": f"refs/heads/{branch_name}",
+                    "sha": base_sha,
+                },
+            )
+        except GitHubValidationError as e:
+            if "already exists" in str(e):
+                raise GitHubBranchExistsError(
+                    f"Branch '{branch_name}' already exists", status_code=422
+                ) from e
+            raise
 
-        return Branch(
+        # Every field is set from values already in hand, so skip validation
+        return Branch.model_construct(
             name=branch_name,
             sha=data.get("object", {}).get("sha"),
             protected=False,
@@ -221,42 +803,124 @@ class GitHubClient:
             path = f"{self._repo_path(repo)}/git/refs/heads/{branch_name}"
             await self._request("DELETE", path)
             return True
-        except GitHubClientError as e:
-            if e.status_code == 404:
-                return False
-            raise
+        except GitHubNotFoundError:
+            return False
 
     async def list_pull_requests(
         self,
         repo: str,
         state: str = "open",
         per_page: int = 30,
+        all_pages: bool = False,
     ) -> list[PullRequest]:
         """List pull requests in a repository.
 
+        The result is always revalidated with GitHub, so repeated polling sees
+        new pull requests immediately while an unchanged list costs only a 304.
+
         Args:
             repo: Repository name
             state: PR state ('open', 'closed', 'all')
             per_page: Number of PRs per page
+            all_pages: Fetch every page instead of only the first
 
         Returns:
             List of pull requests
         """
         path = f"{self._repo_path(repo)}/pulls"
-        data = await self._request(
-            "GET",
-            path,
-            params={"state": state, "per_page": per_page},
+        params = {"state": state, "per_page": per_page}
+        parse = _PR_LIST_ADAPTER.validate_json
+        if all_pages:
+            return await self._request_all_pages(path, params, revalidate=True, parse=parse)
+        # Copy so callers can't mutate the cached list
+        return list(await self._request("GET", path, params=params, revalidate=True, parse=parse))
+
+    async def list_pull_requests_bulk(
+        self,
+        repos: list[str],
+        state: str = "open",
+        per_page: int = 30,
+        all_pages: bool = False,
+    ) -> dict[str, list[PullRequest]]:
+        """List pull requests in several repositories concurrently.
+
+        Args:
+            repos: Repository names
+            state: PR state ('open', 'closed', 'all')
+            per_page: Number of PRs per page
+            all_pages: Fetch every page instead of only the first
+
+        Returns:
+            Pull requests keyed by repository name
+        """
+        results = await asyncio.gather(
+            *(
+                self.list_pull_requests(repo, state=state, per_page=per_page, all_pages=all_pages)
+                for repo in repos
+            )
+        )
+        return dict(zip(repos, results, strict=True))
+
+    async def iter_pull_requests(
+        self,
+        repo: str,
+        state: str = "open",
+    ) -> AsyncIterator[PullRequest]:
+        """Stream pull requests in a repository page by page.
+
+        Args:
+            repo: Repository name
+            state: PR state ('open', 'closed', 'all')
+
+        Yields:
+            Pull requests, one page held in memory at a time
+        """
+        path = f"{self._repo_path(repo)}/pulls"
+        async for page in self._iter_pages(path, {"state": state}):
+            for pr in _PR_LIST_ADAPTER.validate_python(page):
+                yield pr
+
+    async def list_pull_requests_graphql(
+        self,
+        repo: str,
+        state: str = "open",
+        per_page: int = 30,
+    ) -> list[PullRequest]:
+        """List pull requests with a single GraphQL query.
+
+        Unlike the REST list endpoint this includes detail fields such as
+        ``merged`` and ``mergeable``, so no per-PR follow-up requests are needed.
+
+        Args:
+            repo: Repository name
+            state: PR state ('open', 'closed', 'all')
+            per_page: Number of PRs to fetch (max 100)
+
+        Returns:
+            List of pull requests, newest first
+        """
+        owner, name = self._split(repo)
+        data = await self._graphql(
+            _PR_QUERY,
+            {
+                "owner": owner,
+                "name": name,
+                "first": per_page,
+                "states": _PR_GRAPHQL_STATES.get(state),
+            },
         )
+        if not data.get("repository"):
+            raise GitHubNotFoundError(f"Not found: {owner}/{name}", status_code=404)
 
-        prs = []
-        for item in data:
-            prs.append(self._parse_pr(item))
-        return prs
+        nodes = data["repository"]["pullRequests"]["nodes"]
+        return [self._parse_pr_graphql(node) for node in nodes]
 
     async def get_pull_request(self, repo: str, pr_number: int) -> PullRequest | None:
         """Get a specific pull request.
 
+        The result is always revalidated with GitHub, so a pull request that was
+        just merged or updated isn't served stale from the cache.
+
         Args:
             repo: Repository name
             pr_number: PR number
@@ -266,12 +930,11 @@ class GitHubClient:
         """
         try:
             path = f"{self._repo_path(repo)}/pulls/{pr_number}"
-            data = await self._request("GET", path)
-            return self._parse_pr(data)
-        except GitHubClientError as e:
-            if e.status_code == 404:
-                return None
-            raise
+            return await self._request(
+                "GET", path, revalidate=True, parse=PullRequest.model_validate_json
+            )
+        except GitHubNotFoundError:
+            return None
 
     async def create_pull_request(
         self,
@@ -299,8 +962,7 @@ class GitHubClient:
             GitHubClientError: If creation fails
         """
         if base is None:
-            repository = await self.get_repository(repo)
-            base = repository.default_branch
+            base = await self.get_default_branch(repo)
 
         path = f"{self._repo_path(repo)}/pulls"
         request_body: dict[str, Any] = {
@@ -312,8 +974,9 @@ class GitHubClient:
         if body:
             request_body["body"] = body
 
-        data = await self._request("POST", path, json=request_body)
-        return self._parse_pr(data)
+        return await self._request(
+            "POST", path, json=request_body, parse=PullRequest.model_validate_json
+        )
 
     async def update_pull_request(
         self,
@@ -345,26 +1008,36 @@ class GitHubClient:
         if state is not None:
             request_body["state"] = state
 
-        data = await self._request("PATCH", path, json=request_body)
-        return self._parse_pr(data)
+        return await self._request(
+            "PATCH", path, json=request_body, parse=PullRequest.model_validate_json
+        )
 
     async def get_default_branch(self, repo: str) -> str:
         """Get the default branch for a repository.
 
+        The result is remembered for the lifetime of the client, since a
+        repository's default branch almost never changes.
+
         Args:
             repo: Repository name
 
         Returns:
             Default branch name
         """
-        repository = await self.get_repository(repo)
-        return repository.default_branch
+        key = self._split(repo)
+        default_branch = self._default_branch_cache.get(key)
+        if default_branch is None:
+            repository = await self.get_repository(repo)
+            default_branch = repository.default_branch
+            self._default_branch_cache[key] = default_branch
+        return default_branch
 
     async def list_commits(
         self,
         repo: str,
         branch: str | None = None,
         per_page: int = 30,
+        all_pages: bool = False,
     ) -> list[Commit]:
         """List commits in a repository.
 
@@ -372,6 +1045,7 @@ class GitHubClient:
             repo: Repository name
             branch: Branch name (defaults to default branch)
             per_page: Number of commits per page
+            all_pages: Fetch every page instead of only the first
 
         Returns:
             List of commits
@@ -381,59 +1055,82 @@ class GitHubClient:
         if branch:
             params["sha"] = branch
 
-        data = await self._request("GET", path, params=params)
+        parse = _COMMIT_LIST_ADAPTER.validate_json
+        if all_pages:
+            return await self._request_all_pages(path, params, parse=parse)
+        # Copy so callers can't mutate the cached list
+        return list(await self._request("GET", path, params=params, parse=parse))
 
-        commits = []
-        for item in data:
-            commits.append(
-                Commit(
-                    sha=item["sha"],
-                    message=item["commit"]["message"],
-                    html_url=item.get("html_url"),
-                )
-            )
-        return commits
+    async def iter_commits(
+        self,
+        repo: str,
+        branch: str | None = None,
+    ) -> AsyncIterator[Commit]:
+        """Stream commits in a repository page by page.
+
+        Args:
+            repo: Repository name
+            branch: Branch name (defaults to default branch)
 
-    def _parse_pr(self, data: dict) -> PullRequest:
-        """Parse pull request data from API response."""
-        from arc_linear_github_mcp.models.github import BranchRef, GitUser
+        Yields:
+            Commits, newest first, one page held in memory at a time
+        """
+        path = f"{self._repo_path(repo)}/commits"
+        params = {"sha": branch} if branch else {}
+        async for page in self._iter_pages(path, params):
+            for commit in _COMMIT_LIST_ADAPTER.validate_python(page):
+                yield commit
 
-        head = BranchRef(
-            ref=data["head"]["ref"],
-            sha=data["head"]["sha"],
-            url=data["head"].get("repo", {}).get("html_url") if data["head"].get("repo") else None,
+    def _parse_pr_graphql(self, node: dict) -> PullRequest:
+        """Parse a pull request node from a GraphQL response.
+
+        The node's shape is fixed by ``_PR_QUERY``, so every field is picked
+        and converted here and the models are built with ``model_construct``
+        instead of being validated again.
+        """
+        head_repo = node.get("headRepository")
+        base_repo = node.get("baseRepository")
+        head = BranchRef.model_construct(
+            ref=node["headRefName"],
+            sha=node["headRefOid"],
+            url=head_repo["url"] if head_repo else None,
         )
-        base = BranchRef(
-            ref=data["base"]["ref"],
-            sha=data["base"]["sha"],
-            url=data["base"].get("repo", {}).get("html_url") if data["base"].get("repo") else None,
+        base = BranchRef.model_construct(
+            ref=node["baseRefName"],
+            sha=node["baseRefOid"],
+            url=base_repo["url"] if base_repo else None,
         )
 
         user = None
-        if data.get("user"):
-            user = GitUser(
-                login=data["user"]["login"],
-                id=data["user"]["id"],
-                avatar_url=data["user"].get("avatar_url"),
-                html_url=data["user"].get("html_url"),
+        author = node.get("author")
+        if author and author.get("databaseId") is not None:
+            user = GitUser.model_construct(
+                login=author["login"],
+                id=author["databaseId"],
+                avatar_url=author.get("avatarUrl"),
+                html_url=author.get("url"),
             )
 
-        return PullRequest(
-            id=data["id"],
-            number=data["number"],
-            title=data["title"],
-            body=data.get("body"),
-            state=data["state"],
-            html_url=data["html_url"],
+        # REST reports merged PRs as "closed" and mergeability as a tri-state bool
+        state = node["state"].lower()
+        mergeable = {"MERGEABLE": True, "CONFLICTING": False}.get(node.get("mergeable"))
+
+        return PullRequest.model_construct(
+            id=node["databaseId"],
+            number=node["number"],
+            title=node["title"],
+            body=node.get("body"),
+            state="closed" if state == "merged" else state,
+            html_url=node["url"],
             head=head,
             base=base,
             user=user,
-            draft=data.get("draft", False),
-            merged=data.get("merged", False),
-            mergeable=data.get("mergeable"),
-            created_at=data.get("created_at"),
-            updated_at=data.get("updated_at"),
-            merged_at=data.get("merged_at"),
+            draft=node.get("isDraft", False),
+            merged=node.get("merged", False),
+            mergeable=mergeable,
+            created_at=_parse_datetime(node.get("createdAt")),
+            updated_at=_parse_datetime(node.get("updatedAt")),
+            merged_at=_parse_datetime(node.get("mergedAt")),
         )
 
     async def close(self) -> None:
@@ -441,3 +1138,35 @@ class GitHubClient:
         if self._client:
             await self._client.aclose()
             self._client = None
+        self._cache.clear()
+
+
+_shared_client: GitHubClient | None = None
+
+
+def get_github_client(settings: Settings) -> GitHubClient:
+    """Get the process-wide GitHub client.
+
+    Sharing one client keeps its connection pool, response cache and rate-limit
+    state alive across tool calls instead of paying a new TLS handshake each time.
+    Creation never awaits, so no lock is needed to make it race-free.
+
+    Args:
+        settings: Settings to build the client from on first use; the server
+            resolves them once at startup and passes the same instance in
+
+    Returns:
+        The shared GitHubClient
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = GitHubClient(settings)
+    return _shared_client
+
+
+async def close_github_client() -> None:
+    """Close the process-wide GitHub client, if it was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
@@ -1,24 +1,351 @@
 """Linear GraphQL API client."""
 
+import asyncio
+from datetime import datetime
 from typing import Any
 
 import httpx
-from gql import Client, gql
+import orjson
+from gql import Client, GraphQLRequest, gql
+from gql.client import AsyncClientSession
+from gql.transport import AsyncTransport
 from gql.transport.httpx import HTTPXAsyncTransport
+from pydantic import TypeAdapter
 
+from arc_linear_github_mcp.clients.cache import AsyncTTLCache, cached_method
 from arc_linear_github_mcp.config.settings import Settings
+from arc_linear_github_mcp.config.standards import ISSUE_ID_RE
 from arc_linear_github_mcp.models.linear import (
     CreateIssueRequest,
     Issue,
+    IssueConnection,
     IssueState,
     Label,
+    Priority,
     Project,
     Team,
+    TeamContext,
     UpdateIssueRequest,
     User,
     WorkflowState,
 )
 
+# Keep a small pool of connections to Linear open between calls. With HTTP/2,
+# concurrent queries are multiplexed over one of them instead of each opening
+# its own connection and TLS handshake.
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=20,
+    keepalive_expiry=30,
+)
+
+# Validate whole connection node lists in one pydantic-core pass. Cached
+# results are shared between callers, so they are built as tuples.
+_TEAM_LIST_ADAPTER = TypeAdapter(tuple[Team, ...])
+_WORKFLOW_STATE_LIST_ADAPTER = TypeAdapter(tuple[WorkflowState, ...])
+_LABEL_LIST_ADAPTER = TypeAdapter(tuple[Label, ...])
+_USER_LIST_ADAPTER = TypeAdapter(tuple[User, ...])
+
+# Largest page Linear serves for a connection query
+_ISSUES_PAGE_SIZE = 250
+
+# Issues looked up by identifier are reused briefly, e.g. between a lookup
+# and the update that follows it
+_ISSUE_CACHE_SIZE = 256
+_ISSUE_CACHE_TTL = 60.0
+
+# Workspace metadata (viewer, teams, states, labels, users) entries kept per
+# client, including per-team and per-state-name lookups
+_METADATA_CACHE_SIZE = 256
+
+# Authenticated user
+_VIEWER_QUERY = gql(
+    """
+    query Viewer {
+        viewer {
+            id
+            name
+            email
+            displayName
+        }
+    }
+    """
+)
+
+# All teams visible to the API key
+_TEAMS_QUERY = gql(
+    """
+    query Teams {
+        teams {
+            nodes {
+                id
+                name
+                key
+            }
+        }
+    }
+    """
+)
+
+# Team with a given key, matched case-insensitively
+_TEAM_BY_KEY_QUERY = gql(
+    """
+    query TeamByKey($key: String!) {
+        teams(filter: { key: { eqIgnoreCase: $key } }, first: 1) {
+            nodes {
+                id
+                name
+                key
+            }
+        }
+    }
+    """
+)
+
+# A team with its workflow states and labels, in one round trip
+_TEAM_CONTEXT_QUERY = gql(
+    """
+    query TeamContext($key: String!) {
+        team: teams(filter: { key: { eqIgnoreCase: $key } }, first: 1) {
+            nodes {
+                id
+                name
+                key
+            }
+        }
+        states: workflowStates(filter: { team: { key: { eqIgnoreCase: $key } } }) {
+            nodes {
+                id
+                name
+                type
+                color
+            }
+        }
+        labels: issueLabels(filter: { team: { key: { eqIgnoreCase: $key } } }) {
+            nodes {
+                id
+                name
+                color
+            }
+        }
+    }
+    """
+)
+
+# Workflow states of one team
+_WORKFLOW_STATES_QUERY = gql(
+    """
+    query WorkflowStates($teamId: String!) {
+        workflowStates(filter: { team: { id: { eq: $teamId } } }) {
+            nodes {
+                id
+                name
+                type
+                color
+            }
+        }
+    }
+    """
+)
+
+# Workflow state of one team with a given name, matched case-insensitively
+_STATE_BY_NAME_QUERY = gql(
+    """
+    query WorkflowStateByName($teamId: String!, $name: String!) {
+        workflowStates(
+            filter: { team: { id: { eq: $teamId } }, name: { eqIgnoreCase: $name } }
+            first: 1
+        ) {
+            nodes {
+                id
+                name
+                type
+                color
+            }
+        }
+    }
+    """
+)
+
+# Issue fields selected by every query and mutation that returns issues
+_ISSUE_FIELDS_FRAGMENT = """
+    fragment IssueFields on Issue {
+        id
+        identifier
+        title
+        description
+        priority
+        priorityLabel
+        url
+        createdAt
+        updatedAt
+        state {
+            id
+            name
+            type
+            color
+        }
+        assignee {
+            id
+            name
+            email
+        }
+        labels {
+            nodes {
+                id
+                name
+                color
+            }
+        }
+    }
+"""
+
+# Issues matching an IssueFilter. The filter always names the team, so the
+# team isn't selected again for every node.
+_ISSUES_QUERY = gql(
+    _ISSUE_FIELDS_FRAGMENT
+    + """
+    query Issues($first: Int!, $after: String, $filter: IssueFilter!) {
+        issues(first: $first, after: $after, filter: $filter) {
+            nodes {
+                ...IssueFields
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+    """
+)
+
+# One issue by ID or identifier
+_ISSUE_QUERY = gql(
+    _ISSUE_FIELDS_FRAGMENT
+    + """
+    query Issue($id: String!) {
+        issue(id: $id) {
+            ...IssueFields
+            team {
+                id
+                name
+                key
+            }
+        }
+    }
+    """
+)
+
+# First issue matching an IssueFilter. The team is selected even though the
+# filter names its key, since callers need its ID to look up workflow states.
+_ISSUE_BY_IDENTIFIER_QUERY = gql(
+    _ISSUE_FIELDS_FRAGMENT
+    + """
+    query IssueByIdentifier($filter: IssueFilter!) {
+        issues(filter: $filter, first: 1) {
+            nodes {
+                ...IssueFields
+                team {
+                    id
+                    name
+                    key
+                }
+            }
+        }
+    }
+    """
+)
+
+# Create an issue
+_CREATE_ISSUE_MUTATION = gql(
+    _ISSUE_FIELDS_FRAGMENT
+    + """
+    mutation CreateIssue($input: IssueCreateInput!) {
+        issueCreate(input: $input) {
+            success
+            issue {
+                ...IssueFields
+                team {
+                    id
+                    name
+                    key
+                }
+            }
+        }
+    }
+    """
+)
+
+# Update an issue
+_UPDATE_ISSUE_MUTATION = gql(
+    _ISSUE_FIELDS_FRAGMENT
+    + """
+    mutation UpdateIssue($id: String!, $input: IssueUpdateInput!) {
+        issueUpdate(id: $id, input: $input) {
+            success
+            issue {
+                ...IssueFields
+                team {
+                    id
+                    name
+                    key
+                }
+            }
+        }
+    }
+    """
+)
+
+# Labels of one team
+_LABELS_QUERY = gql(
+    """
+    query Labels($teamId: String!) {
+        issueLabels(filter: { team: { id: { eq: $teamId } } }) {
+            nodes {
+                id
+                name
+                color
+            }
+        }
+    }
+    """
+)
+
+# All users in the workspace
+_USERS_QUERY = gql(
+    """
+    query Users {
+        users {
+            nodes {
+                id
+                name
+                email
+                displayName
+            }
+        }
+    }
+    """
+)
+
+# First user whose name or email matches, ignoring case
+_USER_BY_NAME_OR_EMAIL_QUERY = gql(
+    """
+    query UserByNameOrEmail($value: String!) {
+        users(
+            filter: { or: [{ name: { eqIgnoreCase: $value } }, { email: { eqIgnoreCase: $value } }] }
+            first: 1
+        ) {
+            nodes {
+                id
+                name
+                email
+                displayName
+            }
+        }
+    }
+    """
+)
+
 
 class LinearClientError(Exception):
     """Exception raised for Linear API errors."""
@@ -28,40 +355,100 @@ class LinearClientError(Exception):
         self.errors = errors or []
 
 
+def _issue_from_node(node: dict[str, Any]) -> Issue:
+    """Build an Issue from an API node without running validation.
+
+    The node comes straight from the ``IssueFields`` fragment, so its shape is
+    already known. Every field is read once and converted inline, and the
+    node itself is never copied or re-keyed.
+
+    Args:
+        node: Issue node from a Linear query result
+
+    Returns:
+        The issue
+    """
+    state = node.get("state")
+    assignee = node.get("assignee")
+    team = node.get("team")
+    labels = node.get("labels")
+    created_at = node.get("createdAt")
+    updated_at = node.get("updatedAt")
+    return Issue.model_construct(
+        id=node["id"],
+        identifier=node["identifier"],
+        title=node["title"],
+        description=node.get("description"),
+        priority=node.get("priority", Priority.NORMAL.value),
+        priority_label=node.get("priorityLabel"),
+        state=IssueState.model_construct(**state) if state else None,
+        assignee=User.model_construct(**assignee) if assignee else None,
+        creator=None,
+        labels=[Label.model_construct(**label) for label in labels["nodes"]] if labels else [],
+        project=None,
+        team=Team.model_construct(**team) if team else None,
+        url=node.get("url"),
+        created_at=datetime.fromisoformat(created_at) if created_at else None,
+        updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+    )
+
+
 class LinearClient:
     """Async client for Linear GraphQL API."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, transport: AsyncTransport | None = None):
         """Initialize Linear client.
 
         Args:
             settings: Application settings containing API key
+            transport: gql transport to send queries through. Defaults to an
+                HTTPX transport for ``linear_api_url``.
         """
         self.settings = settings
+        self._transport = transport
         self._client: Client | None = None
-
-    async def _get_client(self) -> Client:
-        """Get or create the GraphQL client."""
-        if self._client is None:
-            transport = HTTPXAsyncTransport(
-                url=self.settings.linear_api_url,
-                headers={
-                    "Authorization": self.settings.linear_api_key,
-                    "Content-Type": "application/json",
-                },
-                timeout=self.settings.request_timeout,
-            )
-            self._client = Client(
-                transport=transport,
-                fetch_schema_from_transport=False,
-            )
-        return self._client
-
-    async def _execute(self, query: str, variables: dict[str, Any] | None = None) -> dict:
+        self._session: AsyncClientSession | None = None
+        self._session_lock = asyncio.Lock()
+        self._metadata_cache = AsyncTTLCache(
+            maxsize=_METADATA_CACHE_SIZE,
+            ttl=settings.linear_cache_ttl,
+        )
+        self._issue_cache = AsyncTTLCache(maxsize=_ISSUE_CACHE_SIZE, ttl=_ISSUE_CACHE_TTL)
+
+    async def _get_session(self) -> AsyncClientSession:
+        """Get the GraphQL session, connecting it on first use.
+
+        The session stays open until ``close()``, so its connection pool and
+        keep-alive connections are reused across queries. Response bodies are
+        decoded with orjson, as in the GitHub client.
+        """
+        if self._session is None:
+            async with self._session_lock:
+                if self._session is None:
+                    transport = self._transport or HTTPXAsyncTransport(
+                        url=self.settings.linear_api_url,
+                        headers=self.settings.linear_headers,
+                        timeout=self.settings.request_timeout,
+                        http2=True,
+                        limits=_CONNECTION_LIMITS,
+                        json_deserialize=orjson.loads,
+                    )
+                    self._client = Client(
+                        transport=transport,
+                        fetch_schema_from_transport=False,
+                    )
+                    self._session = await self._client.connect_async()
+        return self._session
+
+    async def _execute(
+        self,
+        query: GraphQLRequest,
+        variables: dict[str, Any] | None = None,
+    ) -> dict:
         """Execute a GraphQL query.
 
         Args:
-            query: GraphQL query string
+            query: Parsed GraphQL document, built once with ``gql()``
             variables: Query variables
 
         Returns:
@@ -70,53 +457,33 @@ class LinearClient:
         Raises:
             LinearClientError: If the query fails
         """
-        client = await self._get_client()
         try:
-            async with client as session:
-                result = await session.execute(gql(query), variable_values=variables)
-                return result
+            session = await self._get_session()
+            return await session.execute(GraphQLRequest(query, variable_values=variables))
         except Exception as e:
             raise LinearClientError(f"Linear API error: {e}") from e
 
+    @cached_method("_metadata_cache")
     async def get_viewer(self) -> User:
         """Get the authenticated user.
 
         Returns:
             The authenticated user
         """
-        query = """
-            query Viewer {
-                viewer {
-                    id
-                    name
-                    email
-                    displayName
-                }
-            }
-        """
-        result = await self._execute(query)
+        result = await self._execute(_VIEWER_QUERY)
         return User(**result["viewer"])
 
-    async def list_teams(self) -> list[Team]:
+    @cached_method("_metadata_cache")
+    async def list_teams(self) -> tuple[Team, ...]:
         """List all teams the user has access to.
 
         Returns:
-            List of teams
-        """
-        query = """
-            query Teams {
-                teams {
-                    nodes {
-                        id
-                        name
-                        key
-                    }
-                }
-            }
+            Tuple of teams, shared with other callers
         """
-        result = await self._execute(query)
-        return [Team(**team) for team in result["teams"]["nodes"]]
+        result = await self._execute(_TEAMS_QUERY)
+        return _TEAM_LIST_ADAPTER.validate_python(result["teams"]["nodes"])
 
+    @cached_method("_metadata_cache")
     async def get_team_by_key(self, key: str) -> Team | None:
         """Get a team by its key (e.g., 'FAVRES').
 
@@ -126,36 +493,44 @@ class LinearClient:
         Returns:
             Team if found, None otherwise
         """
-        teams = await self.list_teams()
-        for team in teams:
-            if team.key.upper() == key.upper():
-                return team
-        return None
+        result = await self._execute(_TEAM_BY_KEY_QUERY, {"key": key})
+        nodes = result["teams"]["nodes"]
+        return Team(**nodes[0]) if nodes else None
+
+    @cached_method("_metadata_cache")
+    async def get_team_context(self, key: str) -> TeamContext | None:
+        """Get a team with its workflow states and labels in a single request.
+
+        Args:
+            key: Team key
 
-    async def list_workflow_states(self, team_id: str) -> list[WorkflowState]:
+        Returns:
+            TeamContext if the team exists, None otherwise
+        """
+        result = await self._execute(_TEAM_CONTEXT_QUERY, {"key": key})
+        teams = result["team"]["nodes"]
+        if not teams:
+            return None
+        return TeamContext(
+            team=teams[0],
+            states=result["states"]["nodes"],
+            labels=result["labels"]["nodes"],
+        )
+
+    @cached_method("_metadata_cache")
+    async def list_workflow_states(self, team_id: str) -> tuple[WorkflowState, ...]:
         """List workflow states for a team.
 
         Args:
             team_id: Linear team ID
 
         Returns:
-            List of workflow states
+            Tuple of workflow states, shared with other callers
         """
-        query = """
-            query WorkflowStates($teamId: String!) {
-                workflowStates(filter: { team: { id: { eq: $teamId } } }) {
-                    nodes {
-                        id
-                        name
-                        type
-                        color
-                    }
-                }
-            }
-        """
-        result = await self._execute(query, {"teamId": team_id})
-        return [WorkflowState(**state) for state in result["workflowStates"]["nodes"]]
+        result = await self._execute(_WORKFLOW_STATES_QUERY, {"teamId": team_id})
+        return _WORKFLOW_STATE_LIST_ADAPTER.validate_python(result["workflowStates"]["nodes"])
 
+    @cached_method("_metadata_cache")
     async def get_state_by_name(self, team_id: str, state_name: str) -> WorkflowState | None:
         """Get a workflow state by name.
 
@@ -166,11 +541,9 @@ class LinearClient:
         Returns:
             WorkflowState if found, None otherwise
         """
-        states = await self.list_workflow_states(team_id)
-        for state in states:
-            if state.name.lower() == state_name.lower():
-                return state
-        return None
+        result = await self._execute(_STATE_BY_NAME_QUERY, {"teamId": team_id, "name": state_name})
+        nodes = result["workflowStates"]["nodes"]
+        return WorkflowState(**nodes[0]) if nodes else None
 
     async def list_issues(
         self,
@@ -180,6 +553,12 @@ class LinearClient:
     ) -> list[Issue]:
         """List issues for a team/project.
 
+        Linear pages are cursor-based, so pages are fetched one after another
+        until ``first`` issues have been collected. The request for the next
+        page is sent before the current page's nodes are converted, so
+        building issues overlaps with the network round trip. The team is not
+        selected again for every issue, so ``Issue.team`` is left unset.
+
         Args:
             team_key: Team key (e.g., 'FAVRES')
             state: Optional state filter (e.g., 'In Progress')
@@ -188,56 +567,36 @@ class LinearClient:
         Returns:
             List of issues
         """
-        # Build filter
-        filter_parts = [f'team: {{ key: {{ eq: "{team_key}" }} }}']
+        issue_filter: dict[str, Any] = {"team": {"key": {"eq": team_key}}}
         if state:
-            filter_parts.append(f'state: {{ name: {{ eq: "{state}" }} }}')
-
-        filter_str = ", ".join(filter_parts)
-
-        query = f"""
-            query Issues($first: Int!) {{
-                issues(first: $first, filter: {{ {filter_str} }}) {{
-                    nodes {{
-                        id
-                        identifier
-                        title
-                        description
-                        priority
-                        priorityLabel
-                        url
-                        createdAt
-                        updatedAt
-                        state {{
-                            id
-                            name
-                            type
-                            color
-                        }}
-                        assignee {{
-                            id
-                            name
-                            email
-                        }}
-                        labels {{
-                            nodes {{
-                                id
-                                name
-                                color
-                            }}
-                        }}
-                    }}
-                }}
-            }}
-        """
-        result = await self._execute(query, {"first": first})
-
-        issues = []
-        for node in result["issues"]["nodes"]:
-            # Flatten labels
-            if "labels" in node and "nodes" in node["labels"]:
-                node["labels"] = node["labels"]["nodes"]
-            issues.append(Issue(**node))
+            issue_filter["state"] = {"name": {"eq": state}}
+
+        async def fetch_page(size: int, after: str | None) -> IssueConnection:
+            variables: dict[str, Any] = {"first": size, "filter": issue_filter}
+            if after:
+                variables["after"] = after
+            result = await self._execute(_ISSUES_QUERY, variables)
+            return result["issues"]
+
+        issues: list[Issue] = []
+        pending: asyncio.Future[IssueConnection] | None = asyncio.ensure_future(
+            fetch_page(min(first, _ISSUES_PAGE_SIZE), None)
+        )
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                nodes = page["nodes"]
+                remaining = first - len(issues) - len(nodes)
+                page_info = page.get("pageInfo")
+                if remaining > 0 and page_info and page_info["hasNextPage"]:
+                    pending = asyncio.ensure_future(
+                        fetch_page(min(remaining, _ISSUES_PAGE_SIZE), page_info["endCursor"])
+                    )
+                issues.extend(_issue_from_node(node) for node in nodes)
+        finally:
+            if pending is not None:
+                pending.cancel()
 
         return issues
 
@@ -250,51 +609,10 @@ class LinearClient:
         Returns:
             Issue if found, None otherwise
         """
-        query = """
-            query Issue($id: String!) {
-                issue(id: $id) {
-                    id
-                    identifier
-                    title
-                    description
-                    priority
-                    priorityLabel
-                    url
-                    createdAt
-                    updatedAt
-                    state {
-                        id
-                        name
-                        type
-                        color
-                    }
-                    assignee {
-                        id
-                        name
-                        email
-                    }
-                    labels {
-                        nodes {
-                            id
-                            name
-                            color
-                        }
-                    }
-                    team {
-                        id
-                        name
-                        key
-                    }
-                }
-            }
-        """
         try:
-            result = await self._execute(query, {"id": issue_id})
+            result = await self._execute(_ISSUE_QUERY, {"id": issue_id})
             if result.get("issue"):
-                node = result["issue"]
-                if "labels" in node and "nodes" in node["labels"]:
-                    node["labels"] = node["labels"]["nodes"]
-                return Issue(**node)
+                return self._remember_issue(_issue_from_node(result["issue"]))
             return None
         except LinearClientError:
             return None
@@ -302,75 +620,62 @@ class LinearClient:
     async def search_issue_by_identifier(self, identifier: str) -> Issue | None:
         """Search for an issue by its identifier (e.g., 'FAVRES-123').
 
+        Issues fetched, created or updated through this client in the last
+        minute are returned without another query.
+
         Args:
             identifier: Issue identifier
 
         Returns:
             Issue if found, None otherwise
         """
-        query = """
-            query IssueByIdentifier($filter: IssueFilter!) {
-                issues(filter: $filter, first: 1) {
-                    nodes {
-                        id
-                        identifier
-                        title
-                        description
-                        priority
-                        priorityLabel
-                        url
-                        createdAt
-                        updatedAt
-                        state {
-                            id
-                            name
-                            type
-                            color
-                        }
-                        assignee {
-                            id
-                            name
-                            email
-                        }
-                        labels {
-                            nodes {
-                                id
-                                name
-                                color
-                            }
-                        }
-                        team {
-                            id
-                            name
-                            key
-                        }
-                    }
+        match = ISSUE_ID_RE.fullmatch(identifier)
+        if match is None:
+            return None
+
+        issue = await self._issue_cache.get_or_call(
+            identifier,
+            lambda: self._fetch_issue_by_identifier(match[1], int(match[2])),
+        )
+        if issue is None:
+            # Don't remember misses; the issue may be created right after
+            self._issue_cache.discard(identifier)
+        return issue
+
+    async def _fetch_issue_by_identifier(self, team_key: str, number: int) -> Issue | None:
+        """Query Linear for an issue by team key and number.
+
+        Args:
+            team_key: Team key (e.g., 'FAVRES')
+            number: Issue number within the team
+
+        Returns:
+            Issue if found, None otherwise
+        """
+        result = await self._execute(
+            _ISSUE_BY_IDENTIFIER_QUERY,
+            {
+                "filter": {
+                    "team": {"key": {"eq": team_key}},
+                    "number": {"eq": number},
                 }
-            }
+            },
+        )
+
+        nodes = result["issues"]["nodes"]
+        return _issue_from_node(nodes[0]) if nodes else None
+
+    def _remember_issue(self, issue: Issue) -> Issue:
+        """Cache an issue under its identifier.
+
+        Args:
+            issue: Issue returned by Linear
+
+        Returns:
+            The same issue
         """
-        # Parse identifier to get team key and number
-        if "-" in identifier:
-            parts = identifier.split("-")
-            team_key = parts[0]
-            number = int(parts[1])
-
-            result = await self._execute(
-                query,
-                {
-                    "filter": {
-                        "team": {"key": {"eq": team_key}},
-                        "number": {"eq": number},
-                    }
-                },
-            )
-
-            if result["issues"]["nodes"]:
-                node = result["issues"]["nodes"][0]
-                if "labels" in node and "nodes" in node["labels"]:
-                    node["labels"] = node["labels"]["nodes"]
-                return Issue(**node)
-
-        return None
+        self._issue_cache.set(issue.identifier, issue)
+        return issue
 
     async def create_issue(self, request: CreateIssueRequest) -> Issue:
         """Create a new issue.
@@ -384,35 +689,6 @@ class LinearClient:
         Raises:
             LinearClientError: If creation fails
         """
-        mutation = """
-            mutation CreateIssue($input: IssueCreateInput!) {
-                issueCreate(input: $input) {
-                    success
-                    issue {
-                        id
-                        identifier
-                        title
-                        description
-                        priority
-                        priorityLabel
-                        url
-                        createdAt
-                        updatedAt
-                        state {
-                            id
-                            name
-                            type
-                            color
-                        }
-                        team {
-                            id
-                            name
-                            key
-                        }
-                    }
-                }
-            }
-        """
         input_data: dict[str, Any] = {
             "title": request.title,
             "teamId": request.team_id,
@@ -430,12 +706,12 @@ class LinearClient:
         if request.label_ids:
             input_data["labelIds"] = request.label_ids
 
-        result = await self._execute(mutation, {"input": input_data})
+        result = await self._execute(_CREATE_ISSUE_MUTATION, {"input": input_data})
 
         if not result["issueCreate"]["success"]:
             raise LinearClientError("Failed to create issue")
 
-        return Issue(**result["issueCreate"]["issue"])
+        return self._remember_issue(_issue_from_node(result["issueCreate"]["issue"]))
 
     async def update_issue(self, issue_id: str, request: UpdateIssueRequest) -> Issue:
         """Update an existing issue.
@@ -450,42 +726,6 @@ class LinearClient:
         Raises:
             LinearClientError: If update fails
         """
-        mutation = """
-            mutation UpdateIssue($id: String!, $input: IssueUpdateInput!) {
-                issueUpdate(id: $id, input: $input) {
-                    success
-                    issue {
-                        id
-                        identifier
-                        title
-                        description
-                        priority
-                        priorityLabel
-                        url
-                        createdAt
-                        updatedAt
-                        state {
-                            id
-                            name
-                            type
-                            color
-                        }
-                        assignee {
-                            id
-                            name
-                            email
-                        }
-                        labels {
-                            nodes {
-                                id
-                                name
-                                color
-                            }
-                        }
-                    }
-                }
-            }
-        """
         input_data: dict[str, Any] = {}
 
         if request.title is not None:
@@ -501,61 +741,96 @@ class LinearClient:
         if request.label_ids is not None:
             input_data["labelIds"] = request.label_ids
 
-        result = await self._execute(mutation, {"id": issue_id, "input": input_data})
+        result = await self._execute(_UPDATE_ISSUE_MUTATION, {"id": issue_id, "input": input_data})
 
         if not result["issueUpdate"]["success"]:
             raise LinearClientError("Failed to update issue")
 
-        node = result["issueUpdate"]["issue"]
-        if "labels" in node and "nodes" in node["labels"]:
-            node["labels"] = node["labels"]["nodes"]
-
-        return Issue(**node)
+        return self._remember_issue(_issue_from_node(result["issueUpdate"]["issue"]))
 
-    async def list_labels(self, team_id: str) -> list[Label]:
+    @cached_method("_metadata_cache")
+    async def list_labels(self, team_id: str) -> tuple[Label, ...]:
         """List labels for a team.
 
         Args:
             team_id: Linear team ID
 
         Returns:
-            List of labels
+            Tuple of labels, shared with other callers
         """
-        query = """
-            query Labels($teamId: String!) {
-                issueLabels(filter: { team: { id: { eq: $teamId } } }) {
-                    nodes {
-                        id
-                        name
-                        color
-                    }
-                }
-            }
-        """
-        result = await self._execute(query, {"teamId": team_id})
-        return [Label(**label) for label in result["issueLabels"]["nodes"]]
+        result = await self._execute(_LABELS_QUERY, {"teamId": team_id})
+        return _LABEL_LIST_ADAPTER.validate_python(result["issueLabels"]["nodes"])
 
-    async def list_users(self) -> list[User]:
+    @cached_method("_metadata_cache")
+    async def list_users(self) -> tuple[User, ...]:
         """List all users in the workspace.
 
         Returns:
-            List of users
+            Tuple of users, shared with other callers
         """
-        query = """
-            query Users {
-                users {
-                    nodes {
-                        id
-                        name
-                        email
-                        displayName
-                    }
-                }
-            }
+        result = await self._execute(_USERS_QUERY)
+        return _USER_LIST_ADAPTER.validate_python(result["users"]["nodes"])
+
+    @cached_method("_metadata_cache")
+    async def get_user_by_name_or_email(self, name_or_email: str) -> User | None:
+        """Find a workspace user by name or email, ignoring case.
+
+        Linear applies the filter, so only the matching user is returned
+        instead of the whole user directory.
+
+        Args:
+            name_or_email: User's name or email address
+
+        Returns:
+            The first matching user, None if there is none
+        """
+        result = await self._execute(_USER_BY_NAME_OR_EMAIL_QUERY, {"value": name_or_email})
+        nodes = result["users"]["nodes"]
+        return User(**nodes[0]) if nodes else None
+
+    def invalidate_metadata_cache(self) -> None:
+        """Forget cached teams, workflow states, labels and users.
+
+        Call after changing any of them, so the next lookup refetches instead
+        of waiting for the cache TTL to expire.
         """
-        result = await self._execute(query)
-        return [User(**user) for user in result["users"]["nodes"]]
+        self._metadata_cache.clear()
 
     async def close(self) -> None:
         """Close the client connection."""
+        self.invalidate_metadata_cache()
+        self._issue_cache.clear()
+        if self._client is not None and self._session is not None:
+            await self._client.close_async()
         self._client = None
+        self._session = None
+
+
+_shared_client: LinearClient | None = None
+
+
+def get_linear_client(settings: Settings) -> LinearClient:
+    """Get the process-wide Linear client.
+
+    Sharing one client keeps its GraphQL session, connection pool and caches
+    alive across tool calls instead of reconnecting for each one.
+
+    Args:
+        settings: Settings to build the client from on first use; the server
+            resolves them once at startup and passes the same instance in
+
+    Returns:
+        The shared LinearClient
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = LinearClient(settings)
+    return _shared_client
+
+
+async def close_linear_client() -> None:
+    """Close the process-wide Linear client, if it was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
@@ -1,6 +1,8 @@
 """Application settings using Pydantic Settings."""
 
-from functools import lru_cache
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -40,6 +42,28 @@ class Settings(BaseSettings):
         description="GitHub organization name",
     )
 
+    # GitHub Response Cache
+    github_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds a cached GitHub GET response is served without revalidation",
+    )
+    github_cache_size: int = Field(
+        default=512,
+        description="Maximum number of cached GitHub GET responses",
+    )
+
+    # GitHub Rate Limiting
+    github_max_concurrency: int = Field(
+        default=10,
+        description="Maximum number of in-flight GitHub API requests",
+    )
+
+    # Linear Metadata Cache
+    linear_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds Linear teams, states, labels and users are reused before refetching",
+    )
+
     # Default Project Settings
     default_project: str = Field(
         default="FAVRES",
@@ -56,6 +80,20 @@ class Settings(BaseSettings):
         description="HTTP request timeout in seconds",
     )
 
+    @cached_property
+    def linear_headers(self) -> Mapping[str, str]:
+        """Headers sent with every Linear API request.
+
+        Built once per settings instance and read-only, so every client can
+        share it.
+        """
+        return MappingProxyType(
+            {
+                "Authorization": self.linear_api_key,
+                "Content-Type": "application/json",
+            }
+        )
+
 
 @lru_cache
 def get_settings() -> Settings:
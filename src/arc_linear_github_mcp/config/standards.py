@@ -1,10 +1,11 @@
 """ARC Labs Studio naming standards and conventions."""
 
-from enum import Enum
+import re
+from enum import StrEnum
 from typing import Final
 
 
-class BranchType(str, Enum):
+class BranchType(StrEnum):
     """Valid branch types for ARC Labs naming convention."""
 
     FEATURE = "feature"
@@ -15,7 +16,7 @@ class BranchType(str, Enum):
     RELEASE = "release"
 
 
-class CommitType(str, Enum):
+class CommitType(StrEnum):
     """Valid commit types following Conventional Commits."""
 
     FEAT = "feat"
@@ -32,10 +33,16 @@ class CommitType(str, Enum):
 
 
 # Branch naming constants
-BRANCH_TYPES: Final[frozenset[str]] = frozenset(t.value for t in BranchType)
+BRANCH_TYPES: Final[frozenset[str]] = frozenset(BranchType)
 
 # Commit type constants
-COMMIT_TYPES: Final[frozenset[str]] = frozenset(t.value for t in CommitType)
+COMMIT_TYPES: Final[frozenset[str]] = frozenset(CommitType)
+
+# Sorted forms for responses and error messages, built once at import
+SORTED_BRANCH_TYPES: Final[tuple[str, ...]] = tuple(sorted(BRANCH_TYPES))
+SORTED_COMMIT_TYPES: Final[tuple[str, ...]] = tuple(sorted(COMMIT_TYPES))
+BRANCH_TYPES_JOINED: Final[str] = ", ".join(SORTED_BRANCH_TYPES)
+COMMIT_TYPES_JOINED: Final[str] = ", ".join(SORTED_COMMIT_TYPES)
 
 # Regex patterns for validation
 BRANCH_PATTERN: Final[str] = (
@@ -48,14 +55,20 @@ COMMIT_PATTERN: Final[str] = (
     r"(?:\(([a-z0-9-]+)\))?:\s+(.+)$"
 )
 
-# Issue ID pattern (e.g., FAVRES-123)
-ISSUE_ID_PATTERN: Final[str] = r"^[A-Z]+-\d+$"
+# Issue ID pattern (e.g., FAVRES-123), capturing the team key and number
+ISSUE_ID_PATTERN: Final[str] = r"^([A-Z]+)-(\d+)$"
 
 # PR title patterns
 PR_TITLE_PATTERN: Final[str] = (
     r"^(Feature|Bugfix|Hotfix|Docs|Spike|Release)/([A-Z]+-\d+):\s+(.+)$"
 )
 
+# Precompiled forms of the patterns above
+BRANCH_RE: Final[re.Pattern[str]] = re.compile(BRANCH_PATTERN)
+COMMIT_RE: Final[re.Pattern[str]] = re.compile(COMMIT_PATTERN)
+ISSUE_ID_RE: Final[re.Pattern[str]] = re.compile(ISSUE_ID_PATTERN)
+PR_TITLE_RE: Final[re.Pattern[str]] = re.compile(PR_TITLE_PATTERN)
+
 # Branch type to PR title prefix mapping
 BRANCH_TO_PR_PREFIX: Final[dict[str, str]] = {
     "feature": "Feature",
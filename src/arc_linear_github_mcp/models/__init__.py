@@ -12,6 +12,7 @@ from arc_linear_github_mcp.models.linear import (
     Issue,
     IssueState,
     Priority,
+    PriorityLevel,
     Project,
     UpdateIssueRequest,
     User,
@@ -24,6 +25,7 @@ __all__ = [
     "User",
     "IssueState",
     "Priority",
+    "PriorityLevel",
     "CreateIssueRequest",
     "UpdateIssueRequest",
     # GitHub models
@@ -1,12 +1,18 @@
 """Pydantic models for GitHub API entities."""
 
+from collections.abc import Callable, Collection
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
+# Shared by models parsed from GitHub responses: unknown payload fields are
+# dropped, and instances are immutable so cached results can be shared.
+_RESPONSE_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
 
-class PRState(str, Enum):
+
+class PRState(StrEnum):
     """Pull request state."""
 
     OPEN = "open"
@@ -17,6 +23,8 @@ class PRState(str, Enum):
 class Repository(BaseModel):
     """GitHub repository model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     id: int
     name: str
     full_name: str
@@ -41,6 +49,8 @@ class Repository(BaseModel):
 class GitUser(BaseModel):
     """GitHub user model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     login: str
     id: int
     avatar_url: str | None = None
@@ -50,11 +60,22 @@ class GitUser(BaseModel):
 class Branch(BaseModel):
     """GitHub branch model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     name: str
     sha: str | None = Field(None, description="Commit SHA")
     protected: bool = False
     commit_url: str | None = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def _flatten_commit(cls, data: Any) -> Any:
+        """Lift ``commit.sha``/``commit.url`` from the REST branch payload."""
+        if isinstance(data, dict) and isinstance(data.get("commit"), dict):
+            commit = data["commit"]
+            data = {"sha": commit.get("sha"), "commit_url": commit.get("url"), **data}
+        return data
+
     def to_dict(self) -> dict:
         """Convert to dictionary for MCP response."""
         return {
@@ -64,17 +85,55 @@ class Branch(BaseModel):
         }
 
 
+# Fields kept by Branch.to_dict()
+_BRANCH_DICT_FIELDS = frozenset({"name", "sha", "protected"})
+
+# Validates and serializes whole branch lists in one pydantic-core pass; also
+# used by the GitHub client
+_BRANCH_LIST_ADAPTER = TypeAdapter(list[Branch])
+
+
+def branches_to_dicts(branches: list[Branch]) -> list[dict]:
+    """Convert branches to dictionaries for an MCP response.
+
+    Equivalent to ``[branch.to_dict() for branch in branches]``, but the list
+    is walked by pydantic-core in a single call.
+
+    Args:
+        branches: Branches to convert
+
+    Returns:
+        One dictionary per branch, in the same order
+    """
+    return _BRANCH_LIST_ADAPTER.dump_python(
+        branches, mode="json", include={"__all__": _BRANCH_DICT_FIELDS}
+    )
+
+
 class BranchRef(BaseModel):
     """GitHub branch reference model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     ref: str
     sha: str
     url: str | None = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def _flatten_repo(cls, data: Any) -> Any:
+        """Take ``url`` from ``repo.html_url`` in the REST head/base payload."""
+        if isinstance(data, dict) and "repo" in data and "url" not in data:
+            repo = data["repo"]
+            data = {**data, "url": repo.get("html_url") if repo else None}
+        return data
+
 
 class PullRequest(BaseModel):
     """GitHub pull request model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     id: int
     number: int
     title: str
@@ -109,6 +168,41 @@ class PullRequest(BaseModel):
         }
 
 
+# Builds each PullRequest.to_dict() key on its own, so a field selection only
+# computes the values it returns
+_PR_DICT_FIELDS: dict[str, Callable[[PullRequest], Any]] = {
+    "number": lambda pr: pr.number,
+    "title": lambda pr: pr.title,
+    "body": lambda pr: pr.body,
+    "state": lambda pr: pr.state,
+    "url": lambda pr: pr.html_url,
+    "head_branch": lambda pr: pr.head.ref,
+    "base_branch": lambda pr: pr.base.ref,
+    "author": lambda pr: pr.user.login if pr.user else None,
+    "draft": lambda pr: pr.draft,
+    "merged": lambda pr: pr.merged,
+    "created_at": lambda pr: pr.created_at.isoformat() if pr.created_at else None,
+    "updated_at": lambda pr: pr.updated_at.isoformat() if pr.updated_at else None,
+}
+
+
+def prs_to_dicts(prs: list[PullRequest], fields: Collection[str] | None = None) -> list[dict]:
+    """Convert pull requests to dictionaries for an MCP response.
+
+    Args:
+        prs: Pull requests to convert
+        fields: Keys to keep in each dictionary; all of them when omitted.
+            Unknown keys are ignored, and fields left out are never computed.
+
+    Returns:
+        One dictionary per pull request, in the same order
+    """
+    if fields is None:
+        return [pr.to_dict() for pr in prs]
+    getters = [(key, _PR_DICT_FIELDS[key]) for key in fields if key in _PR_DICT_FIELDS]
+    return [{key: get(pr) for key, get in getters} for pr in prs]
+
+
 class CreateBranchRequest(BaseModel):
     """Request model for creating a GitHub branch."""
 
@@ -154,12 +248,28 @@ class CreatePRRequest(BaseModel):
 class Commit(BaseModel):
     """GitHub commit model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     sha: str
     message: str
     author: GitUser | None = None
     html_url: str | None = None
     committed_date: datetime | None = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def _flatten_commit(cls, data: Any) -> Any:
+        """Lift the message and commit date from the REST ``commit`` object."""
+        if isinstance(data, dict) and isinstance(data.get("commit"), dict):
+            commit = data["commit"]
+            committer = commit.get("committer") or {}
+            data = {
+                "message": commit.get("message"),
+                "committed_date": committer.get("date"),
+                **data,
+            }
+        return data
+
 
 class GitRef(BaseModel):
     """GitHub Git reference model."""
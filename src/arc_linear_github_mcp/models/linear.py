@@ -1,12 +1,18 @@
 """Pydantic models for Linear API entities."""
 
+from collections.abc import Collection
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
+from typing import Any, Literal, NotRequired, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_serializer
 
+# Shared by the entity models parsed from Linear responses: unknown fields are
+# dropped, and instances are immutable so cached results can be shared.
+_RESPONSE_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, populate_by_name=True)
 
-class Priority(int, Enum):
+
+class Priority(IntEnum):
     """Linear issue priority levels."""
 
     NO_PRIORITY = 0
@@ -16,9 +22,15 @@ class Priority(int, Enum):
     LOW = 4
 
 
+# Valid priority values, checked by pydantic-core with a single literal match
+PriorityLevel = Literal[0, 1, 2, 3, 4]
+
+
 class IssueState(BaseModel):
     """Linear issue state."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     id: str
     name: str
     type: str | None = None
@@ -28,6 +40,8 @@ class IssueState(BaseModel):
 class User(BaseModel):
     """Linear user model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     id: str
     name: str
     email: str | None = None
@@ -37,6 +51,8 @@ class User(BaseModel):
 class Label(BaseModel):
     """Linear label model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     id: str
     name: str
     color: str | None = None
@@ -45,6 +61,8 @@ class Label(BaseModel):
 class Project(BaseModel):
     """Linear project model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     id: str
     name: str
     key: str | None = None
@@ -54,6 +72,8 @@ class Project(BaseModel):
 class Team(BaseModel):
     """Linear team model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     id: str
     name: str
     key: str
@@ -62,11 +82,13 @@ class Team(BaseModel):
 class Issue(BaseModel):
     """Linear issue model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     id: str
     identifier: str
     title: str
     description: str | None = None
-    priority: int = Priority.NORMAL
+    priority: PriorityLevel = Priority.NORMAL.value
     priority_label: str | None = Field(None, alias="priorityLabel")
     state: IssueState | None = None
     assignee: User | None = None
@@ -78,22 +100,86 @@ class Issue(BaseModel):
     created_at: datetime | None = Field(None, alias="createdAt")
     updated_at: datetime | None = Field(None, alias="updatedAt")
 
+    @field_serializer("state", "assignee")
+    def serialize_name(self, value: IssueState | User | None) -> str | None:
+        """Serialize the state and assignee as their names."""
+        return value.name if value else None
+
+    @field_serializer("labels")
+    def serialize_labels(self, labels: list[Label]) -> list[str]:
+        """Serialize labels as their names."""
+        return [label.name for label in labels]
+
+    @field_serializer("created_at", "updated_at", when_used="json")
+    def serialize_datetime(self, value: datetime | None) -> str | None:
+        """Serialize timestamps with isoformat(), so UTC keeps its '+00:00' offset."""
+        return value.isoformat() if value else None
+
     def to_dict(self) -> dict:
         """Convert to dictionary for MCP response."""
-        return {
-            "id": self.id,
-            "identifier": self.identifier,
-            "title": self.title,
-            "description": self.description,
-            "priority": self.priority,
-            "priority_label": self.priority_label,
-            "state": self.state.name if self.state else None,
-            "assignee": self.assignee.name if self.assignee else None,
-            "labels": [label.name for label in self.labels],
-            "url": self.url,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        return self.model_dump(mode="json", exclude=_ISSUE_DICT_EXCLUDE)
+
+
+# Fields left out of Issue.to_dict(); they aren't selected by the issue queries
+_ISSUE_DICT_EXCLUDE = frozenset({"creator", "project", "team"})
+
+# Serializes whole issue lists in one pydantic-core pass
+_ISSUE_LIST_ADAPTER = TypeAdapter(list[Issue])
+
+
+def issues_to_dicts(issues: list[Issue], fields: Collection[str] | None = None) -> list[dict]:
+    """Convert issues to dictionaries for an MCP response.
+
+    Equivalent to ``[issue.to_dict() for issue in issues]``, but the list is
+    walked by pydantic-core in a single call.
+
+    Args:
+        issues: Issues to convert
+        fields: Keys to keep in each dictionary; all of them when omitted.
+            Fields left out are skipped by the serializer, not removed after.
+
+    Returns:
+        One dictionary per issue, in the same order
+    """
+    if fields is not None:
+        return _ISSUE_LIST_ADAPTER.dump_python(
+            issues, mode="json", include={"__all__": set(fields) - _ISSUE_DICT_EXCLUDE}
+        )
+    return _ISSUE_LIST_ADAPTER.dump_python(
+        issues, mode="json", exclude={"__all__": _ISSUE_DICT_EXCLUDE}
+    )
+
+
+class IssueListResponse(BaseModel):
+    """Successful ``linear_list_issues`` response."""
+
+    success: bool = True
+    count: int
+    issues: list[Issue]
+
+
+def issue_list_response(issues: list[Issue], fields: Collection[str] | None = None) -> dict:
+    """Build a successful ``linear_list_issues`` response.
+
+    The whole response, issues included, is dumped by pydantic-core in one
+    call. The dictionary is the same as building it around ``issues_to_dicts``.
+
+    Args:
+        issues: Issues to list
+        fields: Issue keys to include; all of them when omitted
+
+    Returns:
+        Dictionary with success flag, count and issues
+    """
+    response = IssueListResponse.model_construct(count=len(issues), issues=issues)
+    if fields is not None:
+        include = {
+            "success": True,
+            "count": True,
+            "issues": {"__all__": set(fields) - _ISSUE_DICT_EXCLUDE},
         }
+        return response.model_dump(mode="json", include=include)
+    return response.model_dump(mode="json", exclude={"issues": {"__all__": _ISSUE_DICT_EXCLUDE}})
 
 
 class CreateIssueRequest(BaseModel):
@@ -103,10 +189,8 @@ class CreateIssueRequest(BaseModel):
     description: str | None = Field(None, max_length=10000)
     team_id: str = Field(..., description="Linear team ID")
     project_id: str | None = Field(None, description="Linear project ID")
-    priority: int = Field(
-        default=Priority.NORMAL,
-        ge=0,
-        le=4,
+    priority: PriorityLevel = Field(
+        default=Priority.NORMAL.value,
         description="Priority: 0=None, 1=Urgent, 2=High, 3=Normal, 4=Low",
     )
     label_ids: list[str] = Field(default_factory=list)
@@ -119,30 +203,53 @@ class UpdateIssueRequest(BaseModel):
 
     title: str | None = Field(None, min_length=1, max_length=500)
     description: str | None = Field(None, max_length=10000)
-    priority: int | None = Field(None, ge=0, le=4)
+    priority: PriorityLevel | None = None
     state_id: str | None = None
     assignee_id: str | None = None
     label_ids: list[str] | None = None
 
 
-class IssueConnection(BaseModel):
-    """Linear issue connection for pagination."""
+class PageInfo(TypedDict):
+    """Cursor information of a Linear connection page."""
 
-    nodes: list[Issue] = Field(default_factory=list)
-    page_info: dict | None = Field(None, alias="pageInfo")
+    hasNextPage: bool
+    endCursor: str | None
 
 
-class TeamConnection(BaseModel):
-    """Linear team connection for pagination."""
+class IssueConnection(TypedDict):
+    """A page of raw issue nodes as returned by Linear.
 
-    nodes: list[Team] = Field(default_factory=list)
+    Nodes are converted into Issues by the client, so the page itself is not
+    validated into a model.
+    """
+
+    nodes: list[dict[str, Any]]
+    pageInfo: NotRequired[PageInfo]
+
+
+class TeamConnection(TypedDict):
+    """A page of raw team nodes as returned by Linear."""
+
+    nodes: list[dict[str, Any]]
 
 
 class WorkflowState(BaseModel):
     """Linear workflow state model."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     id: str
     name: str
     type: str
     color: str | None = None
     team: Team | None = None
+
+
+class TeamContext(BaseModel):
+    """A team together with its workflow states and labels."""
+
+    model_config = ConfigDict(frozen=True)
+
+    team: Team
+    states: tuple[WorkflowState, ...] = ()
+    labels: tuple[Label, ...] = ()
@@ -3,23 +3,70 @@
 An MCP Server for integrating Linear and GitHub following ARC Labs Studio standards.
 """
 
+import asyncio
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cache
+
 from mcp.server.fastmcp import FastMCP
 
+from arc_linear_github_mcp.clients.github import close_github_client
+from arc_linear_github_mcp.clients.linear import close_linear_client
+from arc_linear_github_mcp.config.settings import get_settings
 from arc_linear_github_mcp.tools.github import register_github_tools
 from arc_linear_github_mcp.tools.linear import register_linear_tools
-from arc_linear_github_mcp.tools.workflow import register_workflow_tools
+from arc_linear_github_mcp.tools.workflow import cancel_jobs, register_workflow_tools
+
+
+@cache
+def _register_tools(server: FastMCP) -> None:
+    """Register all tools, sharing one settings instance between them.
+
+    Settings are resolved here rather than at import, so the module can be
+    imported without credentials. Cached because HTTP transports enter the
+    lifespan once per session.
+    """
+    settings = get_settings()
+    register_linear_tools(server, settings)
+    register_github_tools(server, settings)
+    register_workflow_tools(server, settings)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Register tools on startup; on shutdown, stop jobs and close shared API clients."""
+    _register_tools(server)
+    try:
+        yield
+    finally:
+        await cancel_jobs()
+        await close_github_client()
+        await close_linear_client()
+
+
+# Create the FastMCP server; tools are registered when it starts
+mcp = FastMCP(name="ARCLinearGitHubMCP Workflow", lifespan=lifespan)
+
 
-# Create the FastMCP server
-mcp = FastMCP(name="ARCLinearGitHubMCP Workflow")
+def _use_uvloop() -> None:
+    """Switch to uvloop's event loop when it is installed.
 
-# Register all tools
-register_linear_tools(mcp)
-register_github_tools(mcp)
-register_workflow_tools(mcp)
+    uvloop is an optional extra (``arc-linear-github-mcp[speed]``) and does
+    not support Windows, where the default asyncio loop is kept.
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main() -> None:
     """Run the MCP server."""
+    _use_uvloop()
     mcp.run()
 
 
@@ -2,17 +2,23 @@
 
 from mcp.server.fastmcp import FastMCP
 
-from arc_linear_github_mcp.clients.github import GitHubClient, GitHubClientError
-from arc_linear_github_mcp.config.settings import get_settings
+from arc_linear_github_mcp.clients.github import (
+    GitHubBranchExistsError,
+    GitHubClientError,
+    get_github_client,
+)
+from arc_linear_github_mcp.config.settings import Settings
 from arc_linear_github_mcp.config.standards import BRANCH_TO_PR_PREFIX
+from arc_linear_github_mcp.models.github import branches_to_dicts, prs_to_dicts
 from arc_linear_github_mcp.validators.branch import generate_branch_name, validate_branch_name
 
 
-def register_github_tools(mcp: FastMCP) -> None:
+def register_github_tools(mcp: FastMCP, settings: Settings) -> None:
     """Register GitHub-related MCP tools.
 
     Args:
         mcp: FastMCP server instance
+        settings: Application settings, resolved once and shared by every tool
     """
 
     @mcp.tool()
@@ -26,8 +32,7 @@ def register_github_tools(mcp: FastMCP) -> None:
         Returns:
             Dictionary with list of branches
         """
-        settings = get_settings()
-        client = GitHubClient(settings)
+        client = get_github_client(settings)
         repo = repo or settings.default_repo
 
         try:
@@ -37,15 +42,13 @@ def register_github_tools(mcp: FastMCP) -> None:
                 "success": True,
                 "repository": f"{settings.github_org}/{repo}",
                 "count": len(branches),
-                "branches": [branch.to_dict() for branch in branches],
+                "branches": branches_to_dicts(branches),
             }
         except GitHubClientError as e:
             return {
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
 
     @mcp.tool()
     async def github_create_branch(
@@ -72,8 +75,7 @@ def register_github_tools(mcp: FastMCP) -> None:
             - bugfix/FAVRES-456-map-crash
             - docs/update-readme
         """
-        settings = get_settings()
-        client = GitHubClient(settings)
+        client = get_github_client(settings)
         repo = repo or settings.default_repo
 
         try:
@@ -84,18 +86,16 @@ def register_github_tools(mcp: FastMCP) -> None:
                 issue_id=issue_id,
             )
 
-            # Check if branch already exists
-            existing = await client.get_branch(repo, branch_name)
-            if existing:
+            # Create the branch; GitHub reports an existing name as a conflict
+            try:
+                branch = await client.create_branch(repo, branch_name, base_branch)
+            except GitHubBranchExistsError:
                 return {
                     "success": False,
                     "error": f"Branch '{branch_name}' already exists",
                     "branch_name": branch_name,
                 }
 
-            # Create the branch
-            branch = await client.create_branch(repo, branch_name, base_branch)
-
             return {
                 "success": True,
                 "branch": branch.to_dict(),
@@ -113,14 +113,13 @@ def register_github_tools(mcp: FastMCP) -> None:
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
 
     @mcp.tool()
     async def github_list_prs(
         repo: str | None = None,
         state: str = "open",
         limit: int = 30,
+        fields: list[str] | None = None,
     ) -> dict:
         """List pull requests in a repository.
 
@@ -128,31 +127,31 @@ def register_github_tools(mcp: FastMCP) -> None:
             repo: Repository name (defaults to configured default repo)
             state: PR state filter ('open', 'closed', 'all')
             limit: Maximum number of PRs to return
+            fields: Optional PR fields to return (e.g., ['number', 'title']);
+                all fields by default
 
         Returns:
             Dictionary with list of pull requests
         """
-        settings = get_settings()
-        client = GitHubClient(settings)
+        client = get_github_client(settings)
         repo = repo or settings.default_repo
 
         try:
             prs = await client.list_pull_requests(repo, state=state, per_page=limit)
+            pull_requests = prs_to_dicts(prs, fields)
 
             return {
                 "success": True,
                 "repository": f"{settings.github_org}/{repo}",
                 "state": state,
                 "count": len(prs),
-                "pull_requests": [pr.to_dict() for pr in prs],
+                "pull_requests": pull_requests,
             }
         except GitHubClientError as e:
             return {
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
 
     @mcp.tool()
     async def github_create_pr(
@@ -181,8 +180,7 @@ def register_github_tools(mcp: FastMCP) -> None:
         The PR title will be formatted as: '<Type>/<Issue-ID>: <Title>'
         Example: 'Feature/FAVRES-123: Restaurant Search Implementation'
         """
-        settings = get_settings()
-        client = GitHubClient(settings)
+        client = get_github_client(settings)
         repo = repo or settings.default_repo
 
         try:
@@ -192,10 +190,9 @@ def register_github_tools(mcp: FastMCP) -> None:
             # Format the PR title
             if validation.is_valid and validation.branch_type:
                 prefix = BRANCH_TO_PR_PREFIX.get(validation.branch_type, "Feature")
-                if issue_id:
-                    formatted_title = f"{prefix}/{issue_id}: {title}"
-                elif validation.issue_id:
-                    formatted_title = f"{prefix}/{validation.issue_id}: {title}"
+                linked_issue = issue_id or validation.issue_id
+                if linked_issue:
+                    formatted_title = f"{prefix}/{linked_issue}: {title}"
                 else:
                     formatted_title = f"{prefix}: {title}"
             else:
@@ -204,8 +201,14 @@ def register_github_tools(mcp: FastMCP) -> None:
             # Build PR body with Linear link if issue_id provided
             pr_body = body or ""
             if issue_id:
-                linear_link = f"\n\n---\nLinear Issue: [{issue_id}](https://linear.app/issue/{issue_id})"
-                pr_body = pr_body + linear_link if pr_body else f"Linear Issue: [{issue_id}](https://linear.app/issue/{issue_id})"
+                linear_link = (
+                    f"\n\n---\nLinear Issue: [{issue_id}](https://linear.app/issue/{issue_id})"
+                )
+                pr_body = (
+                    pr_body + linear_link
+                    if pr_body
+                    else f"Linear Issue: [{issue_id}](https://linear.app/issue/{issue_id})"
+                )
 
             # Create the PR
             pr = await client.create_pull_request(
@@ -228,8 +231,6 @@ def register_github_tools(mcp: FastMCP) -> None:
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
 
     @mcp.tool()
     async def github_get_pr(pr_number: int, repo: str | None = None) -> dict:
@@ -242,8 +243,7 @@ def register_github_tools(mcp: FastMCP) -> None:
         Returns:
             Dictionary with PR details or error
         """
-        settings = get_settings()
-        client = GitHubClient(settings)
+        client = get_github_client(settings)
         repo = repo or settings.default_repo
 
         try:
@@ -264,8 +264,6 @@ def register_github_tools(mcp: FastMCP) -> None:
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
 
     @mcp.tool()
     async def github_get_default_branch(repo: str | None = None) -> dict:
@@ -277,8 +275,7 @@ def register_github_tools(mcp: FastMCP) -> None:
         Returns:
             Dictionary with default branch name
         """
-        settings = get_settings()
-        client = GitHubClient(settings)
+        client = get_github_client(settings)
         repo = repo or settings.default_repo
 
         try:
@@ -294,5 +291,3 @@ def register_github_tools(mcp: FastMCP) -> None:
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
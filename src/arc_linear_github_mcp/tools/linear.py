@@ -1,17 +1,40 @@
 """MCP tools for Linear API integration."""
 
+import asyncio
+from dataclasses import dataclass
+
 from mcp.server.fastmcp import FastMCP
 
-from arc_linear_github_mcp.clients.linear import LinearClient, LinearClientError
-from arc_linear_github_mcp.config.settings import get_settings
-from arc_linear_github_mcp.models.linear import CreateIssueRequest, UpdateIssueRequest
+from arc_linear_github_mcp.clients.linear import LinearClientError, get_linear_client
+from arc_linear_github_mcp.config.settings import Settings
+from arc_linear_github_mcp.models.linear import (
+    CreateIssueRequest,
+    UpdateIssueRequest,
+    issue_list_response,
+)
+
+
+@dataclass(slots=True)
+class _UpdatePatch:
+    """Changes collected by ``linear_update_issue`` before validation."""
+
+    title: str | None = None
+    priority: int | None = None
+    state_id: str | None = None
+    assignee_id: str | None = None
+
 
+async def _none() -> None:
+    """Stand in for a lookup that isn't needed in an ``asyncio.gather``."""
+    return None
 
-def register_linear_tools(mcp: FastMCP) -> None:
+
+def register_linear_tools(mcp: FastMCP, settings: Settings) -> None:
     """Register Linear-related MCP tools.
 
     Args:
         mcp: FastMCP server instance
+        settings: Application settings, resolved once and shared by every tool
     """
 
     @mcp.tool()
@@ -19,6 +42,7 @@ def register_linear_tools(mcp: FastMCP) -> None:
         project: str = "FAVRES",
         state: str | None = None,
         limit: int = 50,
+        fields: list[str] | None = None,
     ) -> dict:
         """List issues from a Linear project.
 
@@ -26,28 +50,23 @@ def register_linear_tools(mcp: FastMCP) -> None:
             project: Project/team key (e.g., 'FAVRES')
             state: Optional state filter (e.g., 'In Progress', 'Todo', 'Done')
             limit: Maximum number of issues to return (default: 50)
+            fields: Optional issue fields to return (e.g., ['identifier', 'title']);
+                all fields by default
 
         Returns:
             Dictionary with list of issues and count
         """
-        settings = get_settings()
-        client = LinearClient(settings)
+        client = get_linear_client(settings)
 
         try:
             issues = await client.list_issues(team_key=project, state=state, first=limit)
 
-            return {
-                "success": True,
-                "count": len(issues),
-                "issues": [issue.to_dict() for issue in issues],
-            }
+            return issue_list_response(issues, fields)
         except LinearClientError as e:
             return {
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
 
     @mcp.tool()
     async def linear_get_issue(issue_id: str) -> dict:
@@ -59,8 +78,7 @@ def register_linear_tools(mcp: FastMCP) -> None:
         Returns:
             Dictionary with issue details or error
         """
-        settings = get_settings()
-        client = LinearClient(settings)
+        client = get_linear_client(settings)
 
         try:
             issue = await client.search_issue_by_identifier(issue_id)
@@ -80,8 +98,6 @@ def register_linear_tools(mcp: FastMCP) -> None:
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
 
     @mcp.tool()
     async def linear_create_issue(
@@ -103,23 +119,22 @@ def register_linear_tools(mcp: FastMCP) -> None:
         Returns:
             Dictionary with created issue details or error
         """
-        settings = get_settings()
-        client = LinearClient(settings)
+        client = get_linear_client(settings)
 
         try:
-            # Get team ID from project key
-            team = await client.get_team_by_key(project)
-            if not team:
+            # Get team ID and labels from project key in one request
+            context = await client.get_team_context(project)
+            if not context:
                 return {
                     "success": False,
                     "error": f"Team/project '{project}' not found",
                 }
+            team = context.team
 
             # Resolve label IDs if provided
             label_ids: list[str] = []
             if labels:
-                all_labels = await client.list_labels(team.id)
-                label_map = {label.name.lower(): label.id for label in all_labels}
+                label_map = {label.name.lower(): label.id for label in context.labels}
 
                 for label_name in labels:
                     label_id = label_map.get(label_name.lower())
@@ -147,8 +162,6 @@ def register_linear_tools(mcp: FastMCP) -> None:
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
 
     @mcp.tool()
     async def linear_update_issue(
@@ -170,8 +183,7 @@ def register_linear_tools(mcp: FastMCP) -> None:
         Returns:
             Dictionary with updated issue details or error
         """
-        settings = get_settings()
-        client = LinearClient(settings)
+        client = get_linear_client(settings)
 
         try:
             # Find the issue first
@@ -183,53 +195,40 @@ def register_linear_tools(mcp: FastMCP) -> None:
                 }
 
             # Build update request
-            update_data: dict = {}
-
-            if title is not None:
-                update_data["title"] = title
-
-            if priority is not None:
-                update_data["priority"] = priority
-
-            # Resolve state ID if provided
-            if state:
-                if issue.team:
-                    workflow_state = await client.get_state_by_name(issue.team.id, state)
-                    if workflow_state:
-                        update_data["state_id"] = workflow_state.id
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"State '{state}' not found. Use linear_list_states to see available states.",
-                        }
-
-            # Resolve assignee ID if provided
-            if assignee:
-                users = await client.list_users()
-                assignee_user = None
-                for user in users:
-                    if (
-                        user.name.lower() == assignee.lower()
-                        or (user.email and user.email.lower() == assignee.lower())
-                    ):
-                        assignee_user = user
-                        break
+            patch = _UpdatePatch(title=title, priority=priority)
 
+            # Resolve the state and assignee concurrently; they're independent
+            workflow_state, assignee_user = await asyncio.gather(
+                client.get_state_by_name(issue.team.id, state) if state and issue.team else _none(),
+                client.get_user_by_name_or_email(assignee) if assignee else _none(),
+            )
+
+            if state and issue.team:
+                if workflow_state:
+                    patch.state_id = workflow_state.id
+                else:
+                    return {
+                        "success": False,
+                        "error": f"State '{state}' not found. Use linear_list_states to see available states.",
+                    }
+
+            if assignee:
                 if assignee_user:
-                    update_data["assignee_id"] = assignee_user.id
+                    patch.assignee_id = assignee_user.id
                 else:
                     return {
                         "success": False,
                         "error": f"User '{assignee}' not found",
                     }
 
-            if not update_data:
+            if patch == _UpdatePatch():
                 return {
                     "success": False,
                     "error": "No updates provided",
                 }
 
-            request = UpdateIssueRequest(**update_data)
+            # Read straight off the patch's attributes; no intermediate dict
+            request = UpdateIssueRequest.model_validate(patch, from_attributes=True)
             updated_issue = await client.update_issue(issue.id, request)
 
             return {
@@ -242,8 +241,6 @@ def register_linear_tools(mcp: FastMCP) -> None:
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
 
     @mcp.tool()
     async def linear_list_states(project: str = "FAVRES") -> dict:
@@ -255,33 +252,27 @@ def register_linear_tools(mcp: FastMCP) -> None:
         Returns:
             Dictionary with list of states
         """
-        settings = get_settings()
-        client = LinearClient(settings)
+        client = get_linear_client(settings)
 
         try:
-            team = await client.get_team_by_key(project)
-            if not team:
+            context = await client.get_team_context(project)
+            if not context:
                 return {
                     "success": False,
                     "error": f"Team/project '{project}' not found",
                 }
 
-            states = await client.list_workflow_states(team.id)
+            states = context.states
 
             return {
                 "success": True,
-                "states": [
-                    {"id": s.id, "name": s.name, "type": s.type}
-                    for s in states
-                ],
+                "states": [{"id": s.id, "name": s.name, "type": s.type} for s in states],
             }
         except LinearClientError as e:
             return {
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
 
     @mcp.tool()
     async def linear_list_labels(project: str = "FAVRES") -> dict:
@@ -293,24 +284,22 @@ def register_linear_tools(mcp: FastMCP) -> None:
         Returns:
             Dictionary with list of labels
         """
-        settings = get_settings()
-        client = LinearClient(settings)
+        client = get_linear_client(settings)
 
         try:
-            team = await client.get_team_by_key(project)
-            if not team:
+            context = await client.get_team_context(project)
+            if not context:
                 return {
                     "success": False,
                     "error": f"Team/project '{project}' not found",
                 }
 
-            labels = await client.list_labels(team.id)
+            labels = context.labels
 
             return {
                 "success": True,
                 "labels": [
-                    {"id": label.id, "name": label.name, "color": label.color}
-                    for label in labels
+                    {"id": label.id, "name": label.name, "color": label.color} for label in labels
                 ],
             }
         except LinearClientError as e:
@@ -318,5 +307,3 @@ def register_linear_tools(mcp: FastMCP) -> None:
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await client.close()
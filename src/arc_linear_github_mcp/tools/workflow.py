@@ -1,11 +1,21 @@
 """MCP tools for combined Linear + GitHub workflows."""
 
+import asyncio
+import time
+from collections.abc import Coroutine
+from typing import Any
+from uuid import uuid4
+
 from mcp.server.fastmcp import FastMCP
 
-from arc_linear_github_mcp.clients.github import GitHubClient, GitHubClientError
-from arc_linear_github_mcp.clients.linear import LinearClient, LinearClientError
-from arc_linear_github_mcp.config.settings import get_settings
-from arc_linear_github_mcp.config.standards import BRANCH_TYPES, COMMIT_TYPES
+from arc_linear_github_mcp.clients.github import (
+    GitHubBranchExistsError,
+    GitHubClientError,
+    get_github_client,
+)
+from arc_linear_github_mcp.clients.linear import LinearClientError, get_linear_client
+from arc_linear_github_mcp.config.settings import Settings
+from arc_linear_github_mcp.config.standards import SORTED_BRANCH_TYPES, SORTED_COMMIT_TYPES
 from arc_linear_github_mcp.models.linear import CreateIssueRequest
 from arc_linear_github_mcp.validators.branch import (
     generate_branch_name,
@@ -16,12 +26,359 @@ from arc_linear_github_mcp.validators.commit import (
     validate_commit_message,
 )
 
+# Fixed entries of workflow_start_feature's next steps
+_NEXT_STEP_FETCH = "git fetch origin"
+_NEXT_STEP_WORK = "# Start working on your feature"
+
+# Background workflow_start_feature runs by job ID, and when each one finished.
+# A finished job is kept until it is polled, but for no longer than _JOB_TTL
+# seconds, and only the newest _MAX_FINISHED_JOBS are kept.
+_JOBS: dict[str, asyncio.Task[dict]] = {}
+_JOB_FINISHED_AT: dict[str, float] = {}
+_JOB_TTL = 3600.0
+_MAX_FINISHED_JOBS = 100
+
+# Served by workflow_get_conventions; built from constants, so only once
+_CONVENTIONS_REFERENCE: dict = {
+    "branch_naming": {
+        "format": "<type>/<issue-id>-<description>",
+        "types": SORTED_BRANCH_TYPES,
+        "examples": [
+            "feature/FAVRES-123-restaurant-search",
+            "bugfix/FAVRES-456-map-crash",
+            "hotfix/FAVRES-789-auth-fix",
+            "docs/update-readme",
+            "spike/swiftui-animations",
+            "release/1.2.0",
+        ],
+    },
+    "commit_format": {
+        "format": "<type>(<scope>): <subject>",
+        "types": SORTED_COMMIT_TYPES,
+        "examples": [
+            "feat(search): add restaurant filtering",
+            "fix(map): resolve annotation crash",
+            "docs(readme): update installation steps",
+            "refactor: simplify auth flow",
+        ],
+        "rules": [
+            "Subject should be lowercase",
+            "No period at the end of subject",
+            "Maximum 100 characters for first line",
+            "Use imperative mood (add, fix, update, not added, fixed, updated)",
+        ],
+    },
+    "pr_naming": {
+        "format": "<Type>/<Issue-ID>: <Title>",
+        "examples": [
+            "Feature/FAVRES-123: Restaurant Search Implementation",
+            "Bugfix/FAVRES-456: Map Annotation Crash Fix",
+            "Hotfix/FAVRES-789: Authentication Token Refresh",
+        ],
+    },
+    "linear_priority": {
+        "1": "Urgent",
+        "2": "High",
+        "3": "Normal (default)",
+        "4": "Low",
+    },
+}
+
+
+def _start_job(coro: Coroutine[Any, Any, dict]) -> str:
+    """Run a workflow in the background and return its job ID."""
+    _evict_finished_jobs()
+    job_id = uuid4().hex
+    task = asyncio.create_task(coro)
+    _JOBS[job_id] = task
+    task.add_done_callback(lambda _task: _job_finished(job_id))
+    return job_id
+
+
+def _job_finished(job_id: str) -> None:
+    """Record when a job finished, unless it was already cancelled and dropped."""
+    if job_id in _JOBS:
+        _JOB_FINISHED_AT[job_id] = time.monotonic()
+        _evict_finished_jobs()
+
+
+def _evict_finished_jobs() -> None:
+    """Drop finished jobs that have expired or exceed the finished-job cap."""
+    cutoff = time.monotonic() - _JOB_TTL
+    excess = len(_JOB_FINISHED_AT) - _MAX_FINISHED_JOBS
+    # Finish times are recorded in order, so the oldest jobs come first
+    for job_id, finished_at in list(_JOB_FINISHED_AT.items()):
+        if finished_at >= cutoff and excess <= 0:
+            break
+        del _JOB_FINISHED_AT[job_id]
+        del _JOBS[job_id]
+        excess -= 1
+
+
+async def cancel_jobs() -> None:
+    """Cancel every outstanding job and wait for them to stop.
+
+    Called on shutdown, before the shared API clients are closed, so no job
+    is left mid-request on a closed client.
+    """
+    tasks = list(_JOBS.values())
+    _JOBS.clear()
+    _JOB_FINISHED_AT.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def workflow_validate_branch_name(branch_name: str) -> dict:
+    """Validate a branch name against ARC Labs conventions.
+
+    Args:
+        branch_name: The branch name to validate
+
+    Returns:
+        Dictionary with validation result and details
+
+    Valid branch format: <type>/<issue-id>-<description>
+    Types: feature, bugfix, hotfix, docs, spike, release
+    Examples:
+        - feature/FAVRES-123-restaurant-search
+        - bugfix/FAVRES-456-map-crash
+        - docs/update-readme
+    """
+    result = validate_branch_name(branch_name)
+
+    response = result.to_dict()
+    response["valid_types"] = SORTED_BRANCH_TYPES
+
+    if result.is_valid:
+        response["message"] = f"Valid {result.branch_type} branch"
+        if result.issue_id:
+            response["message"] += f" for issue {result.issue_id}"
+    else:
+        response["message"] = f"Invalid branch name: {result.error}"
+
+    return response
+
+
+async def workflow_validate_commit_message(message: str) -> dict:
+    """Validate a commit message against Conventional Commits format.
+
+    Args:
+        message: The commit message to validate
+
+    Returns:
+        Dictionary with validation result and details
+
+    Valid commit format: <type>(<scope>): <subject>
+    Types: feat, fix, docs, style, refactor, perf, test, chore, build, ci, revert
+    Examples:
+        - feat(search): add restaurant filtering
+        - fix(map): resolve annotation crash
+        - docs(readme): update installation steps
+    """
+    result = validate_commit_message(message)
+
+    response = result.to_dict()
+    response["valid_types"] = SORTED_COMMIT_TYPES
+
+    if result.is_valid:
+        response["message"] = f"Valid {result.commit_type} commit"
+        if result.scope:
+            response["message"] += f" with scope '{result.scope}'"
+    else:
+        response["message"] = f"Invalid commit message: {result.error}"
+
+    return response
+
+
+async def workflow_generate_branch_name(
+    branch_type: str,
+    description: str,
+    issue_id: str | None = None,
+) -> dict:
+    """Generate a valid branch name following ARC Labs conventions.
+
+    Args:
+        branch_type: Type of branch (feature, bugfix, hotfix, docs, spike, release)
+        description: Short description for the branch
+        issue_id: Optional Linear issue ID (e.g., 'FAVRES-123')
+
+    Returns:
+        Dictionary with generated branch name
+
+    Examples:
+        - branch_type='feature', issue_id='FAVRES-123', description='restaurant search'
+          -> 'feature/FAVRES-123-restaurant-search'
+        - branch_type='docs', description='Update README'
+          -> 'docs/update-readme'
+    """
+    try:
+        branch_name = generate_branch_name(
+            branch_type=branch_type,
+            description=description,
+            issue_id=issue_id,
+        )
+
+        return {
+            "success": True,
+            "branch_name": branch_name,
+            "components": {
+                "type": branch_type,
+                "issue_id": issue_id,
+                "description": description,
+            },
+        }
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "valid_types": SORTED_BRANCH_TYPES,
+        }
+
+
+async def workflow_generate_commit_message(
+    commit_type: str,
+    subject: str,
+    scope: str | None = None,
+) -> dict:
+    """Generate a valid commit message following Conventional Commits.
+
+    Args:
+        commit_type: Type of commit (feat, fix, docs, etc.)
+        subject: The commit subject/description
+        scope: Optional scope of the commit
+
+    Returns:
+        Dictionary with generated commit message
+
+    Examples:
+        - commit_type='feat', scope='search', subject='Add restaurant filtering'
+          -> 'feat(search): add restaurant filtering'
+        - commit_type='fix', subject='Resolve annotation crash'
+          -> 'fix: resolve annotation crash'
+    """
+    try:
+        message = generate_commit_message(
+            commit_type=commit_type,
+            subject=subject,
+            scope=scope,
+        )
+
+        return {
+            "success": True,
+            "commit_message": message,
+            "components": {
+                "type": commit_type,
+                "scope": scope,
+                "subject": subject,
+            },
+        }
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "valid_types": SORTED_COMMIT_TYPES,
+        }
+
+
+async def workflow_get_conventions() -> dict:
+    """Get ARC Labs naming conventions reference.
+
+    Returns a reference of all naming conventions used by ARC Labs Studio.
+    """
+    return _CONVENTIONS_REFERENCE
+
+
+async def workflow_poll_job(job_id: str) -> dict:
+    """Get the status of a feature workflow started with workflow_start_feature_async.
+
+    Args:
+        job_id: Job ID returned by workflow_start_feature_async
+
+    Returns:
+        Dictionary with the job status ('running', 'done' or 'error'). Once
+        the job has finished, it includes the workflow result and the job ID
+        is released, so a finished job can be read only once. Finished jobs
+        that are never polled expire after an hour.
+    """
+    _evict_finished_jobs()
+    task = _JOBS.get(job_id)
+    if task is None:
+        return {
+            "success": False,
+            "error": f"Unknown job '{job_id}'",
+        }
+
+    if not task.done():
+        return {
+            "success": True,
+            "job_id": job_id,
+            "status": "running",
+        }
+
+    del _JOBS[job_id]
+    del _JOB_FINISHED_AT[job_id]
+
+    if task.cancelled():
+        return {
+            "success": False,
+            "job_id": job_id,
+            "status": "error",
+            "error": "Job was cancelled",
+        }
 
-def register_workflow_tools(mcp: FastMCP) -> None:
+    error = task.exception()
+    if error is not None:
+        return {
+            "success": False,
+            "job_id": job_id,
+            "status": "error",
+            "error": str(error),
+        }
+
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": "done",
+        "result": task.result(),
+    }
+
+
+async def workflow_cancel_job(job_id: str) -> dict:
+    """Cancel a feature workflow started with workflow_start_feature_async.
+
+    A running job stops at its next Linear or GitHub call, so an issue it has
+    already created is kept. A finished job's unread result is discarded.
+
+    Args:
+        job_id: Job ID returned by workflow_start_feature_async
+
+    Returns:
+        Dictionary with whether the job was still running when cancelled
+    """
+    task = _JOBS.pop(job_id, None)
+    if task is None:
+        return {
+            "success": False,
+            "error": f"Unknown job '{job_id}'",
+        }
+
+    _JOB_FINISHED_AT.pop(job_id, None)
+
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": "cancelled",
+        "was_running": task.cancel(),
+    }
+
+
+def register_workflow_tools(mcp: FastMCP, settings: Settings) -> None:
     """Register combined workflow MCP tools.
 
     Args:
         mcp: FastMCP server instance
+        settings: Application settings, resolved once and shared by every tool
     """
 
     @mcp.tool()
@@ -50,17 +407,11 @@ def register_workflow_tools(mcp: FastMCP) -> None:
         Returns:
             Dictionary with created issue and branch details
         """
-        settings = get_settings()
-        linear_client = LinearClient(settings)
-        github_client = GitHubClient(settings)
+        linear_client = get_linear_client(settings)
+        github_client = get_github_client(settings)
         repo = repo or settings.default_repo
 
-        result = {
-            "success": False,
-            "issue": None,
-            "branch": None,
-            "next_steps": [],
-        }
+        created_issue: dict | None = None
 
         try:
             # Step 1: Create Linear issue
@@ -79,7 +430,7 @@ def register_workflow_tools(mcp: FastMCP) -> None:
             )
 
             issue = await linear_client.create_issue(request)
-            result["issue"] = issue.to_dict()
+            created_issue = issue.to_dict()
 
             # Step 2: Create GitHub branch
             branch_name = generate_branch_name(
@@ -88,42 +439,43 @@ def register_workflow_tools(mcp: FastMCP) -> None:
                 issue_id=issue.identifier,
             )
 
-            # Check if branch exists
-            existing = await github_client.get_branch(repo, branch_name)
-            if existing:
-                result["success"] = True
-                result["branch"] = {
+            # Create the branch; GitHub reports an existing name as a conflict
+            try:
+                branch = await github_client.create_branch(repo, branch_name)
+            except GitHubBranchExistsError:
+                branch_data = {
                     "name": branch_name,
                     "already_exists": True,
                 }
-                result["message"] = f"Issue {issue.identifier} created. Branch '{branch_name}' already exists."
+                message = f"Issue {issue.identifier} created. Branch '{branch_name}' already exists."
             else:
-                branch = await github_client.create_branch(repo, branch_name)
-                result["branch"] = branch.to_dict()
-                result["success"] = True
-                result["message"] = f"Created issue {issue.identifier} and branch '{branch_name}'"
+                branch_data = branch.to_dict()
+                message = f"Created issue {issue.identifier} and branch '{branch_name}'"
 
-            # Add next steps
-            result["next_steps"] = [
-                f"git fetch origin",
-                f"git checkout {branch_name}",
-                f"# Start working on your feature",
-                f"# When ready, create a PR linking to {issue.identifier}",
-            ]
-
-            return result
+            return {
+                "success": True,
+                "issue": created_issue,
+                "branch": branch_data,
+                "next_steps": [
+                    _NEXT_STEP_FETCH,
+                    f"git checkout {branch_name}",
+                    _NEXT_STEP_WORK,
+                    f"# When ready, create a PR linking to {issue.identifier}",
+                ],
+                "message": message,
+            }
 
         except LinearClientError as e:
             return {
                 "success": False,
                 "error": f"Linear error: {e}",
-                "issue": result.get("issue"),
+                "issue": created_issue,
             }
         except GitHubClientError as e:
             return {
                 "success": False,
                 "error": f"GitHub error: {e}",
-                "issue": result.get("issue"),
+                "issue": created_issue,
                 "message": "Issue was created but branch creation failed",
             }
         except ValueError as e:
@@ -131,209 +483,98 @@ def register_workflow_tools(mcp: FastMCP) -> None:
                 "success": False,
                 "error": str(e),
             }
-        finally:
-            await linear_client.close()
-            await github_client.close()
 
     @mcp.tool()
-    async def workflow_validate_branch_name(branch_name: str) -> dict:
-        """Validate a branch name against ARC Labs conventions.
-
-        Args:
-            branch_name: The branch name to validate
-
-        Returns:
-            Dictionary with validation result and details
-
-        Valid branch format: <type>/<issue-id>-<description>
-        Types: feature, bugfix, hotfix, docs, spike, release
-        Examples:
-            - feature/FAVRES-123-restaurant-search
-            - bugfix/FAVRES-456-map-crash
-            - docs/update-readme
-        """
-        result = validate_branch_name(branch_name)
-
-        response = result.to_dict()
-        response["valid_types"] = sorted(BRANCH_TYPES)
-
-        if result.is_valid:
-            response["message"] = f"Valid {result.branch_type} branch"
-            if result.issue_id:
-                response["message"] += f" for issue {result.issue_id}"
-        else:
-            response["message"] = f"Invalid branch name: {result.error}"
-
-        return response
-
-    @mcp.tool()
-    async def workflow_validate_commit_message(message: str) -> dict:
-        """Validate a commit message against Conventional Commits format.
-
-        Args:
-            message: The commit message to validate
-
-        Returns:
-            Dictionary with validation result and details
-
-        Valid commit format: <type>(<scope>): <subject>
-        Types: feat, fix, docs, style, refactor, perf, test, chore, build, ci, revert
-        Examples:
-            - feat(search): add restaurant filtering
-            - fix(map): resolve annotation crash
-            - docs(readme): update installation steps
-        """
-        result = validate_commit_message(message)
-
-        response = result.to_dict()
-        response["valid_types"] = sorted(COMMIT_TYPES)
-
-        if result.is_valid:
-            response["message"] = f"Valid {result.commit_type} commit"
-            if result.scope:
-                response["message"] += f" with scope '{result.scope}'"
-        else:
-            response["message"] = f"Invalid commit message: {result.error}"
-
-        return response
-
-    @mcp.tool()
-    async def workflow_generate_branch_name(
-        branch_type: str,
-        description: str,
-        issue_id: str | None = None,
+    async def workflow_start_features_batch(
+        titles: list[str],
+        repo: str | None = None,
+        project: str = "FAVRES",
+        priority: int = 3,
+        branch_type: str = "feature",
     ) -> dict:
-        """Generate a valid branch name following ARC Labs conventions.
+        """Start several feature workflows at once.
+
+        Runs workflow_start_feature for every title concurrently, so the
+        Linear and GitHub round-trips of the features overlap instead of
+        adding up. Each feature succeeds or fails on its own.
 
         Args:
-            branch_type: Type of branch (feature, bugfix, hotfix, docs, spike, release)
-            description: Short description for the branch
-            issue_id: Optional Linear issue ID (e.g., 'FAVRES-123')
+            titles: Feature titles, one issue and branch per title
+            repo: GitHub repository name (defaults to configured default)
+            project: Linear project/team key (default: 'FAVRES')
+            priority: Issue priority (1=Urgent, 2=High, 3=Normal, 4=Low)
+            branch_type: Type of branch (default: 'feature')
 
         Returns:
-            Dictionary with generated branch name
-
-        Examples:
-            - branch_type='feature', issue_id='FAVRES-123', description='restaurant search'
-              -> 'feature/FAVRES-123-restaurant-search'
-            - branch_type='docs', description='Update README'
-              -> 'docs/update-readme'
+            Dictionary with one workflow_start_feature result per title, in order
         """
-        try:
-            branch_name = generate_branch_name(
-                branch_type=branch_type,
-                description=description,
-                issue_id=issue_id,
+        results = await asyncio.gather(
+            *(
+                workflow_start_feature(
+                    title=title,
+                    repo=repo,
+                    project=project,
+                    priority=priority,
+                    branch_type=branch_type,
+                )
+                for title in titles
             )
+        )
 
-            return {
-                "success": True,
-                "branch_name": branch_name,
-                "components": {
-                    "type": branch_type,
-                    "issue_id": issue_id,
-                    "description": description,
-                },
-            }
-        except ValueError as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "valid_types": sorted(BRANCH_TYPES),
-            }
+        return {
+            "success": all(result["success"] for result in results),
+            "count": len(results),
+            "results": results,
+        }
 
     @mcp.tool()
-    async def workflow_generate_commit_message(
-        commit_type: str,
-        subject: str,
-        scope: str | None = None,
+    async def workflow_start_feature_async(
+        title: str,
+        description: str | None = None,
+        repo: str | None = None,
+        project: str = "FAVRES",
+        priority: int = 3,
+        branch_type: str = "feature",
     ) -> dict:
-        """Generate a valid commit message following Conventional Commits.
+        """Start a feature workflow in the background and return a job ID.
+
+        Same as workflow_start_feature, but returns immediately instead of
+        waiting for the Linear and GitHub calls. Use workflow_poll_job with
+        the returned job ID to get the result, or workflow_cancel_job to stop it.
 
         Args:
-            commit_type: Type of commit (feat, fix, docs, etc.)
-            subject: The commit subject/description
-            scope: Optional scope of the commit
+            title: Feature title (used for both issue and branch)
+            description: Optional description for the Linear issue
+            repo: GitHub repository name (defaults to configured default)
+            project: Linear project/team key (default: 'FAVRES')
+            priority: Issue priority (1=Urgent, 2=High, 3=Normal, 4=Low)
+            branch_type: Type of branch (default: 'feature')
 
         Returns:
-            Dictionary with generated commit message
-
-        Examples:
-            - commit_type='feat', scope='search', subject='Add restaurant filtering'
-              -> 'feat(search): add restaurant filtering'
-            - commit_type='fix', subject='Resolve annotation crash'
-              -> 'fix: resolve annotation crash'
+            Dictionary with the job ID and its initial status
         """
-        try:
-            message = generate_commit_message(
-                commit_type=commit_type,
-                subject=subject,
-                scope=scope,
+        job_id = _start_job(
+            workflow_start_feature(
+                title=title,
+                description=description,
+                repo=repo,
+                project=project,
+                priority=priority,
+                branch_type=branch_type,
             )
+        )
 
-            return {
-                "success": True,
-                "commit_message": message,
-                "components": {
-                    "type": commit_type,
-                    "scope": scope,
-                    "subject": subject,
-                },
-            }
-        except ValueError as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "valid_types": sorted(COMMIT_TYPES),
-            }
-
-    @mcp.tool()
-    async def workflow_get_conventions() -> dict:
-        """Get ARC Labs naming conventions reference.
-
-        Returns a reference of all naming conventions used by ARC Labs Studio.
-        """
         return {
-            "branch_naming": {
-                "format": "<type>/<issue-id>-<description>",
-                "types": sorted(BRANCH_TYPES),
-                "examples": [
-                    "feature/FAVRES-123-restaurant-search",
-                    "bugfix/FAVRES-456-map-crash",
-                    "hotfix/FAVRES-789-auth-fix",
-                    "docs/update-readme",
-                    "spike/swiftui-animations",
-                    "release/1.2.0",
-                ],
-            },
-            "commit_format": {
-                "format": "<type>(<scope>): <subject>",
-                "types": sorted(COMMIT_TYPES),
-                "examples": [
-                    "feat(search): add restaurant filtering",
-                    "fix(map): resolve annotation crash",
-                    "docs(readme): update installation steps",
-                    "refactor: simplify auth flow",
-                ],
-                "rules": [
-                    "Subject should be lowercase",
-                    "No period at the end of subject",
-                    "Maximum 100 characters for first line",
-                    "Use imperative mood (add, fix, update, not added, fixed, updated)",
-                ],
-            },
-            "pr_naming": {
-                "format": "<Type>/<Issue-ID>: <Title>",
-                "examples": [
-                    "Feature/FAVRES-123: Restaurant Search Implementation",
-                    "Bugfix/FAVRES-456: Map Annotation Crash Fix",
-                    "Hotfix/FAVRES-789: Authentication Token Refresh",
-                ],
-            },
-            "linear_priority": {
-                "1": "Urgent",
-                "2": "High",
-                "3": "Normal (default)",
-                "4": "Low",
-            },
+            "success": True,
+            "job_id": job_id,
+            "status": "running",
         }
+
+    # Tools that don't depend on settings are defined at module level
+    mcp.tool()(workflow_validate_branch_name)
+    mcp.tool()(workflow_validate_commit_message)
+    mcp.tool()(workflow_generate_branch_name)
+    mcp.tool()(workflow_generate_commit_message)
+    mcp.tool()(workflow_get_conventions)
+    mcp.tool()(workflow_poll_job)
+    mcp.tool()(workflow_cancel_job)
@@ -14,15 +14,29 @@ Examples:
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from arc_linear_github_mcp.config.standards import (
-    BRANCH_PATTERN,
+    BRANCH_RE,
     BRANCH_TYPES,
-    ISSUE_ID_PATTERN,
+    BRANCH_TYPES_JOINED,
+    ISSUE_ID_RE,
 )
 
+# Names that can't be used for a working branch
+_RESERVED_BRANCH_NAMES = frozenset({"main", "master", "develop", "HEAD"})
 
-@dataclass
+# Branch types keyed by their three-letter prefix, which is unique per type
+_BRANCH_TYPE_BY_PREFIX = {branch_type[:3]: branch_type for branch_type in BRANCH_TYPES}
+
+# Description normalization passes, compiled once for _normalize_description.
+# Invalid characters are dropped first, so any run of separators and hyphens
+# left over collapses to a single hyphen in the second pass.
+_INVALID_CHAR_RE = re.compile(r"[^a-z0-9\s_-]+")
+_SEPARATOR_RUN_RE = re.compile(r"[\s_-]+")
+
+
+@dataclass(frozen=True, slots=True)
 class BranchValidationResult:
     """Result of branch name validation."""
 
@@ -31,7 +45,7 @@ class BranchValidationResult:
     issue_id: str | None = None
     description: str | None = None
     error: str | None = None
-    suggestions: list[str] | None = None
+    suggestions: tuple[str, ...] | None = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for MCP response."""
@@ -45,6 +59,8 @@ class BranchValidationResult:
         }
 
 
+# Results are immutable, so repeated names share one cached result
+@lru_cache(maxsize=2048)
 def validate_branch_name(branch_name: str) -> BranchValidationResult:
     """Validate a branch name against ARC Labs conventions.
 
@@ -61,38 +77,22 @@ def validate_branch_name(branch_name: str) -> BranchValidationResult:
         )
 
     # Check for reserved names
-    reserved_names = {"main", "master", "develop", "HEAD"}
-    if branch_name in reserved_names:
+    if branch_name in _RESERVED_BRANCH_NAMES:
         return BranchValidationResult(
             is_valid=False,
             error=f"'{branch_name}' is a reserved branch name",
         )
 
-    # Try to match the pattern
-    match = re.match(BRANCH_PATTERN, branch_name)
-
-    if not match:
-        # Provide helpful error message
-        suggestions = _generate_suggestions(branch_name)
-
-        # Check if it has a slash
-        if "/" not in branch_name:
-            error = "Branch name must include a type prefix (e.g., feature/, bugfix/)"
-        elif branch_name.split("/")[0] not in BRANCH_TYPES:
-            branch_type = branch_name.split("/")[0]
-            error = f"Invalid branch type '{branch_type}'. Valid types: {', '.join(sorted(BRANCH_TYPES))}"
-        else:
-            error = "Branch name format is invalid. Expected: <type>/<issue-id>-<description> or <type>/<description>"
+    groups = _match_branch(branch_name)
 
+    if groups is None:
         return BranchValidationResult(
             is_valid=False,
-            error=error,
-            suggestions=suggestions,
+            error=_get_error_message(branch_name),
+            suggestions=_generate_suggestions(branch_name),
         )
 
-    branch_type = match.group(1)
-    issue_id = match.group(2)
-    description = match.group(3)
+    branch_type, issue_id, description = groups
 
     return BranchValidationResult(
         is_valid=True,
@@ -111,8 +111,8 @@ def parse_branch_name(branch_name: str) -> tuple[str | None, str | None, str | N
     Returns:
         Tuple of (branch_type, issue_id, description)
     """
-    result = validate_branch_name(branch_name)
-    return result.branch_type, result.issue_id, result.description
+    groups = _match_branch(branch_name)
+    return groups if groups is not None else (None, None, None)
 
 
 def generate_branch_name(
@@ -131,19 +131,19 @@ def generate_branch_name(
         A valid branch name
 
     Raises:
-        ValueError: If branch_type is invalid or description is empty
+        ValueError: If branch_type, issue_id or description is invalid
     """
     # Validate branch type
     if branch_type not in BRANCH_TYPES:
         raise ValueError(
-            f"Invalid branch type '{branch_type}'. Valid types: {', '.join(sorted(BRANCH_TYPES))}"
+            f"Invalid branch type '{branch_type}'. Valid types: {BRANCH_TYPES_JOINED}"
         )
 
     if not description:
         raise ValueError("Description cannot be empty")
 
     # Validate issue ID format if provided
-    if issue_id and not re.match(ISSUE_ID_PATTERN, issue_id):
+    if issue_id and not ISSUE_ID_RE.match(issue_id):
         raise ValueError(
             f"Invalid issue ID format '{issue_id}'. Expected format: PROJECT-123"
         )
@@ -161,6 +161,38 @@ def generate_branch_name(
         return f"{branch_type}/{normalized_description}"
 
 
+def _match_branch(branch_name: str) -> tuple[str, str | None, str] | None:
+    """Match a branch name against the naming convention.
+
+    Args:
+        branch_name: The branch name to match
+
+    Returns:
+        Tuple of (branch_type, issue_id, description), or None if the name
+        doesn't follow the convention
+    """
+    # Reject a missing or unknown type prefix before running the full pattern
+    slash = branch_name.find("/")
+    if slash == -1 or branch_name[:slash] not in BRANCH_TYPES:
+        return None
+
+    match = BRANCH_RE.match(branch_name)
+    return match.groups() if match else None
+
+
+def _get_error_message(branch_name: str) -> str:
+    """Generate a helpful error message for an invalid branch name."""
+    slash = branch_name.find("/")
+    if slash == -1:
+        return "Branch name must include a type prefix (e.g., feature/, bugfix/)"
+
+    branch_type = branch_name[:slash]
+    if branch_type not in BRANCH_TYPES:
+        return f"Invalid branch type '{branch_type}'. Valid types: {BRANCH_TYPES_JOINED}"
+
+    return "Branch name format is invalid. Expected: <type>/<issue-id>-<description> or <type>/<description>"
+
+
 def _normalize_description(description: str) -> str:
     """Normalize a description for use in a branch name.
 
@@ -170,25 +202,17 @@ def _normalize_description(description: str) -> str:
     - Collapses multiple hyphens
     - Trims leading/trailing hyphens
     """
-    # Convert to lowercase
-    normalized = description.lower()
-
-    # Replace spaces and underscores with hyphens
-    normalized = re.sub(r"[\s_]+", "-", normalized)
-
-    # Remove invalid characters (keep only alphanumeric and hyphens)
-    normalized = re.sub(r"[^a-z0-9-]", "", normalized)
-
-    # Collapse multiple hyphens
-    normalized = re.sub(r"-+", "-", normalized)
+    # Remove invalid characters (keep alphanumerics, separators and hyphens)
+    normalized = _INVALID_CHAR_RE.sub("", description.lower())
 
-    # Trim leading/trailing hyphens
-    normalized = normalized.strip("-")
+    # Turn each run of spaces, underscores and hyphens into one hyphen, then
+    # trim leading/trailing hyphens
+    normalized = _SEPARATOR_RUN_RE.sub("-", normalized).strip("-")
 
     return normalized
 
 
-def _generate_suggestions(branch_name: str) -> list[str]:
+def _generate_suggestions(branch_name: str) -> tuple[str, ...]:
     """Generate suggestions for fixing an invalid branch name."""
     suggestions: list[str] = []
 
@@ -200,12 +224,11 @@ def _generate_suggestions(branch_name: str) -> list[str]:
         rest = "-".join(parts[1:])
 
         # Try to match to a valid type
-        for valid_type in BRANCH_TYPES:
-            if potential_type.startswith(valid_type[:3]):
-                normalized = _normalize_description(rest)
-                if normalized:
-                    suggestions.append(f"{valid_type}/{normalized}")
-                break
+        valid_type = _BRANCH_TYPE_BY_PREFIX.get(potential_type[:3])
+        if valid_type:
+            normalized = _normalize_description(rest)
+            if normalized:
+                suggestions.append(f"{valid_type}/{normalized}")
 
     # If no type detected, suggest common types
     if not suggestions:
@@ -214,4 +237,4 @@ def _generate_suggestions(branch_name: str) -> list[str]:
             suggestions.append(f"feature/{normalized}")
             suggestions.append(f"bugfix/{normalized}")
 
-    return suggestions[:3]  # Limit to 3 suggestions
+    return tuple(suggestions[:3])  # Limit to 3 suggestions
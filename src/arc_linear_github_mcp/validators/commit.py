@@ -14,15 +14,50 @@ Examples:
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from arc_linear_github_mcp.config.standards import (
-    COMMIT_PATTERN,
+    COMMIT_RE,
     COMMIT_TYPE_DESCRIPTIONS,
     COMMIT_TYPES,
+    COMMIT_TYPES_JOINED,
+    SORTED_COMMIT_TYPES,
 )
 
-
-@dataclass
+# "<type>" or "<type>(<scope>)" before the colon, for error reporting
+_TYPE_SCOPE_RE = re.compile(r"^(\w+)(?:\(([^)]+)\))?$")
+
+# Keywords used to guess a commit type, grouped by type in priority order
+_KEYWORD_TYPES = {
+    "add": "feat",
+    "new": "feat",
+    "create": "feat",
+    "implement": "feat",
+    "fix": "fix",
+    "bug": "fix",
+    "issue": "fix",
+    "resolve": "fix",
+    "doc": "docs",
+    "readme": "docs",
+    "comment": "docs",
+    "refactor": "refactor",
+    "clean": "refactor",
+    "simplify": "refactor",
+}
+_KEYWORD_TYPE_ORDER = tuple(dict.fromkeys(_KEYWORD_TYPES.values()))
+_KEYWORD_RANK = {
+    keyword: _KEYWORD_TYPE_ORDER.index(commit_type)
+    for keyword, commit_type in _KEYWORD_TYPES.items()
+}
+# A lookahead so overlapping keywords (e.g. "doc" in "docreate") are all seen
+# in one scan of the message
+_KEYWORD_RE = re.compile(f"(?=({'|'.join(_KEYWORD_TYPES)}))")
+
+# Commit types with their lengths, for stripping a type prefix off a message
+_COMMIT_TYPE_LENGTHS = tuple((commit_type, len(commit_type)) for commit_type in SORTED_COMMIT_TYPES)
+
+
+@dataclass(frozen=True, slots=True)
 class CommitValidationResult:
     """Result of commit message validation."""
 
@@ -31,7 +66,7 @@ class CommitValidationResult:
     scope: str | None = None
     subject: str | None = None
     error: str | None = None
-    suggestions: list[str] | None = None
+    suggestions: tuple[str, ...] | None = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for MCP response."""
@@ -45,6 +80,8 @@ class CommitValidationResult:
         }
 
 
+# Results are immutable, so repeated messages share one cached result
+@lru_cache(maxsize=2048)
 def validate_commit_message(message: str) -> CommitValidationResult:
     """Validate a commit message against Conventional Commits format.
 
@@ -76,10 +113,9 @@ def validate_commit_message(message: str) -> CommitValidationResult:
             error=f"Commit message too long ({len(first_line)} chars). Maximum is 100 characters.",
         )
 
-    # Try to match the pattern
-    match = re.match(COMMIT_PATTERN, first_line)
+    groups = _match_commit(first_line)
 
-    if not match:
+    if groups is None:
         suggestions = _generate_suggestions(first_line)
         error = _get_error_message(first_line)
 
@@ -89,30 +125,30 @@ def validate_commit_message(message: str) -> CommitValidationResult:
             suggestions=suggestions,
         )
 
-    commit_type = match.group(1)
-    scope = match.group(2)
-    subject = match.group(3)
+    commit_type, scope, subject = groups
 
-    # Validate subject doesn't start with capital
-    if subject and subject[0].isupper():
-        return CommitValidationResult(
-            is_valid=False,
-            commit_type=commit_type,
-            scope=scope,
-            subject=subject,
-            error="Subject should start with lowercase letter",
-            suggestions=[f"{commit_type}({scope}): {subject[0].lower()}{subject[1:]}" if scope else f"{commit_type}: {subject[0].lower()}{subject[1:]}"],
-        )
+    # Check the subject's first letter and trailing period together, so a
+    # single suggestion fixes both
+    needs_lower = bool(subject) and subject[0].isupper()
+    needs_depunct = bool(subject) and subject.endswith(".")
+
+    if needs_lower or needs_depunct:
+        fixed = subject
+        errors: list[str] = []
+        if needs_lower:
+            fixed = fixed[0].lower() + fixed[1:]
+            errors.append("Subject should start with lowercase letter")
+        if needs_depunct:
+            fixed = fixed[:-1]
+            errors.append("Subject should not end with a period")
 
-    # Validate subject doesn't end with period
-    if subject and subject.endswith("."):
         return CommitValidationResult(
             is_valid=False,
             commit_type=commit_type,
             scope=scope,
             subject=subject,
-            error="Subject should not end with a period",
-            suggestions=[f"{commit_type}({scope}): {subject[:-1]}" if scope else f"{commit_type}: {subject[:-1]}"],
+            error="; ".join(errors),
+            suggestions=(f"{commit_type}({scope}): {fixed}" if scope else f"{commit_type}: {fixed}",),
         )
 
     return CommitValidationResult(
@@ -132,8 +168,11 @@ def parse_commit_message(message: str) -> tuple[str | None, str | None, str | No
     Returns:
         Tuple of (commit_type, scope, subject)
     """
-    result = validate_commit_message(message)
-    return result.commit_type, result.scope, result.subject
+    if not message:
+        return None, None, None
+
+    groups = _match_commit(message.split("\n")[0].strip())
+    return groups if groups is not None else (None, None, None)
 
 
 def generate_commit_message(
@@ -156,7 +195,7 @@ def generate_commit_message(
     """
     if commit_type not in COMMIT_TYPES:
         raise ValueError(
-            f"Invalid commit type '{commit_type}'. Valid types: {', '.join(sorted(COMMIT_TYPES))}"
+            f"Invalid commit type '{commit_type}'. Valid types: {COMMIT_TYPES_JOINED}"
         )
 
     if not subject:
@@ -192,6 +231,29 @@ def get_commit_type_description(commit_type: str) -> str | None:
     return COMMIT_TYPE_DESCRIPTIONS.get(commit_type)
 
 
+def _match_commit(first_line: str) -> tuple[str, str | None, str] | None:
+    """Match the first line of a commit message against the convention.
+
+    Args:
+        first_line: Stripped first line of the message
+
+    Returns:
+        Tuple of (commit_type, scope, subject), or None if the line is too
+        long or doesn't follow the format
+    """
+    if len(first_line) > 100:
+        return None
+
+    # The type runs up to the first "(" or ":"; only run the full pattern
+    # when it is a known one
+    colon = first_line.find(":")
+    if colon == -1 or first_line[:colon].split("(", 1)[0] not in COMMIT_TYPES:
+        return None
+
+    match = COMMIT_RE.match(first_line)
+    return match.groups() if match else None
+
+
 def _get_error_message(message: str) -> str:
     """Generate a helpful error message for an invalid commit."""
     # Check if it has a colon
@@ -202,7 +264,7 @@ def _get_error_message(message: str) -> str:
     type_part = parts[0].strip()
 
     # Check for type with optional scope
-    type_match = re.match(r"^(\w+)(?:\(([^)]+)\))?$", type_part)
+    type_match = _TYPE_SCOPE_RE.match(type_part)
 
     if not type_match:
         return "Invalid format before colon. Expected: <type> or <type>(<scope>)"
@@ -210,7 +272,7 @@ def _get_error_message(message: str) -> str:
     potential_type = type_match.group(1)
 
     if potential_type not in COMMIT_TYPES:
-        return f"Invalid commit type '{potential_type}'. Valid types: {', '.join(sorted(COMMIT_TYPES))}"
+        return f"Invalid commit type '{potential_type}'. Valid types: {COMMIT_TYPES_JOINED}"
 
     # Subject issues
     if len(parts) > 1:
@@ -221,7 +283,7 @@ def _get_error_message(message: str) -> str:
     return "Commit message format is invalid. Expected: <type>(<scope>): <subject>"
 
 
-def _generate_suggestions(message: str) -> list[str]:
+def _generate_suggestions(message: str) -> tuple[str, ...]:
     """Generate suggestions for fixing an invalid commit message."""
     suggestions: list[str] = []
 
@@ -230,9 +292,10 @@ def _generate_suggestions(message: str) -> list[str]:
     cleaned = message.strip()
 
     # Check for common patterns and try to fix them
-    for commit_type in COMMIT_TYPES:
-        if cleaned.lower().startswith(commit_type):
-            rest = cleaned[len(commit_type):].strip()
+    lower_cleaned = cleaned.lower()
+    for commit_type, type_length in _COMMIT_TYPE_LENGTHS:
+        if lower_cleaned.startswith(commit_type):
+            rest = cleaned[type_length:].strip()
             if rest.startswith(":"):
                 rest = rest[1:].strip()
             if rest.startswith("-"):
@@ -247,28 +310,32 @@ def _generate_suggestions(message: str) -> list[str]:
 
     # If no type detected, try to guess from content
     if not suggestions:
-        lower_message = message.lower()
+        guessed_type = _guess_commit_type(lower_cleaned)
+        suggestions.append(f"{guessed_type}: {_normalize_subject(message)}")
+
+    return tuple(suggestions[:3])
 
-        if any(word in lower_message for word in ["add", "new", "create", "implement"]):
-            suggestions.append(f"feat: {_normalize_subject(message)}")
-        elif any(word in lower_message for word in ["fix", "bug", "issue", "resolve"]):
-            suggestions.append(f"fix: {_normalize_subject(message)}")
-        elif any(word in lower_message for word in ["doc", "readme", "comment"]):
-            suggestions.append(f"docs: {_normalize_subject(message)}")
-        elif any(word in lower_message for word in ["refactor", "clean", "simplify"]):
-            suggestions.append(f"refactor: {_normalize_subject(message)}")
-        else:
-            suggestions.append(f"chore: {_normalize_subject(message)}")
 
-    return suggestions[:3]
+def _guess_commit_type(lower_message: str) -> str:
+    """Guess a commit type from keywords anywhere in a lowercased message.
+
+    Keywords match as substrings. When several match, the type listed first
+    in _KEYWORD_TYPES wins; "chore" is the fallback.
+    """
+    best_rank = min(
+        (_KEYWORD_RANK[match[1]] for match in _KEYWORD_RE.finditer(lower_message)),
+        default=None,
+    )
+    return "chore" if best_rank is None else _KEYWORD_TYPE_ORDER[best_rank]
 
 
 def _normalize_subject(message: str) -> str:
     """Normalize a message to be used as a subject."""
     # Remove any existing type prefixes
-    for commit_type in COMMIT_TYPES:
-        if message.lower().startswith(commit_type):
-            message = message[len(commit_type):].strip()
+    lower_message = message.lower()
+    for commit_type, type_length in _COMMIT_TYPE_LENGTHS:
+        if lower_message.startswith(commit_type):
+            message = message[type_length:].strip()
             if message.startswith(":"):
                 message = message[1:].strip()
             break
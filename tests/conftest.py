@@ -1,23 +1,28 @@
 """Pytest configuration and fixtures."""
 
-import os
+from collections.abc import Iterator
 
 import pytest
 
 
-@pytest.fixture(autouse=True)
-def mock_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Set mock environment variables for testing."""
-    monkeypatch.setenv("LINEAR_API_KEY", "lin_api_test_key")
-    monkeypatch.setenv("GITHUB_TOKEN", "ghp_test_token")
-    monkeypatch.setenv("GITHUB_ORG", "test-org")
-    monkeypatch.setenv("DEFAULT_PROJECT", "TEST")
-    monkeypatch.setenv("DEFAULT_REPO", "TestRepo")
+@pytest.fixture(autouse=True, scope="session")
+def mock_env_vars() -> Iterator[None]:
+    """Set mock environment variables once for the whole test session."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("LINEAR_API_KEY", "lin_api_test_key")
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test_token")
+        monkeypatch.setenv("GITHUB_ORG", "test-org")
+        monkeypatch.setenv("DEFAULT_PROJECT", "TEST")
+        monkeypatch.setenv("DEFAULT_REPO", "TestRepo")
+        yield
 
 
 @pytest.fixture
 def clear_settings_cache() -> None:
-    """Clear the settings LRU cache."""
+    """Clear the settings LRU cache, for tests that change settings.
+
+    The session-wide environment from mock_env_vars is always in place first.
+    """
     from arc_linear_github_mcp.config.settings import get_settings
 
     get_settings.cache_clear()
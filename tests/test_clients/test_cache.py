@@ -0,0 +1,96 @@
+"""Tests for the in-memory caches shared by the API clients."""
+
+import asyncio
+
+import pytest
+
+from arc_linear_github_mcp.clients.cache import AsyncTTLCache
+
+
+class TestAsyncTTLCache:
+    """Tests for AsyncTTLCache."""
+
+    async def test_concurrent_lookups_share_one_call(self) -> None:
+        """Test that simultaneous misses for one key run a single call."""
+        calls = 0
+
+        async def produce() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return "value"
+
+        cache = AsyncTTLCache()
+        results = await asyncio.gather(*(cache.get_or_call("key", produce) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert calls == 1
+
+    async def test_failures_are_not_cached(self) -> None:
+        """Test that a failed call is retried on the next lookup."""
+        attempts = 0
+
+        async def produce() -> int:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("boom")
+            return attempts
+
+        cache = AsyncTTLCache()
+        with pytest.raises(RuntimeError):
+            await cache.get_or_call("key", produce)
+
+        assert await cache.get_or_call("key", produce) == 2
+
+    async def test_none_results_are_not_cached(self) -> None:
+        """Test that a lookup that found nothing is repeated on the next call."""
+        results = [None, "found"]
+
+        async def produce() -> str | None:
+            return results.pop(0)
+
+        cache = AsyncTTLCache()
+
+        assert await cache.get_or_call("key", produce) is None
+        assert await cache.get_or_call("key", produce) == "found"
+        assert await cache.get_or_call("key", produce) == "found"
+
+    async def test_expired_entries_are_refetched(self) -> None:
+        """Test that an entry past its TTL triggers a new call."""
+        calls = 0
+
+        async def produce() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        cache = AsyncTTLCache(ttl=0)
+
+        assert await cache.get_or_call("key", produce) == 1
+        assert await cache.get_or_call("key", produce) == 2
+
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Test that the cache never grows past maxsize."""
+
+        async def produce() -> str:
+            return "value"
+
+        cache = AsyncTTLCache(maxsize=2)
+        for key in ("a", "b", "c"):
+            await cache.get_or_call(key, produce)
+
+        assert len(cache) == 2
+
+    async def test_set_value_is_returned_without_calling(self) -> None:
+        """Test that a stored value short-circuits the call."""
+
+        async def produce() -> str:
+            raise AssertionError("should not be called")
+
+        cache = AsyncTTLCache()
+        cache.set("key", "stored")
+
+        assert await cache.get_or_call("key", produce) == "stored"
+        cache.discard("key")
+        assert len(cache) == 0
@@ -0,0 +1,756 @@
+"""Tests for the GitHub REST client."""
+
+import json
+from collections.abc import Callable
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from arc_linear_github_mcp.clients.github import (
+    GitHubBranchExistsError,
+    GitHubClient,
+    GitHubClientError,
+    GitHubNotFoundError,
+    GitHubValidationError,
+    _fast_url,
+)
+from arc_linear_github_mcp.config.settings import Settings
+from arc_linear_github_mcp.models.github import Branch, PullRequest, branches_to_dicts, prs_to_dicts
+
+REPO_PAYLOAD = {
+    "id": 1,
+    "name": "TestRepo",
+    "full_name": "test-org/TestRepo",
+    "html_url": "https://github.com/test-org/TestRepo",
+    "default_branch": "main",
+}
+
+
+def make_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+    **overrides: object,
+) -> GitHubClient:
+    """Create a GitHubClient whose HTTP traffic is served by ``handler``."""
+    return GitHubClient(Settings(**overrides), transport=httpx.MockTransport(handler))
+
+
+class TestResponseCache:
+    """Tests for GET response caching in GitHubClient."""
+
+    async def test_fresh_get_is_served_from_cache(self) -> None:
+        """Test that a repeated GET within the TTL makes a single request."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=REPO_PAYLOAD)
+
+        client = make_client(handler)
+        first = await client.get_repository("TestRepo")
+        second = await client.get_repository("TestRepo")
+
+        assert first == second
+        assert len(requests) == 1
+        await client.close()
+
+    async def test_stale_entry_is_revalidated_with_etag(self) -> None:
+        """Test that a stale entry sends If-None-Match and reuses the body on 304."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"abc"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=REPO_PAYLOAD, headers={"ETag": '"abc"'})
+
+        client = make_client(handler, github_cache_ttl=0)
+        await client.get_repository("TestRepo")
+        repository = await client.get_repository("TestRepo")
+
+        assert repository.default_branch == "main"
+        assert len(requests) == 2
+        assert requests[1].headers["If-None-Match"] == '"abc"'
+        await client.close()
+
+    async def test_polled_list_revalidates_within_ttl(self) -> None:
+        """Test that list_pull_requests revalidates a fresh entry with its ETag."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"pulls"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=[], headers={"ETag": '"pulls"'})
+
+        client = make_client(handler)
+        await client.list_pull_requests("TestRepo")
+        pulls = await client.list_pull_requests("TestRepo")
+
+        assert pulls == []
+        assert len(requests) == 2
+        assert requests[1].headers["If-None-Match"] == '"pulls"'
+        await client.close()
+
+    async def test_pull_request_revalidates_within_ttl(self) -> None:
+        """Test that get_pull_request revalidates a fresh entry with its ETag."""
+        requests: list[httpx.Request] = []
+        item = {
+            "id": 42,
+            "number": 7,
+            "title": "Feature/TEST-1: Search",
+            "state": "open",
+            "html_url": "https://github.com/test-org/TestRepo/pull/7",
+            "head": {"ref": "feature/TEST-1-search", "sha": "aaa"},
+            "base": {"ref": "main", "sha": "bbb"},
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"pull"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=item, headers={"ETag": '"pull"'})
+
+        client = make_client(handler)
+        await client.get_pull_request("TestRepo", 7)
+        pr = await client.get_pull_request("TestRepo", 7)
+
+        assert pr is not None and pr.number == 7
+        assert len(requests) == 2
+        assert requests[1].headers["If-None-Match"] == '"pull"'
+        await client.close()
+
+    async def test_not_modified_reuses_parsed_models(self) -> None:
+        """Test that a 304 hands back the cached models in a fresh list."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"branches"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json=[{"name": "main", "commit": {"sha": "abc"}}],
+                headers={"ETag": '"branches"'},
+            )
+
+        client = make_client(handler)
+        first = await client.list_branches("TestRepo")
+        second = await client.list_branches("TestRepo")
+
+        assert second is not first
+        assert second[0] is first[0]
+        await client.close()
+
+    async def test_write_clears_cache(self) -> None:
+        """Test that a non-GET request invalidates cached responses."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.method == "DELETE":
+                return httpx.Response(204)
+            return httpx.Response(200, json=REPO_PAYLOAD)
+
+        client = make_client(handler)
+        await client.get_repository("TestRepo")
+        await client.delete_branch("TestRepo", "feature/old")
+        await client.get_repository("TestRepo")
+
+        assert [r.method for r in requests] == ["GET", "DELETE", "GET"]
+        await client.close()
+
+    @pytest.mark.parametrize("repo", ["TestRepo", "test-org/TestRepo"])
+    async def test_default_branch_is_memoized(self, repo: str) -> None:
+        """Test that the default branch is only looked up once per repo."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=REPO_PAYLOAD)
+
+        client = make_client(handler, github_cache_ttl=0)
+
+        assert await client.get_default_branch(repo) == "main"
+        assert await client.get_default_branch(repo) == "main"
+        assert len(requests) == 1
+        await client.close()
+
+    async def test_default_branch_memo_shared_across_repo_spellings(self) -> None:
+        """Test that 'Repo' and 'org/Repo' resolve to the same memoized entry."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=REPO_PAYLOAD)
+
+        client = make_client(handler, github_cache_ttl=0)
+
+        assert await client.get_default_branch("TestRepo") == "main"
+        assert await client.get_default_branch("test-org/TestRepo") == "main"
+        assert len(requests) == 1
+        await client.close()
+
+
+class TestBulk:
+    """Tests for the multi-repository helpers."""
+
+    async def test_get_repositories_preserves_order(self) -> None:
+        """Test that repositories come back in the order they were requested."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            name = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={**REPO_PAYLOAD, "name": name})
+
+        client = make_client(handler)
+        repositories = await client.get_repositories(["Alpha", "Beta", "other-org/Gamma"])
+
+        assert [r.name for r in repositories] == ["Alpha", "Beta", "Gamma"]
+        await client.close()
+
+    async def test_list_pull_requests_bulk_keys_by_repo(self) -> None:
+        """Test that each repository's pull requests are returned under its name."""
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(200, json=[])
+
+        client = make_client(handler)
+        result = await client.list_pull_requests_bulk(["Alpha", "Beta"])
+
+        assert result == {"Alpha": [], "Beta": []}
+        assert sorted(paths) == ["/repos/test-org/Alpha/pulls", "/repos/test-org/Beta/pulls"]
+        await client.close()
+
+
+class TestCreateBranch:
+    """Tests for GitHubClient.create_branch."""
+
+    async def test_resolves_base_sha_from_git_ref(self) -> None:
+        """Test that the base SHA comes from a single git ref lookup."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path.endswith("/git/ref/heads/develop"):
+                return httpx.Response(200, json={"object": {"sha": "abc123"}})
+            if request.method == "POST":
+                return httpx.Response(201, json={"object": {"sha": "abc123"}})
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        client = make_client(handler)
+        branch = await client.create_branch("TestRepo", "feature/new", "develop")
+
+        assert branch.sha == "abc123"
+        assert [r.method for r in requests] == ["GET", "POST"]
+        assert json.loads(requests[1].content) == {
+            "ref": "refs/heads/feature/new",
+            "sha": "abc123",
+        }
+        await client.close()
+
+    async def test_base_sha_is_not_served_stale_from_cache(self) -> None:
+        """Test that a cached base ref is revalidated before branching from it."""
+        base_sha = "old"
+        posted: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                posted.append(json.loads(request.content))
+                return httpx.Response(201, json={"object": {"sha": posted[-1]["sha"]}})
+            return httpx.Response(200, json={"object": {"sha": base_sha}})
+
+        client = make_client(handler)
+        await client._request("GET", "/repos/test-org/TestRepo/git/ref/heads/develop")
+        base_sha = "new"
+        await client.create_branch("TestRepo", "feature/new", "develop")
+
+        assert posted[0]["sha"] == "new"
+        await client.close()
+
+    @pytest.mark.parametrize(
+        ("message", "error"),
+        [
+            ("Reference already exists", GitHubBranchExistsError),
+            ("Invalid request", GitHubValidationError),
+        ],
+    )
+    async def test_conflict_raises_branch_exists(
+        self, message: str, error: type[GitHubClientError]
+    ) -> None:
+        """Test that only GitHub's existing-ref 422 is reported as an existing branch."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(422, json={"message": message})
+            return httpx.Response(200, json={"object": {"sha": "abc123"}})
+
+        client = make_client(handler)
+        with pytest.raises(error) as exc_info:
+            await client.create_branch("TestRepo", "feature/new", "develop")
+
+        assert (exc_info.type is GitHubBranchExistsError) == (error is GitHubBranchExistsError)
+        await client.close()
+
+
+class TestPagination:
+    """Tests for fetching all pages of list endpoints."""
+
+    async def test_all_pages_follows_last_link(self) -> None:
+        """Test that all_pages fetches up to the page named by rel=last."""
+        pages: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = request.url.params["page"]
+            pages.append(page)
+            headers = {}
+            if page == "1":
+                headers["Link"] = (
+                    '<https://api.github.com/repositories/1/branches?per_page=2&page=2>; rel="next", '
+                    '<https://api.github.com/repositories/1/branches?per_page=2&page=3>; rel="last"'
+                )
+            items = [{"name": f"branch-{page}-{i}", "commit": {"sha": "abc"}} for i in range(2)]
+            return httpx.Response(200, json=items, headers=headers)
+
+        client = make_client(handler)
+        branches = await client.list_branches("TestRepo", per_page=2, all_pages=True)
+
+        assert sorted(pages) == ["1", "2", "3"]
+        assert [b.name for b in branches] == [
+            "branch-1-0",
+            "branch-1-1",
+            "branch-2-0",
+            "branch-2-1",
+            "branch-3-0",
+            "branch-3-1",
+        ]
+        await client.close()
+
+    async def test_single_page_without_link_header(self) -> None:
+        """Test that a response without a Link header is the only page."""
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, json=[{"name": "main", "commit": {"sha": "abc"}}])
+
+        client = make_client(handler)
+        branches = await client.list_branches("TestRepo", all_pages=True)
+
+        assert [b.name for b in branches] == ["main"]
+        assert calls == 1
+        await client.close()
+
+
+class TestGraphQL:
+    """Tests for GraphQL-backed queries."""
+
+    async def test_list_pull_requests_graphql_maps_nodes(self) -> None:
+        """Test that GraphQL nodes are mapped onto the REST-shaped model."""
+        requests: list[httpx.Request] = []
+        node = {
+            "databaseId": 42,
+            "number": 7,
+            "title": "Feature/TEST-1: Search",
+            "body": "",
+            "state": "MERGED",
+            "url": "https://github.com/test-org/TestRepo/pull/7",
+            "isDraft": False,
+            "merged": True,
+            "mergeable": "UNKNOWN",
+            "createdAt": "2025-01-01T00:00:00Z",
+            "updatedAt": "2025-01-02T00:00:00Z",
+            "mergedAt": "2025-01-02T00:00:00Z",
+            "headRefName": "feature/TEST-1-search",
+            "headRefOid": "aaa",
+            "headRepository": {"url": "https://github.com/test-org/TestRepo"},
+            "baseRefName": "main",
+            "baseRefOid": "bbb",
+            "baseRepository": None,
+            "author": {"login": "octocat", "databaseId": 1, "avatarUrl": None, "url": None},
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            payload = {"data": {"repository": {"pullRequests": {"nodes": [node]}}}}
+            return httpx.Response(200, json=payload)
+
+        client = make_client(handler)
+        prs = await client.list_pull_requests_graphql("TestRepo", state="closed")
+
+        assert requests[0].url.path == "/graphql"
+        variables = json.loads(requests[0].content)["variables"]
+        assert variables["owner"] == "test-org"
+        assert variables["states"] == ["CLOSED", "MERGED"]
+        assert len(prs) == 1
+        pr = prs[0]
+        assert pr.id == 42
+        assert pr.state == "closed"
+        assert pr.merged
+        assert pr.mergeable is None
+        assert pr.head.ref == "feature/TEST-1-search"
+        assert pr.base.url is None
+        assert pr.user is not None and pr.user.login == "octocat"
+        assert pr.to_dict()["created_at"] == "2025-01-01T00:00:00+00:00"
+        assert pr.model_dump(mode="json")["merged_at"] == "2025-01-02T00:00:00Z"
+        await client.close()
+
+    async def test_graphql_errors_raise(self) -> None:
+        """Test that a GraphQL error payload raises GitHubClientError."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"data": None, "errors": [{"message": "boom"}]})
+
+        client = make_client(handler)
+        with pytest.raises(GitHubClientError, match="boom"):
+            await client.list_pull_requests_graphql("TestRepo")
+        await client.close()
+
+
+class TestResponseParsing:
+    """Tests for validating REST payloads into models."""
+
+    async def test_list_pull_requests_flattens_nested_payload(self) -> None:
+        """Test that head/base repo URLs and the author are parsed from REST data."""
+        item = {
+            "id": 42,
+            "number": 7,
+            "title": "Feature/TEST-1: Search",
+            "body": None,
+            "state": "open",
+            "html_url": "https://github.com/test-org/TestRepo/pull/7",
+            "head": {
+                "ref": "feature/TEST-1-search",
+                "sha": "aaa",
+                "repo": {"html_url": "https://github.com/test-org/TestRepo"},
+            },
+            "base": {"ref": "main", "sha": "bbb", "repo": None},
+            "user": {"login": "octocat", "id": 1},
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[item])
+
+        client = make_client(handler)
+        (pr,) = await client.list_pull_requests("TestRepo")
+
+        assert pr.head.url == "https://github.com/test-org/TestRepo"
+        assert pr.base.url is None
+        assert pr.user is not None and pr.user.login == "octocat"
+        assert pr.to_dict()["created_at"] == "2025-01-01T00:00:00+00:00"
+        with pytest.raises(ValidationError):
+            pr.title = "changed"
+        await client.close()
+
+    async def test_list_commits_lifts_commit_message(self) -> None:
+        """Test that the commit message is taken from the nested commit object."""
+        item = {
+            "sha": "abc",
+            "html_url": "https://github.com/test-org/TestRepo/commit/abc",
+            "commit": {
+                "message": "feat: add search",
+                "committer": {"date": "2025-01-01T00:00:00Z"},
+            },
+            "author": None,
+        }
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[item])
+
+        client = make_client(handler)
+        (commit,) = await client.list_commits("TestRepo")
+
+        assert commit.message == "feat: add search"
+        assert commit.committed_date is not None
+        await client.close()
+
+    def test_branches_to_dicts_matches_to_dict(self) -> None:
+        """Test that bulk serialization gives the same dicts as to_dict."""
+        branches = [
+            Branch.model_validate({"name": "main", "commit": {"sha": "a", "url": "u"}}),
+            Branch(name="dev", protected=True),
+        ]
+
+        assert branches_to_dicts(branches) == [branch.to_dict() for branch in branches]
+
+    def test_prs_to_dicts_selects_to_dict_fields(self) -> None:
+        """Test that every selectable PR field matches to_dict."""
+        pr = PullRequest.model_validate(
+            {
+                "id": 42,
+                "number": 7,
+                "title": "Feature/TEST-1: Search",
+                "state": "open",
+                "html_url": "https://github.com/test-org/TestRepo/pull/7",
+                "head": {"ref": "feature/TEST-1-search", "sha": "aaa"},
+                "base": {"ref": "main", "sha": "bbb"},
+                "user": {"login": "octocat", "id": 1},
+                "created_at": "2025-01-01T00:00:00Z",
+            }
+        )
+        full = pr.to_dict()
+
+        assert prs_to_dicts([pr]) == [full]
+        assert prs_to_dicts([pr], list(reversed(full))) == [full]
+        assert prs_to_dicts([pr], ["title", "number", "unknown"]) == [
+            {"title": "Feature/TEST-1: Search", "number": 7}
+        ]
+
+
+class TestRetries:
+    """Tests for rate-limit and transient-error retries."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        """Record retry delays instead of sleeping."""
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr("arc_linear_github_mcp.clients.github.asyncio.sleep", fake_sleep)
+        return delays
+
+    async def test_secondary_rate_limit_honours_retry_after(self, no_sleep: list[float]) -> None:
+        """Test that a 403 with Retry-After is retried after that many seconds."""
+        responses = [
+            httpx.Response(403, headers={"Retry-After": "2"}, json={"message": "slow down"}),
+            httpx.Response(200, json=REPO_PAYLOAD),
+        ]
+
+        client = make_client(lambda _request: responses.pop(0))
+        repository = await client.get_repository("TestRepo")
+
+        assert repository.name == "TestRepo"
+        assert no_sleep == [2.0]
+        await client.close()
+
+    async def test_retry_after_http_date_is_honoured(
+        self, no_sleep: list[float], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a Retry-After given as an HTTP-date waits until that time."""
+        monkeypatch.setattr(
+            "arc_linear_github_mcp.clients.github.time.time", lambda: 1_735_689_600.0
+        )
+        responses = [
+            httpx.Response(
+                429,
+                headers={"Retry-After": "Wed, 01 Jan 2025 00:00:05 GMT"},
+                json={"message": "slow down"},
+            ),
+            httpx.Response(200, json=REPO_PAYLOAD),
+        ]
+
+        client = make_client(lambda _request: responses.pop(0))
+        repository = await client.get_repository("TestRepo")
+
+        assert repository.name == "TestRepo"
+        assert no_sleep == [5.0]
+        await client.close()
+
+    async def test_unparseable_retry_after_falls_back_to_backoff(
+        self, no_sleep: list[float]
+    ) -> None:
+        """Test that a malformed Retry-After is retried with backoff, not raised."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "soon"}, json={"message": "slow down"}),
+            httpx.Response(200, json=REPO_PAYLOAD),
+        ]
+
+        client = make_client(lambda _request: responses.pop(0))
+        repository = await client.get_repository("TestRepo")
+
+        assert repository.name == "TestRepo"
+        assert len(no_sleep) == 1
+        await client.close()
+
+    async def test_server_errors_give_up_after_max_retries(self, no_sleep: list[float]) -> None:
+        """Test that persistent 5xx responses are retried, then raised."""
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(502, text="bad gateway")
+
+        client = make_client(handler)
+        with pytest.raises(GitHubClientError) as exc_info:
+            await client.get_repository("TestRepo")
+
+        assert exc_info.value.status_code == 502
+        assert calls == 4
+        assert len(no_sleep) == 3
+        await client.close()
+
+    async def test_post_server_error_is_not_retried(self) -> None:
+        """Test that a 5xx to a non-idempotent POST fails without resending it."""
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(502, text="bad gateway")
+
+        client = make_client(handler)
+        with pytest.raises(GitHubClientError) as exc_info:
+            await client._request("POST", "/repos/test-org/TestRepo/pulls", json={})
+
+        assert exc_info.value.status_code == 502
+        assert calls == 1
+        await client.close()
+
+    async def test_post_dropped_connection_is_not_retried(self) -> None:
+        """Test that a POST whose connection drops is not sent again."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            raise httpx.RemoteProtocolError("connection closed", request=request)
+
+        client = make_client(handler)
+        with pytest.raises(GitHubClientError):
+            await client._request("POST", "/repos/test-org/TestRepo/pulls", json={})
+
+        assert calls == 1
+        await client.close()
+
+    async def test_post_rate_limit_is_retried(self, no_sleep: list[float]) -> None:
+        """Test that a rate-limited POST, which GitHub rejected, is retried."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "1"}, json={"message": "slow down"}),
+            httpx.Response(201, json={"ok": True}),
+        ]
+
+        client = make_client(lambda _request: responses.pop(0))
+        data = await client._request("POST", "/repos/test-org/TestRepo/pulls", json={})
+
+        assert data == {"ok": True}
+        assert no_sleep == [1.0]
+        await client.close()
+
+    async def test_forbidden_without_rate_limit_is_not_retried(self) -> None:
+        """Test that a plain permission 403 fails immediately."""
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(403, json={"message": "Resource not accessible"})
+
+        client = make_client(handler)
+        with pytest.raises(GitHubClientError):
+            await client.get_repository("TestRepo")
+
+        assert calls == 1
+        await client.close()
+
+
+class TestFastUrl:
+    """Tests for the query-string fast path."""
+
+    def test_simple_values_are_joined(self) -> None:
+        """Test that ints, bools and safe strings are appended verbatim."""
+        url = _fast_url("/repos/o/r/pulls", {"state": "open", "per_page": 30, "draft": True})
+
+        assert url == "/repos/o/r/pulls?state=open&per_page=30&draft=true"
+
+    def test_values_needing_encoding_fall_back(self) -> None:
+        """Test that values needing percent-encoding are left to httpx."""
+        assert _fast_url("/repos/o/r/commits", {"sha": "feature/TEST-1-x"}) is None
+
+
+class TestStreaming:
+    """Tests for the page-by-page iterators."""
+
+    async def test_breaking_early_skips_remaining_pages(self) -> None:
+        """Test that stopping iteration does not request later pages."""
+        pages: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = request.url.params["page"]
+            pages.append(page)
+            items = [{"name": f"branch-{page}-{i}", "commit": {"sha": "abc"}} for i in range(100)]
+            return httpx.Response(200, json=items)
+
+        client = make_client(handler)
+        async for branch in client.iter_branches("TestRepo"):
+            if branch.name == "branch-1-50":
+                break
+
+        assert pages == ["1"]
+        await client.close()
+
+    async def test_short_page_ends_iteration(self) -> None:
+        """Test that a page smaller than the page size is the last one."""
+        pages: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = request.url.params["page"]
+            pages.append(page)
+            count = 100 if page == "1" else 3
+            items = [{"name": f"branch-{page}-{i}", "commit": {"sha": "abc"}} for i in range(count)]
+            return httpx.Response(200, json=items)
+
+        client = make_client(handler)
+        branches = [branch async for branch in client.iter_branches("TestRepo")]
+
+        assert len(branches) == 103
+        assert pages == ["1", "2"]
+        await client.close()
+
+
+class TestTransport:
+    """Tests for the pluggable HTTP transport."""
+
+    async def test_injected_transport_receives_default_headers(self) -> None:
+        """Test that requests through a custom transport carry auth and API headers."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=REPO_PAYLOAD)
+
+        client = make_client(handler, github_token="ghp_test")
+        await client.get_repository("TestRepo")
+
+        assert requests[0].headers["Authorization"] == "Bearer ghp_test"
+        assert requests[0].headers["X-GitHub-Api-Version"] == "2022-11-28"
+        await client.close()
+
+
+class TestErrors:
+    """Tests for mapping error responses to exceptions."""
+
+    @pytest.mark.parametrize(
+        ("status", "body", "error_type", "message"),
+        [
+            (404, b"", GitHubNotFoundError, "Not found: /repos/test-org/TestRepo"),
+            (
+                422,
+                b'{"message": "Validation Failed", "errors": ["bad"]}',
+                GitHubValidationError,
+                "Validation Failed: ['bad']",
+            ),
+            (400, b"bad request", GitHubClientError, "GitHub API error: 400 - bad request"),
+        ],
+    )
+    async def test_status_maps_to_error(
+        self,
+        status: int,
+        body: bytes,
+        error_type: type[GitHubClientError],
+        message: str,
+    ) -> None:
+        """Test that each error status raises its exception type and message."""
+        client = make_client(lambda _request: httpx.Response(status, content=body))
+
+        with pytest.raises(error_type) as exc_info:
+            await client.get_repository("TestRepo")
+
+        assert type(exc_info.value) is error_type
+        assert str(exc_info.value) == message
+        assert exc_info.value.status_code == status
+        await client.close()
@@ -0,0 +1,556 @@
+"""Tests for the Linear GraphQL client."""
+
+import asyncio
+import copy
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+import orjson
+import pytest
+from gql import GraphQLRequest
+from gql.transport import AsyncTransport
+from graphql import ExecutionResult, print_ast
+from pydantic import ValidationError
+
+from arc_linear_github_mcp.clients.linear import (
+    LinearClient,
+    close_linear_client,
+    get_linear_client,
+)
+from arc_linear_github_mcp.config.settings import Settings
+from arc_linear_github_mcp.models.linear import (
+    CreateIssueRequest,
+    Issue,
+    Priority,
+    UpdateIssueRequest,
+    issue_list_response,
+    issues_to_dicts,
+)
+
+ISSUE_NODE = {
+    "id": "i1",
+    "identifier": "FAVRES-1",
+    "title": "Search",
+    "description": None,
+    "priority": 2,
+    "priorityLabel": "High",
+    "url": "https://linear.app/arc/issue/FAVRES-1",
+    "createdAt": "2025-01-01T10:00:00.000Z",
+    "updatedAt": "2025-01-02T10:00:00.000Z",
+    "state": {"id": "s1", "name": "Todo", "type": "unstarted", "color": "#fff"},
+    "assignee": None,
+    "labels": {"nodes": [{"id": "l1", "name": "Bug", "color": "#f00"}]},
+    "team": {"id": "t1", "name": "FavRes", "key": "FAVRES"},
+}
+
+
+class FakeTransport(AsyncTransport):
+    """gql transport that answers every request with ``responder``."""
+
+    def __init__(self, responder: Callable[[GraphQLRequest], dict[str, Any]]):
+        self.responder = responder
+        self.requests: list[GraphQLRequest] = []
+        self.connects = 0
+        self.closes = 0
+
+    async def connect(self) -> None:
+        self.connects += 1
+
+    async def close(self) -> None:
+        self.closes += 1
+
+    async def execute(self, request: GraphQLRequest) -> ExecutionResult:
+        self.requests.append(request)
+        return ExecutionResult(data=self.responder(request))
+
+    def subscribe(self, request: GraphQLRequest) -> AsyncGenerator[ExecutionResult, None]:
+        raise NotImplementedError
+
+
+def make_client(
+    responder: Callable[[GraphQLRequest], dict[str, Any]],
+) -> tuple[LinearClient, FakeTransport]:
+    """Create a LinearClient whose queries are answered by ``responder``."""
+    transport = FakeTransport(responder)
+    return LinearClient(Settings(), transport=transport), transport
+
+
+def query_text(request: GraphQLRequest) -> str:
+    """Render the document sent with a request."""
+    return print_ast(request.document)
+
+
+class TestExecute:
+    """Tests for LinearClient._execute."""
+
+    async def test_variables_are_sent_with_document(self) -> None:
+        """Test that variables travel with the precompiled document."""
+        client, transport = make_client(
+            lambda _request: {"issueLabels": {"nodes": [{"id": "l1", "name": "Bug"}]}}
+        )
+
+        labels = await client.list_labels("team-1")
+
+        assert [label.name for label in labels] == ["Bug"]
+        assert transport.requests[0].variable_values == {"teamId": "team-1"}
+        assert "issueLabels" in query_text(transport.requests[0])
+        await client.close()
+
+    async def test_session_is_opened_once(self) -> None:
+        """Test that consecutive queries reuse one connected session."""
+        client, transport = make_client(lambda _request: {"users": {"nodes": []}})
+
+        await client.list_users()
+        await client.list_users()
+        assert transport.connects == 1
+
+        await client.close()
+        assert transport.closes == 1
+
+    async def test_default_transport_decodes_with_orjson(self) -> None:
+        """Test that the default HTTP transport parses responses with orjson."""
+        client = LinearClient(Settings())
+
+        await client._get_session()
+
+        assert client._client is not None
+        assert client._client.transport.json_deserialize is orjson.loads
+        assert client._client.transport.kwargs["headers"] is client.settings.linear_headers
+        await client.close()
+
+    def test_linear_headers_are_shared_and_read_only(self) -> None:
+        """Test that the Linear headers are built once and can't be mutated."""
+        settings = Settings()
+
+        headers = settings.linear_headers
+
+        assert settings.linear_headers is headers
+        assert headers["Authorization"] == settings.linear_api_key
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "other"  # type: ignore[index]
+
+
+class TestMetadataCache:
+    """Tests for caching of workspace metadata."""
+
+    async def test_repeated_list_teams_hits_cache(self) -> None:
+        """Test that teams are fetched once per client until it is closed."""
+        client, transport = make_client(lambda _request: {"teams": {"nodes": []}})
+
+        await asyncio.gather(client.list_teams(), client.list_teams())
+        await client.list_teams()
+        assert len(transport.requests) == 1
+
+        await client.close()
+        await client.list_teams()
+        assert len(transport.requests) == 2
+        await client.close()
+
+    async def test_cached_models_are_immutable(self) -> None:
+        """Test that models shared through the cache can't be modified."""
+        client, _ = make_client(
+            lambda _request: {"issueLabels": {"nodes": [{"id": "l1", "name": "Bug", "extra": 1}]}}
+        )
+
+        (label,) = await client.list_labels("t1")
+
+        with pytest.raises(ValidationError):
+            label.name = "Feature"
+        await client.close()
+
+    async def test_team_lookups_are_cached_until_invalidated(self) -> None:
+        """Test that team-key lookups are reused until the cache is invalidated."""
+        client, transport = make_client(
+            lambda _request: {"teams": {"nodes": [{"id": "t1", "name": "FavRes", "key": "FAVRES"}]}}
+        )
+
+        await client.get_team_by_key("FAVRES")
+        await client.get_team_by_key("FAVRES")
+        assert len(transport.requests) == 1
+
+        client.invalidate_metadata_cache()
+        await client.get_team_by_key("FAVRES")
+        assert len(transport.requests) == 2
+        await client.close()
+
+    async def test_user_lookup_filters_server_side(self) -> None:
+        """Test that users are looked up by a name-or-email filter, once per value."""
+        client, transport = make_client(
+            lambda _request: {
+                "users": {"nodes": [{"id": "u1", "name": "Ada", "email": "ada@arc.dev"}]}
+            }
+        )
+
+        first = await client.get_user_by_name_or_email("ADA")
+        again = await client.get_user_by_name_or_email("ADA")
+
+        assert first is again and first is not None and first.id == "u1"
+        assert [r.variable_values for r in transport.requests] == [{"value": "ADA"}]
+        assert "eqIgnoreCase" in query_text(transport.requests[0])
+        await client.close()
+
+    async def test_unknown_user_is_none(self) -> None:
+        """Test that an empty result means no such user."""
+        client, _ = make_client(lambda _request: {"users": {"nodes": []}})
+
+        assert await client.get_user_by_name_or_email("linus") is None
+        await client.close()
+
+    async def test_unknown_user_is_looked_up_again(self) -> None:
+        """Test that a newly invited user is found on the next lookup, not cached as missing."""
+        responses = [[], [{"id": "u2", "name": "Linus"}]]
+        client, transport = make_client(lambda _request: {"users": {"nodes": responses.pop(0)}})
+
+        assert await client.get_user_by_name_or_email("linus") is None
+        user = await client.get_user_by_name_or_email("linus")
+
+        assert user is not None and user.id == "u2"
+        assert len(transport.requests) == 2
+        await client.close()
+
+    async def test_user_list_is_immutable(self) -> None:
+        """Test that the cached user directory is shared as a tuple."""
+        client, _ = make_client(
+            lambda _request: {"users": {"nodes": [{"id": "u1", "name": "Ada"}]}}
+        )
+
+        assert isinstance(await client.list_users(), tuple)
+        await client.close()
+
+    async def test_cache_is_keyed_by_arguments(self) -> None:
+        """Test that labels for different teams are cached separately."""
+        client, transport = make_client(lambda _request: {"issueLabels": {"nodes": []}})
+
+        await client.list_labels("t1")
+        await client.list_labels("t2")
+        await client.list_labels("t1")
+
+        assert [r.variable_values for r in transport.requests] == [
+            {"teamId": "t1"},
+            {"teamId": "t2"},
+        ]
+        await client.close()
+
+
+class TestIssueCache:
+    """Tests for reusing issues looked up by identifier."""
+
+    async def test_repeated_search_is_served_from_cache(self) -> None:
+        """Test that a second lookup of one identifier sends no query."""
+        client, transport = make_client(lambda _request: {"issues": {"nodes": [ISSUE_NODE]}})
+
+        first = await client.search_issue_by_identifier("FAVRES-1")
+        second = await client.search_issue_by_identifier("FAVRES-1")
+
+        assert first is second
+        assert first is not None and first.team is not None and first.team.id == "t1"
+        assert len(transport.requests) == 1
+        await client.close()
+
+    async def test_misses_are_not_cached(self) -> None:
+        """Test that an identifier that wasn't found is queried again."""
+        client, transport = make_client(lambda _request: {"issues": {"nodes": []}})
+
+        assert await client.search_issue_by_identifier("FAVRES-9") is None
+        assert await client.search_issue_by_identifier("FAVRES-9") is None
+        assert len(transport.requests) == 2
+        await client.close()
+
+    @pytest.mark.parametrize("identifier", ["FAVRES", "FAVRES-abc", "FAVRES-1-2", "favres-1"])
+    async def test_malformed_identifier_sends_no_query(self, identifier: str) -> None:
+        """Test that identifiers not shaped like TEAM-123 are rejected locally."""
+        client, transport = make_client(lambda _request: {"issues": {"nodes": [ISSUE_NODE]}})
+
+        assert await client.search_issue_by_identifier(identifier) is None
+        assert transport.requests == []
+        await client.close()
+
+    async def test_identifier_is_sent_as_team_and_number(self) -> None:
+        """Test that the identifier is split into key and numeric filters."""
+        client, transport = make_client(lambda _request: {"issues": {"nodes": [ISSUE_NODE]}})
+
+        await client.search_issue_by_identifier("FAVRES-12")
+
+        assert transport.requests[0].variable_values == {
+            "filter": {"team": {"key": {"eq": "FAVRES"}}, "number": {"eq": 12}}
+        }
+        await client.close()
+
+    async def test_update_replaces_cached_issue(self) -> None:
+        """Test that an updated issue is what later lookups return."""
+        updated = {**ISSUE_NODE, "title": "Renamed"}
+        client, transport = make_client(
+            lambda request: (
+                {"issueUpdate": {"success": True, "issue": updated}}
+                if "issueUpdate" in query_text(request)
+                else {"issues": {"nodes": [ISSUE_NODE]}}
+            )
+        )
+
+        issue = await client.search_issue_by_identifier("FAVRES-1")
+        assert issue is not None
+        await client.update_issue(issue.id, UpdateIssueRequest(title="Renamed"))
+        cached = await client.search_issue_by_identifier("FAVRES-1")
+
+        assert cached is not None and cached.title == "Renamed"
+        assert len(transport.requests) == 2
+        await client.close()
+
+
+class TestLookups:
+    """Tests for single-entity lookups filtered by Linear."""
+
+    async def test_get_team_by_key_filters_server_side(self) -> None:
+        """Test that the team key is sent as a filter variable."""
+        client, transport = make_client(
+            lambda _request: {"teams": {"nodes": [{"id": "t1", "name": "FavRes", "key": "FAVRES"}]}}
+        )
+
+        team = await client.get_team_by_key("favres")
+
+        assert team is not None and team.id == "t1"
+        assert transport.requests[0].variable_values == {"key": "favres"}
+        assert "eqIgnoreCase" in query_text(transport.requests[0])
+        await client.close()
+
+    async def test_get_state_by_name_returns_none_without_match(self) -> None:
+        """Test that an empty result means no such state."""
+        client, transport = make_client(lambda _request: {"workflowStates": {"nodes": []}})
+
+        state = await client.get_state_by_name("t1", "Nope")
+
+        assert state is None
+        assert transport.requests[0].variable_values == {"teamId": "t1", "name": "Nope"}
+        await client.close()
+
+    async def test_get_team_context_reads_aliased_roots(self) -> None:
+        """Test that team, states and labels come back from one request."""
+        client, transport = make_client(
+            lambda _request: {
+                "team": {"nodes": [{"id": "t1", "name": "FavRes", "key": "FAVRES"}]},
+                "states": {"nodes": [{"id": "s1", "name": "Todo", "type": "unstarted"}]},
+                "labels": {"nodes": [{"id": "l1", "name": "Bug"}]},
+            }
+        )
+
+        context = await client.get_team_context("FAVRES")
+
+        assert context is not None
+        assert context.team.key == "FAVRES"
+        assert [s.name for s in context.states] == ["Todo"]
+        assert [label.name for label in context.labels] == ["Bug"]
+        assert len(transport.requests) == 1
+        await client.close()
+
+    async def test_cached_lists_are_immutable(self) -> None:
+        """Test that cached metadata lists can't be changed by one caller for the rest."""
+        client, _ = make_client(
+            lambda _request: {
+                "team": {"nodes": [{"id": "t1", "name": "FavRes", "key": "FAVRES"}]},
+                "states": {"nodes": [{"id": "s1", "name": "Todo", "type": "unstarted"}]},
+                "labels": {"nodes": [{"id": "l1", "name": "Bug"}]},
+                "issueLabels": {"nodes": [{"id": "l1", "name": "Bug"}]},
+                "workflowStates": {"nodes": [{"id": "s1", "name": "Todo", "type": "unstarted"}]},
+            }
+        )
+
+        context = await client.get_team_context("FAVRES")
+
+        assert context is not None
+        assert isinstance(context.states, tuple)
+        assert isinstance(context.labels, tuple)
+        assert isinstance(await client.list_labels("t1"), tuple)
+        assert isinstance(await client.list_workflow_states("t1"), tuple)
+        await client.close()
+
+    async def test_get_team_context_unknown_team(self) -> None:
+        """Test that a missing team yields None."""
+        client, _ = make_client(
+            lambda _request: {
+                "team": {"nodes": []},
+                "states": {"nodes": []},
+                "labels": {"nodes": []},
+            }
+        )
+
+        assert await client.get_team_context("NOPE") is None
+        await client.close()
+
+
+class TestIssues:
+    """Tests for building issues from query results."""
+
+    async def test_list_issues_builds_nested_models(self) -> None:
+        """Test that state, labels and timestamps are converted."""
+        node = {key: value for key, value in ISSUE_NODE.items() if key != "team"}
+        client, transport = make_client(lambda _request: {"issues": {"nodes": [node]}})
+
+        (issue,) = await client.list_issues("FAVRES")
+
+        assert "team" not in query_text(transport.requests[0])
+        assert issue.state is not None and issue.state.name == "Todo"
+        assert issue.team is None
+        assert issue.to_dict() == {
+            "id": "i1",
+            "identifier": "FAVRES-1",
+            "title": "Search",
+            "description": None,
+            "priority": 2,
+            "priority_label": "High",
+            "state": "Todo",
+            "assignee": None,
+            "labels": ["Bug"],
+            "url": "https://linear.app/arc/issue/FAVRES-1",
+            "created_at": "2025-01-01T10:00:00+00:00",
+            "updated_at": "2025-01-02T10:00:00+00:00",
+        }
+        await client.close()
+
+    async def test_issues_to_dicts_matches_to_dict(self) -> None:
+        """Test that bulk serialization gives the same dicts as to_dict."""
+        client, _ = make_client(lambda _request: {"issues": {"nodes": [ISSUE_NODE] * 3}})
+
+        issues = await client.list_issues("FAVRES")
+
+        assert issues_to_dicts(issues) == [issue.to_dict() for issue in issues]
+        await client.close()
+
+    async def test_issues_to_dicts_restricts_fields(self) -> None:
+        """Test that only the requested fields are serialized."""
+        client, _ = make_client(lambda _request: {"issues": {"nodes": [ISSUE_NODE]}})
+
+        issues = await client.list_issues("FAVRES")
+
+        assert issues_to_dicts(issues, ["identifier", "state", "team"]) == [
+            {"identifier": "FAVRES-1", "state": "Todo"}
+        ]
+        await client.close()
+
+    async def test_issue_list_response_matches_issues_to_dicts(self) -> None:
+        """Test that the one-pass response matches one built around issues_to_dicts."""
+        client, _ = make_client(lambda _request: {"issues": {"nodes": [ISSUE_NODE] * 2}})
+
+        issues = await client.list_issues("FAVRES")
+
+        for fields in (None, ["identifier", "labels"]):
+            expected = {"success": True, "count": 2, "issues": issues_to_dicts(issues, fields)}
+            assert issue_list_response(issues, fields) == expected
+        await client.close()
+
+    async def test_built_issue_has_every_field(self) -> None:
+        """Test that the unvalidated constructor leaves a fully usable model."""
+        client, _ = make_client(lambda _request: {"issues": {"nodes": [ISSUE_NODE]}})
+
+        (issue,) = await client.list_issues("FAVRES")
+
+        assert tuple(issue.__dict__) == tuple(Issue.model_fields)
+        assert issue.model_fields_set == set(Issue.model_fields)
+        assert issue.creator is None and issue.project is None
+        assert issue.model_copy(update={"title": "Other"}).title == "Other"
+        assert issue.model_dump()["identifier"] == "FAVRES-1"
+        await client.close()
+
+    async def test_cached_issue_is_immutable(self) -> None:
+        """Test that an issue shared through the issue cache can't be modified."""
+        client, _ = make_client(lambda _request: {"issues": {"nodes": [ISSUE_NODE]}})
+
+        (issue,) = await client.list_issues("FAVRES")
+
+        with pytest.raises(ValidationError):
+            issue.title = "Other"
+        await client.close()
+
+    async def test_response_node_is_left_untouched(self) -> None:
+        """Test that building an issue doesn't re-key the response node."""
+        node = copy.deepcopy(ISSUE_NODE)
+        client, _ = make_client(lambda _request: {"issues": {"nodes": [node]}})
+
+        await client.list_issues("FAVRES")
+
+        assert node == ISSUE_NODE
+        await client.close()
+
+    async def test_list_issues_sends_filter_as_variable(self) -> None:
+        """Test that team and state filters travel as variables, not query text."""
+        client, transport = make_client(lambda _request: {"issues": {"nodes": []}})
+
+        await client.list_issues("FAVRES", state='In "Review"', first=10)
+
+        assert transport.requests[0].variable_values == {
+            "first": 10,
+            "filter": {"team": {"key": {"eq": "FAVRES"}}, "state": {"name": {"eq": 'In "Review"'}}},
+        }
+        assert "FAVRES" not in query_text(transport.requests[0])
+        await client.close()
+
+    async def test_list_issues_follows_cursor_until_limit(self) -> None:
+        """Test that pages are requested with the previous end cursor."""
+        pages = iter(
+            [
+                {"nodes": [ISSUE_NODE] * 250, "pageInfo": {"hasNextPage": True, "endCursor": "c1"}},
+                {"nodes": [ISSUE_NODE] * 50, "pageInfo": {"hasNextPage": True, "endCursor": "c2"}},
+            ]
+        )
+        client, transport = make_client(lambda _request: {"issues": next(pages)})
+
+        issues = await client.list_issues("FAVRES", first=300)
+
+        assert len(issues) == 300
+        sent = [request.variable_values for request in transport.requests]
+        assert [(v["first"], v.get("after")) for v in sent] == [(250, None), (50, "c1")]
+        await client.close()
+
+    async def test_list_issues_stops_on_last_page(self) -> None:
+        """Test that no further page is requested when Linear has none."""
+        client, transport = make_client(
+            lambda _request: {
+                "issues": {
+                    "nodes": [ISSUE_NODE],
+                    "pageInfo": {"hasNextPage": False, "endCursor": "c1"},
+                }
+            }
+        )
+
+        issues = await client.list_issues("FAVRES", first=300)
+
+        assert len(issues) == 1
+        assert len(transport.requests) == 1
+        await client.close()
+
+    @pytest.mark.parametrize("priority", [-1, 5])
+    def test_request_rejects_unknown_priority(self, priority: int) -> None:
+        """Test that priorities outside 0-4 are rejected."""
+        with pytest.raises(ValidationError):
+            CreateIssueRequest(title="Search", team_id="t1", priority=priority)
+
+    def test_request_stores_priority_as_plain_int(self) -> None:
+        """Test that a Priority member is stored as its int value."""
+        request = UpdateIssueRequest(priority=Priority.HIGH)
+
+        assert request.priority == 2 and type(request.priority) is int
+
+    async def test_create_issue_without_labels_in_selection(self) -> None:
+        """Test that a node without a labels field gets an empty label list."""
+        node = {key: value for key, value in ISSUE_NODE.items() if key != "labels"}
+        client, _ = make_client(lambda _request: {"issueCreate": {"success": True, "issue": node}})
+
+        issue = await client.create_issue(CreateIssueRequest(title="Search", team_id="t1"))
+
+        assert issue.identifier == "FAVRES-1"
+        assert issue.labels == []
+        await client.close()
+
+
+class TestSharedClient:
+    """Tests for the process-wide Linear client."""
+
+    async def test_shared_client_is_reused_until_closed(self) -> None:
+        """Test that tools get one client per process, replaced after closing."""
+        settings = Settings()
+        client = get_linear_client(settings)
+        assert get_linear_client(settings) is client
+
+        await close_linear_client()
+
+        assert get_linear_client(settings) is not client
+        await close_linear_client()
@@ -0,0 +1,48 @@
+"""Tests for server startup."""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+from arc_linear_github_mcp.server import lifespan, mcp
+from arc_linear_github_mcp.tools import workflow
+
+
+def test_import_needs_no_credentials() -> None:
+    """Test that the server module imports without Linear or GitHub settings."""
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in {"LINEAR_API_KEY", "GITHUB_TOKEN"}
+    }
+
+    result = subprocess.run(
+        [sys.executable, "-c", "import arc_linear_github_mcp.server"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+async def test_tools_are_registered_once_on_startup() -> None:
+    """Test that every entering of the lifespan shares one registration."""
+    async with lifespan(mcp):
+        tools = await mcp.list_tools()
+    async with lifespan(mcp):
+        assert len(await mcp.list_tools()) == len(tools)
+
+    names = {tool.name for tool in tools}
+    assert {"linear_list_issues", "github_list_prs", "workflow_start_feature"} <= names
+
+
+async def test_shutdown_cancels_outstanding_jobs() -> None:
+    """Test that leaving the lifespan stops background jobs before closing clients."""
+    async with lifespan(mcp):
+        job_id = workflow._start_job(asyncio.Event().wait())
+        task = workflow._JOBS[job_id]
+
+    assert task.cancelled()
+    assert job_id not in workflow._JOBS
@@ -0,0 +1,119 @@
+"""Tests for the background workflow job registry."""
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+
+from arc_linear_github_mcp.tools import workflow
+from arc_linear_github_mcp.tools.workflow import (
+    _start_job,
+    cancel_jobs,
+    workflow_cancel_job,
+    workflow_poll_job,
+)
+
+
+async def _finish(value: int) -> dict:
+    return {"success": True, "value": value}
+
+
+async def _settle() -> None:
+    """Let started jobs finish and their done callbacks run."""
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+@pytest.fixture(autouse=True)
+def clear_jobs() -> Iterator[None]:
+    """Give every test an empty job registry."""
+    workflow._JOBS.clear()
+    workflow._JOB_FINISHED_AT.clear()
+    yield
+    for task in workflow._JOBS.values():
+        task.cancel()
+    workflow._JOBS.clear()
+    workflow._JOB_FINISHED_AT.clear()
+
+
+class TestJobs:
+    """Tests for starting, polling, cancelling and evicting jobs."""
+
+    async def test_finished_job_is_read_once(self) -> None:
+        """Test that polling a finished job returns its result and releases it."""
+        job_id = _start_job(_finish(1))
+        await _settle()
+
+        first = await workflow_poll_job(job_id)
+        second = await workflow_poll_job(job_id)
+
+        assert first["status"] == "done"
+        assert first["result"] == {"success": True, "value": 1}
+        assert not second["success"]
+        assert not workflow._JOB_FINISHED_AT
+
+    async def test_expired_jobs_are_evicted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that finished jobs nobody polls are dropped after the TTL."""
+        job_id = _start_job(_finish(1))
+        await _settle()
+        assert job_id in workflow._JOBS
+
+        monkeypatch.setattr(workflow, "_JOB_TTL", -1.0)
+        result = await workflow_poll_job(job_id)
+
+        assert not result["success"]
+        assert not workflow._JOBS
+        assert not workflow._JOB_FINISHED_AT
+
+    async def test_oldest_finished_jobs_are_evicted_over_the_cap(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only the newest finished jobs are kept."""
+        monkeypatch.setattr(workflow, "_MAX_FINISHED_JOBS", 2)
+        job_ids = [_start_job(_finish(i)) for i in range(3)]
+        await _settle()
+
+        assert list(workflow._JOBS) == job_ids[1:]
+
+    async def test_running_jobs_are_not_evicted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that eviction only ever drops finished jobs."""
+        monkeypatch.setattr(workflow, "_MAX_FINISHED_JOBS", 0)
+        job_id = _start_job(asyncio.Event().wait())
+        await asyncio.sleep(0)
+
+        result = await workflow_poll_job(job_id)
+
+        assert result["status"] == "running"
+
+    async def test_cancel_stops_a_running_job(self) -> None:
+        """Test that cancelling a running job stops its task and forgets it."""
+        job_id = _start_job(asyncio.Event().wait())
+        task = workflow._JOBS[job_id]
+        await asyncio.sleep(0)
+
+        result = await workflow_cancel_job(job_id)
+        await asyncio.sleep(0)
+
+        assert result["was_running"]
+        assert task.cancelled()
+        assert not workflow._JOBS
+        assert not workflow._JOB_FINISHED_AT
+
+    async def test_cancel_unknown_job(self) -> None:
+        """Test that cancelling an unknown job ID reports an error."""
+        result = await workflow_cancel_job("missing")
+
+        assert not result["success"]
+
+    async def test_cancel_jobs_stops_every_job(self) -> None:
+        """Test that shutdown cancels running jobs and empties the registry."""
+        job_id = _start_job(asyncio.Event().wait())
+        task = workflow._JOBS[job_id]
+        _start_job(_finish(1))
+        await _settle()
+
+        await cancel_jobs()
+
+        assert task.cancelled()
+        assert not workflow._JOBS
+        assert not workflow._JOB_FINISHED_AT
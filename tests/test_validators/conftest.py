@@ -0,0 +1,15 @@
+"""Fixtures for the validator tests."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from arc_linear_github_mcp.validators import validate_branch_name, validate_commit_message
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_validators() -> Iterator[None]:
+    """Run each validator once so one-time setup isn't charged to the first test."""
+    validate_branch_name("feature/AB-1-x")
+    validate_commit_message("feat: x")
+    yield
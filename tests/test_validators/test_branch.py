@@ -2,6 +2,7 @@
 
 import pytest
 
+from arc_linear_github_mcp.config.standards import BranchType
 from arc_linear_github_mcp.validators.branch import (
     generate_branch_name,
     parse_branch_name,
@@ -105,6 +106,8 @@ class TestValidateBranchName:
         result = validate_branch_name("feature/FAVRES-123-RestaurantSearch")
 
         assert not result.is_valid
+        assert "format is invalid" in result.error
+        assert result.suggestions == ("feature/favres-123-restaurantsearch",)
 
     def test_suggestions_provided(self) -> None:
         """Test that suggestions are provided for invalid names."""
@@ -114,6 +117,21 @@ class TestValidateBranchName:
         assert result.suggestions is not None
         assert len(result.suggestions) > 0
 
+    def test_suggestion_expands_abbreviated_type(self) -> None:
+        """Test that an abbreviated type prefix is suggested in full."""
+        result = validate_branch_name("feat/Add_Search")
+
+        assert not result.is_valid
+        assert result.suggestions[0] == "feature/add-search"
+
+    def test_repeated_names_share_an_immutable_result(self) -> None:
+        """Test that results are cached per name and can't be modified."""
+        result = validate_branch_name("feat/Add_Search")
+
+        assert validate_branch_name("feat/Add_Search") is result
+        with pytest.raises(AttributeError):
+            result.is_valid = True  # type: ignore[misc]
+
 
 class TestParseBranchName:
     """Tests for parse_branch_name function."""
@@ -202,6 +220,15 @@ class TestGenerateBranchName:
                 issue_id="invalid-id",
             )
 
+    def test_generate_reports_branch_type_before_issue_id(self) -> None:
+        """Test that an invalid type is reported first when the issue ID is also invalid."""
+        with pytest.raises(ValueError, match="Invalid branch type"):
+            generate_branch_name(
+                branch_type="invalid",
+                description="test",
+                issue_id="invalid-id",
+            )
+
     def test_generate_handles_special_characters(self) -> None:
         """Test that special characters are handled."""
         result = generate_branch_name(
@@ -219,3 +246,12 @@ class TestGenerateBranchName:
         )
 
         assert result == "feature/fix-multiple-hyphens"
+
+    def test_generate_accepts_branch_type_member(self) -> None:
+        """Test that a BranchType member renders as its plain value."""
+        result = generate_branch_name(
+            branch_type=BranchType.BUGFIX,
+            description="fix crash",
+        )
+
+        assert result == "bugfix/fix-crash"
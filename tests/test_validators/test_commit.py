@@ -8,6 +8,20 @@ from arc_linear_github_mcp.validators.commit import (
     validate_commit_message,
 )
 
+COMMIT_TYPES = (
+    "feat",
+    "fix",
+    "docs",
+    "style",
+    "refactor",
+    "perf",
+    "test",
+    "chore",
+    "build",
+    "ci",
+    "revert",
+)
+
 
 class TestValidateCommitMessage:
     """Tests for validate_commit_message function."""
@@ -48,17 +62,13 @@ class TestValidateCommitMessage:
         assert result.scope is None
         assert result.subject == "simplify auth flow"
 
-    def test_valid_all_commit_types(self) -> None:
+    @pytest.mark.parametrize("commit_type", COMMIT_TYPES)
+    def test_valid_all_commit_types(self, commit_type: str) -> None:
         """Test all valid commit types."""
-        commit_types = [
-            "feat", "fix", "docs", "style", "refactor",
-            "perf", "test", "chore", "build", "ci", "revert",
-        ]
+        result = validate_commit_message(f"{commit_type}: test message")
 
-        for commit_type in commit_types:
-            result = validate_commit_message(f"{commit_type}: test message")
-            assert result.is_valid, f"Type '{commit_type}' should be valid"
-            assert result.commit_type == commit_type
+        assert result.is_valid, f"Type '{commit_type}' should be valid"
+        assert result.commit_type == commit_type
 
     def test_invalid_empty_message(self) -> None:
         """Test empty commit message."""
@@ -97,6 +107,14 @@ class TestValidateCommitMessage:
         assert "period" in result.error.lower()
         assert result.suggestions is not None
 
+    def test_invalid_uppercase_subject_with_period(self) -> None:
+        """Test that both subject problems are reported and fixed at once."""
+        result = validate_commit_message("feat(ui): Add dark mode.")
+
+        assert not result.is_valid
+        assert "lowercase" in result.error and "period" in result.error
+        assert result.suggestions == ("feat(ui): add dark mode",)
+
     def test_invalid_too_long(self) -> None:
         """Test commit message that's too long."""
         long_subject = "a" * 100
@@ -105,6 +123,13 @@ class TestValidateCommitMessage:
         assert not result.is_valid
         assert "too long" in result.error.lower()
 
+    def test_unicode_whitespace_after_colon(self) -> None:
+        """Test that a non-breaking space after the colon separates the subject."""
+        result = validate_commit_message("feat:\u00a0add search")
+
+        assert result.is_valid
+        assert result.subject == "add search"
+
     def test_multiline_uses_first_line(self) -> None:
         """Test that only first line is validated."""
         result = validate_commit_message("feat: add feature\n\nThis is a longer description")
@@ -120,6 +145,16 @@ class TestValidateCommitMessage:
         assert result.suggestions is not None
         assert len(result.suggestions) > 0
 
+    def test_suggested_type_follows_keyword_priority(self) -> None:
+        """Test that feature keywords win over later keyword groups."""
+        assert validate_commit_message("Updated the README").suggestions == (
+            "docs: updated the README",
+        )
+        assert validate_commit_message("Bugfix for new search").suggestions == (
+            "feat: bugfix for new search",
+        )
+        assert validate_commit_message("Bump version").suggestions == ("chore: bump version",)
+
 
 class TestParseCommitMessage:
     """Tests for parse_commit_message function."""
@@ -150,6 +185,17 @@ class TestParseCommitMessage:
         assert scope is None
         assert subject is None
 
+    def test_parse_matches_validation_components(self) -> None:
+        """Test that parsing agrees with validation, including on style errors."""
+        for message in ("feat(ui): Add dark mode", "fix: crash.", "x" * 101, "", "chore: bump"):
+            result = validate_commit_message(message)
+
+            assert parse_commit_message(message) == (
+                result.commit_type,
+                result.scope,
+                result.subject,
+            )
+
 
 class TestGenerateCommitMessage:
     """Tests for generate_commit_message function."""
@@ -199,16 +245,12 @@ class TestGenerateCommitMessage:
                 subject="",
             )
 
-    def test_generate_all_types(self) -> None:
+    @pytest.mark.parametrize("commit_type", COMMIT_TYPES)
+    def test_generate_all_types(self, commit_type: str) -> None:
         """Test generating with all valid types."""
-        commit_types = [
-            "feat", "fix", "docs", "style", "refactor",
-            "perf", "test", "chore", "build", "ci", "revert",
-        ]
-
-        for commit_type in commit_types:
-            result = generate_commit_message(
-                commit_type=commit_type,
-                subject="test message",
-            )
-            assert result.startswith(f"{commit_type}:")
+        result = generate_commit_message(
+            commit_type=commit_type,
+            subject="test message",
+        )
+
+        assert result.startswith(f"{commit_type}:")